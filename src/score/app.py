@@ -96,7 +96,7 @@ class GameState:
         self.seconds = 20 * 60
         self.running = False
         self.last_update = int(time.time())
-        self.clients: list[WebSocket] = []
+        self.clients: set[WebSocket] = set()
         self.pusher_status = "unknown"  # "healthy", "pending", "dead", "unknown"
         self.assignment_status = "unknown"  # "healthy", "pending", "unknown"
         self.schedule_status = "unknown"  # "healthy", "pending", "dead", "unknown"
@@ -318,14 +318,15 @@ async def broadcast_state():
     data = json.dumps({"state": state_dict})
     dead = []
 
-    for ws in state.clients:
+    # Iterate over a snapshot: clients may disconnect while we await sends
+    for ws in list(state.clients):
         try:
             await ws.send_text(data)
         except:
             dead.append(ws)
 
     for ws in dead:
-        state.clients.remove(ws)
+        state.clients.discard(ws)
 
     if dead:
         logger.debug(f"Removed {len(dead)} disconnected client(s)")
@@ -788,7 +789,7 @@ async def debug_events():
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await ws.accept()
-    state.clients.append(ws)
+    state.clients.add(ws)
     logger.info(f"WebSocket client connected (total: {len(state.clients)})")
 
     await ws.send_text(json.dumps({"state": state.to_dict()}))
@@ -797,8 +798,7 @@ async def websocket_endpoint(ws: WebSocket):
         while True:
             await asyncio.sleep(3600)
     finally:
-        if ws in state.clients:
-            state.clients.remove(ws)
+        state.clients.discard(ws)
         logger.info(f"WebSocket client disconnected (total: {len(state.clients)})")
 
 def main():
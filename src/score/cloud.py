@@ -8,21 +8,34 @@ This module simulates the cloud backend that mini PCs connect to for:
 """
 
 import asyncio
-import json
+import hashlib
 import logging
+import os
+import re
 import sqlite3
+import threading
 import time
-from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from typing import Optional
+from collections import deque
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import pairwise
+from operator import attrgetter
+from typing import Annotated, Any, Optional
 
 from pathlib import Path
-from fastapi import FastAPI, HTTPException, Path as FastAPIPath, Query, WebSocket
+from fastapi import FastAPI, HTTPException, Path as FastAPIPath, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup, escape
+from pydantic import TypeAdapter
+import orjson
 import uvicorn
 
 from score.models import (
-    Game,
     ScheduleResponse,
     PostEventsRequest,
     PostEventsResponse,
@@ -42,16 +55,169 @@ logger = logging.getLogger("score.cloud")
 
 
 # ---------- Database Configuration ----------
+from score import db_pool
 from score.config import CloudConfig
+from score.db_pool import PooledConnection, close_connections
+from score.schema import init_schema
 
 CLOUD_DB_PATH = CloudConfig.DB_PATH
 
 
-def get_db():
-    """Get database connection."""
-    conn = sqlite3.connect(CLOUD_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+# ---------- Connection pooling ----------
+# Connections come from score.db_pool; these wrappers bind them to
+# CLOUD_DB_PATH so tests can repoint the app at a temp database.
+def get_db() -> PooledConnection:
+    """Get a pooled connection; close() (or a with-block) returns it to the pool."""
+    return db_pool.get_db(CLOUD_DB_PATH)
+
+
+def get_read_db():
+    """Borrow a read-only connection from the pool."""
+    return db_pool.get_read_db(CLOUD_DB_PATH)
+
+
+def get_write_db():
+    """Borrow the shared write connection inside a BEGIN IMMEDIATE transaction."""
+    return db_pool.get_write_db(CLOUD_DB_PATH)
+
+
+@contextmanager
+def get_seed_db():
+    """
+    Pooled connection holding the write lock for one whole seed or clear run.
+
+    Everything the block writes lands in a single commit on exit, or is
+    rolled back if it raises. Seeding only some categories can add rows
+    whose parents were never seeded, and clearing leaves events and devices
+    pointing at deleted games and rinks, so these runs stay off the write
+    connection and its foreign key enforcement.
+    """
+    with get_db() as db:
+        db.execute("BEGIN IMMEDIATE")
+        yield db
+
+
+# ---------- Shared parameter types ----------
+# Declared once so every endpoint shares the same validators; malformed IDs
+# and dates are rejected with 422 before any database work.
+ID_PATTERN = r"^[A-Za-z0-9_.-]+$"
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+RinkIdPath = Annotated[str, FastAPIPath(description="Rink ID", pattern=ID_PATTERN)]
+GameIdPath = Annotated[str, FastAPIPath(description="Game ID", pattern=ID_PATTERN)]
+ScheduleDateQuery = Annotated[
+    Optional[str],
+    Query(description="Date in YYYY-MM-DD format (defaults to today)", pattern=DATE_PATTERN)
+]
+FormatQuery = Annotated[Optional[str], Query(description="Response format: 'json' or 'html'")]
+
+
+# ---------- Hot-path SQL ----------
+# Shared statement text for the device-facing endpoints. Reusing the exact
+# same string lets each connection's statement cache (cached_statements=256)
+# skip re-preparing it on every request.
+# Every join is on a primary key, so each game yields at most one row and
+# no DISTINCT pass is needed
+SCHEDULE_GAMES_SQL = """
+    SELECT g.game_id, g.home_team, g.away_team, g.home_abbrev, g.away_abbrev,
+           g.start_time, g.period_length_min,
+           l.name as league_name,
+           s.name as season_name,
+           d.name as division_name
+    FROM games g
+    LEFT JOIN team_registrations tr ON g.home_registration_id = tr.registration_id
+    LEFT JOIN leagues l ON tr.league_id = l.league_id
+    LEFT JOIN seasons s ON tr.season_id = s.season_id
+    LEFT JOIN divisions d ON tr.division_id = d.division_id
+    WHERE g.rink_id = ? AND g.start_time >= ? AND g.start_time < ?
+    ORDER BY g.start_time
+"""
+
+# Device config polls: register an unknown device, returning a row only if
+# it was inserted; otherwise touch last_seen_at and return the assignment.
+# Keeping these separate tells a new device from a repeat poll exactly,
+# even within the same second.
+DEVICE_REGISTER_SQL = """
+    INSERT INTO devices (device_id, is_assigned, first_seen_at, last_seen_at)
+    VALUES (?, 0, ?, ?)
+    ON CONFLICT(device_id) DO NOTHING
+    RETURNING device_id
+"""
+DEVICE_TOUCH_SQL = """
+    UPDATE devices SET last_seen_at = ?
+    WHERE device_id = ?
+    RETURNING rink_id, sheet_name, device_name, is_assigned
+"""
+
+# Admin device edits: NULL parameters leave the column unchanged, so every
+# combination of fields shares one compiled statement. Providing both
+# rink_id and sheet_name marks the device as assigned. Returns no row for
+# an unknown device.
+DEVICE_UPDATE_SQL = """
+    UPDATE devices
+    SET rink_id = COALESCE(:rink_id, rink_id),
+        sheet_name = COALESCE(:sheet_name, sheet_name),
+        device_name = COALESCE(:device_name, device_name),
+        notes = COALESCE(:notes, notes),
+        is_assigned = CASE
+            WHEN :rink_id IS NOT NULL AND :sheet_name IS NOT NULL THEN 1
+            ELSE is_assigned
+        END
+    WHERE device_id = :device_id
+    RETURNING device_id, rink_id, sheet_name, device_name, is_assigned,
+              first_seen_at, last_seen_at, notes
+"""
+
+# Rink validation shared by the device create and update handlers
+RINK_EXISTS_SQL = "SELECT 1 FROM rinks WHERE rink_id = ?"
+
+# Shared by the rule set JSON API and the rule sets admin page
+RULE_SETS_SQL = "SELECT * FROM rule_sets ORDER BY name"
+
+EVENT_INSERT_SQL = """
+    INSERT OR IGNORE INTO received_events (
+        game_id, device_id, session_id, event_id, seq, type,
+        ts_local, payload, received_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+HEARTBEAT_INSERT_SQL = """
+    INSERT INTO heartbeats (
+        device_id, current_game_id, game_state, clock_running,
+        clock_value_ms, last_event_seq, app_version, ts_local, received_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# (unix seconds, ISO 8601 string) for the current second; replaced as a
+# whole so concurrent readers always see a matching pair
+_utc_now_cache: tuple[int, str] = (0, "")
+
+
+def utc_now() -> tuple[int, str]:
+    """Return the current UTC time as (unix seconds, ISO 8601 string), formatting once per second."""
+    global _utc_now_cache
+    seconds = int(time.time())
+    if seconds != _utc_now_cache[0]:
+        _utc_now_cache = (seconds, datetime.fromtimestamp(seconds, timezone.utc).isoformat())
+    return _utc_now_cache
+
+
+@lru_cache(maxsize=4096)
+def format_local_time(ts: int, with_seconds: bool = False) -> str:
+    """Format unix seconds as local "YYYY-MM-DD HH:MM[:SS]" for admin tables."""
+    # Rows in one listing often share a second, so results are cached; the
+    # fixed numeric layout needs none of strftime's locale handling
+    t = time.localtime(ts)
+    formatted = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}"
+    return f"{formatted}:{t.tm_sec:02d}" if with_seconds else formatted
+
+
+def format_timestamp(ts, with_seconds: bool = False, empty: str = "-") -> str:
+    """Format an optional unix timestamp column, showing `empty` when unset."""
+    if ts:
+        return format_local_time(int(ts), with_seconds)
+    return empty
 
 
 # ---------- Admin Navigation Helper ----------
@@ -75,35 +241,211 @@ ADMIN_NAV_ITEMS = [
 ]
 
 
-def admin_nav(active_page: str) -> str:
-    """Generate admin navigation HTML with the active page highlighted."""
+def _build_admin_nav(active_page: str) -> str:
     links = []
     for page_id, href, label in ADMIN_NAV_ITEMS:
         css_class = ' class="active"' if page_id == active_page else ""
         links.append(f'<a href="{href}"{css_class}>{label}</a>')
-    return '<div class="nav">\n            ' + '\n            '.join(links) + '\n        </div>'
+    return '<div class="nav">\n' + '\n'.join(links) + '\n</div>'
+
+
+# The nav only varies by active page, so render every variant once. The
+# variants are Markup so templates embed them as-is without a per-request
+# wrap; Markup is a str, so f-string shells embed them the same way.
+_ADMIN_NAV_CACHE = {page_id: Markup(_build_admin_nav(page_id)) for page_id, _, _ in ADMIN_NAV_ITEMS}
+
+
+def admin_nav(active_page: str) -> Markup:
+    """Return admin navigation HTML with the active page highlighted."""
+    nav = _ADMIN_NAV_CACHE.get(active_page)
+    return nav if nav is not None else Markup(_build_admin_nav(active_page))
+
+
+# Whitespace runs spanning a line break: the indentation the HTML shells
+# below inherit from this file
+_HTML_INDENT = re.compile(r"\s*\n\s*")
+# Elements whose whitespace is significant
+_HTML_VERBATIM = re.compile(r"<(script|style|pre|textarea)\b.*?</\1>", re.DOTALL | re.IGNORECASE)
+
+
+def minify_html(html: str) -> str:
+    """
+    Collapse indented whitespace in a static HTML shell to single newlines.
+
+    Browsers render any run of whitespace between words or tags the same,
+    so pages look unchanged while the indentation stops going over the
+    wire. Script, style, pre and textarea contents are kept verbatim.
+    """
+    parts = []
+    position = 0
+    for match in _HTML_VERBATIM.finditer(html):
+        parts.append(_HTML_INDENT.sub("\n", html[position:match.start()]))
+        parts.append(match.group())
+        position = match.end()
+    parts.append(_HTML_INDENT.sub("\n", html[position:]))
+    return "".join(parts).strip()
 
 
 def init_db():
     """Initialize cloud database schema."""
-    from score.schema import init_schema
     # Set fresh_start=True to drop old tables and use new schema
     # After initial migration, set to False to preserve data
     init_schema(CLOUD_DB_PATH, fresh_start=False)
 
 
-init_db()
+# ---------- WebSocket state tracking ----------
+# Each client has its own outbox drained by a sender task, so a slow
+# consumer only backs up its own queue
+websocket_clients: dict[WebSocket, asyncio.Queue[str]] = {}
+WS_KEEPALIVE_INTERVAL = 30  # seconds of client silence before a ping
+WS_OUTBOX_SIZE = 16
+WS_NOTIFY_DEBOUNCE = 0.05  # seconds; bursts of new events share one update
+_notify_pending = False
+
 
+# ---------- Event group commit ----------
+# Concurrent event uploads are written together: each caller queues its
+# batch, and whichever caller takes the commit lock writes every queued
+# batch in one transaction. A lone upload commits immediately, so this
+# adds no latency; under load, uploads share commits instead of
+# queueing for the write lock one by one.
+EVENT_COMMIT_MAX_BATCHES = 64
+
+pending_event_batches: deque[tuple[list[tuple], Future]] = deque()
+_event_commit_lock = threading.Lock()
+
+
+def commit_event_batches() -> int:
+    """
+    Write queued event batches in one transaction. Returns batches written.
+
+    Each batch runs under its own savepoint, so a batch rejected by a
+    constraint (e.g. an unknown game) fails alone. Every batch's future
+    gets its inserted-row count or the exception that stopped it.
+    """
+    batches = []
+    while pending_event_batches and len(batches) < EVENT_COMMIT_MAX_BATCHES:
+        try:
+            batches.append(pending_event_batches.popleft())
+        except IndexError:
+            break
+
+    if not batches:
+        return 0
+
+    written = []
+    try:
+        with get_write_db() as db:
+            for rows, future in batches:
+                db.execute("SAVEPOINT event_batch")
+                try:
+                    # rowcount sums inserted rows across the batch; ignored
+                    # duplicates don't count
+                    stored = db.executemany(EVENT_INSERT_SQL, rows).rowcount
+                except sqlite3.IntegrityError as e:
+                    db.execute("ROLLBACK TO event_batch")
+                    future.set_exception(e)
+                else:
+                    written.append((future, stored))
+                db.execute("RELEASE event_batch")
+    except BaseException as e:
+        # The transaction rolled back; nothing in it was stored
+        for _, future in batches:
+            if not future.done():
+                future.set_exception(e)
+        if not isinstance(e, Exception):
+            raise
+        return 0
+
+    for future, stored in written:
+        future.set_result(stored)
+    logger.debug("Committed %d event batches in one transaction", len(batches))
+    return len(batches)
+
+
+# ---------- Heartbeat buffering ----------
+# Heartbeats are buffered and written in one transaction per flush, so the
+# disk sees one commit per batch instead of one per heartbeat.
+HEARTBEAT_FLUSH_INTERVAL = 0.5  # seconds
+HEARTBEAT_BATCH_SIZE = 500
+
+pending_heartbeats: deque[tuple] = deque()
+
+
+def flush_heartbeats() -> int:
+    """Write all buffered heartbeats in a single transaction. Returns rows written."""
+    rows = []
+    while pending_heartbeats:
+        try:
+            rows.append(pending_heartbeats.popleft())
+        except IndexError:
+            break
+
+    if not rows:
+        return 0
+
+    try:
+        with get_write_db() as db:
+            db.executemany(HEARTBEAT_INSERT_SQL, rows)
+    except sqlite3.Error:
+        # Put the batch back in arrival order so the next flush retries it
+        pending_heartbeats.extendleft(reversed(rows))
+        raise
+
+    logger.debug("Flushed %d heartbeats", len(rows))
+    return len(rows)
+
+
+async def heartbeat_flush_loop():
+    """Periodically flush buffered heartbeats until cancelled."""
+    while True:
+        await asyncio.sleep(HEARTBEAT_FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(flush_heartbeats)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to flush heartbeats: {e}")
+
+
+# ---------- Periodic maintenance ----------
+DB_OPTIMIZE_INTERVAL = 15 * 60  # seconds
 
-# ---------- WebSocket state tracking ----------
-websocket_clients = []
+
+def optimize_db():
+    """Let SQLite refresh planner statistics for tables whose usage has shifted."""
+    with get_write_db() as db:
+        db.execute("PRAGMA optimize")
+
+
+async def db_optimize_loop():
+    """Run PRAGMA optimize periodically until cancelled."""
+    while True:
+        await asyncio.sleep(DB_OPTIMIZE_INTERVAL)
+        try:
+            await asyncio.to_thread(optimize_db)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to optimize database: {e}")
 
 
 # ---------- Lifespan ----------
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     logger.info("Starting cloud API...")
+    # Schema setup runs once per app start rather than on every import
+    init_db()
+    flush_task = asyncio.create_task(heartbeat_flush_loop())
+    optimize_task = asyncio.create_task(db_optimize_loop())
     yield
+    optimize_task.cancel()
+    flush_task.cancel()
+    # A failed final flush is logged, not raised: the connections still
+    # have to be closed
+    try:
+        flush_heartbeats()
+        commit_event_batches()
+    except Exception as e:
+        logger.error(f"Failed to flush buffered writes on shutdown: {e}")
+    finally:
+        close_connections()
     logger.info("Cloud API shutting down")
 
 
@@ -113,9 +455,125 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Mount static files for admin CSS
+# Admin pages are large, repetitive HTML; compress anything over 1 KB.
+# Small device acks and WebSocket messages are left alone.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Admin CSS and JS are shared by every admin page. Let browsers reuse them
+# for a day, then revalidate against the ETag StaticFiles already sends.
+# URLs are not fingerprinted, so a longer "immutable" lifetime would pin
+# stale scripts after a deploy.
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks responses cacheable by browsers."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", STATIC_CACHE_CONTROL)
+        return response
+
+
+# Mount static files for admin CSS and JS
 STATIC_DIR = Path(__file__).parent / "static"
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
+
+
+def json_response(content) -> Response:
+    """Serialize plain dict/list content with orjson, bypassing jsonable_encoder."""
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+
+def json_rows_sql(columns: tuple[str, ...]) -> str:
+    """
+    SQL aggregate building a JSON array with one object per row.
+
+    Lets SQLite serialize a whole listing, so the response body is a
+    single string straight from the query. Rows keep the order of the
+    subquery they are aggregated from.
+    """
+    pairs = ", ".join(f"'{column}', {column}" for column in columns)
+    return f"json_group_array(json_object({pairs}))"
+
+
+def fetch_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+    """
+    Fetch the remaining rows of a query as dicts keyed by column name.
+
+    Rows are fetched as plain tuples and zipped with the column names once,
+    rather than building a sqlite3.Row per row and copying it with dict().
+    """
+    cursor.row_factory = None
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+# ---------- Admin list ETags ----------
+# Keyed per process so pages rendered by an older deploy's templates are
+# never revalidated
+_ETAG_KEY = os.urandom(16)
+ADMIN_LIST_CACHE_CONTROL = "private, no-cache"
+
+
+def rows_etag(*parts) -> str:
+    """Weak ETag over the data (rows and query parameters) a response is built from."""
+    digest = hashlib.blake2b(orjson.dumps(parts), digest_size=12, key=_ETAG_KEY).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names this ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (tag.strip() for tag in header.split(","))
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    """Let the browser keep the response but revalidate it on every load."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = ADMIN_LIST_CACHE_CONTROL
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    return with_etag(Response(status_code=304), etag)
+
+
+# ---------- Schedule Cache ----------
+# (rink_id, date) -> (schedule_version, serialized schedule JSON)
+SCHEDULE_CACHE: dict[tuple[str, str], tuple[str, bytes]] = {}
+SCHEDULE_CACHE_SIZE = 256
+# Handlers run in the threadpool; evicting, inserting and scanning the cache
+# hold this lock so two requests can't evict the same oldest key or iterate
+# while another inserts. Plain lookups don't need it.
+_schedule_cache_lock = threading.Lock()
+
+
+def bump_schedule_versions(db: sqlite3.Connection) -> None:
+    """
+    Give rinks a fresh schedule_version after games/rinks change.
+
+    Devices refetch when the version moves, and SCHEDULE_CACHE entries keyed
+    on the old version stop matching; the cache is also cleared outright so
+    entries for deleted rinks don't linger. Only rinks with games, or with a
+    version row already, are bumped: a rink with neither has no schedule to
+    invalidate and would otherwise gain a row on every seed.
+    """
+    # Full precision so two bumps within one second still differ
+    now = datetime.now(timezone.utc)
+    db.execute("""
+        INSERT INTO schedule_versions (rink_id, version, updated_at)
+        SELECT rink_id, ?, ? FROM rinks r
+        WHERE EXISTS (SELECT 1 FROM games g WHERE g.rink_id = r.rink_id)
+           OR EXISTS (SELECT 1 FROM schedule_versions v WHERE v.rink_id = r.rink_id)
+        ON CONFLICT(rink_id) DO UPDATE SET
+            version = excluded.version,
+            updated_at = excluded.updated_at
+    """, (now.isoformat(), int(now.timestamp())))
+    with _schedule_cache_lock:
+        SCHEDULE_CACHE.clear()
 
 
 # ---------- API Endpoints ----------
@@ -123,14 +581,13 @@ app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 @app.get("/")
 async def root():
     """Root endpoint with navigation to admin pages."""
-    from fastapi.responses import RedirectResponse
     return RedirectResponse(url="/admin/devices")
 
 
 @app.get("/v1/rinks/{rink_id}/schedule", response_model=ScheduleResponse)
-async def get_schedule(
-    rink_id: str = FastAPIPath(..., description="Rink ID"),
-    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (defaults to today)")
+def get_schedule(
+    rink_id: RinkIdPath,
+    date: ScheduleDateQuery = None
 ):
     """
     Download game schedule for a specific rink.
@@ -139,79 +596,69 @@ async def get_schedule(
     """
     logger.info(f"Schedule request for rink_id={rink_id}, date={date}")
 
-    db = get_db()
+    with get_read_db() as db:
+        # Check if rink exists
+        rink = db.execute("SELECT * FROM rinks WHERE rink_id = ?", (rink_id,)).fetchone()
+        if not rink:
+            raise HTTPException(status_code=404, detail=f"Rink {rink_id} not found")
+
+        # Get schedule version
+        version_row = db.execute(
+            "SELECT version FROM schedule_versions WHERE rink_id = ?",
+            (rink_id,)
+        ).fetchone()
+
+        schedule_version = version_row["version"] if version_row else datetime.now(timezone.utc).isoformat()
+
+        # Default to today if no date specified (use local timezone, not UTC)
+        if date is None:
+            date = datetime.now().strftime("%Y-%m-%d")
+
+        # Serve from cache while the rink's schedule version is unchanged
+        cache_key = (rink_id, date)
+        cached = SCHEDULE_CACHE.get(cache_key)
+        if version_row and cached and cached[0] == schedule_version:
+            logger.debug("Schedule cache hit for %s on %s", rink_id, date)
+            return Response(content=cached[1], media_type="application/json")
+
+        # For Pacific timezone (UTC-8/7), we need to query a wider range
+        # A game on Feb 1 Pacific could be stored as Feb 2 UTC if it's an evening game
+        # So we query for both the requested date and the next day in UTC
+        # DATE_PATTERN only checks the shape; reject impossible dates like 2025-02-30
+        try:
+            date_obj = datetime.strptime(date, "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(status_code=422, detail=f"Invalid date {date}")
+        range_end = (date_obj + timedelta(days=2)).strftime("%Y-%m-%d")
+
+        # Query games for the rink on the specified date OR next date (to catch evening games)
+        # ISO 8601 strings sort lexicographically, so [date, date + 2 days) matches
+        # any start_time beginning with either date and can use idx_games_rink_start
+        # Join with registrations to get organizational context
+        # Rows come straight from our own typed schema and their columns match
+        # Game's fields, so serialize them directly instead of building models
+        games_list = fetch_dicts(db.execute(SCHEDULE_GAMES_SQL, (rink_id, date, range_end)))
 
-    # Check if rink exists
-    rink = db.execute("SELECT * FROM rinks WHERE rink_id = ?", (rink_id,)).fetchone()
-    if not rink:
-        db.close()
-        raise HTTPException(status_code=404, detail=f"Rink {rink_id} not found")
+    logger.info(f"Returning {len(games_list)} games for {rink_id} on {date}")
 
-    # Get schedule version
-    version_row = db.execute(
-        "SELECT version FROM schedule_versions WHERE rink_id = ?",
-        (rink_id,)
-    ).fetchone()
-
-    schedule_version = version_row["version"] if version_row else datetime.now(timezone.utc).isoformat()
-
-    # Default to today if no date specified (use local timezone, not UTC)
-    if date is None:
-        date = datetime.now().strftime("%Y-%m-%d")
-
-    # For Pacific timezone (UTC-8/7), we need to query a wider range
-    # A game on Feb 1 Pacific could be stored as Feb 2 UTC if it's an evening game
-    # So we query for both the requested date and the next day in UTC
-    from datetime import timedelta
-    date_obj = datetime.strptime(date, "%Y-%m-%d")
-    next_date = (date_obj + timedelta(days=1)).strftime("%Y-%m-%d")
-
-    # Query games for the rink on the specified date OR next date (to catch evening games)
-    # Match games where start_time begins with either date
-    # Join with registrations to get organizational context
-    games = db.execute("""
-        SELECT DISTINCT g.game_id, g.home_team, g.away_team, g.home_abbrev, g.away_abbrev,
-               g.start_time, g.period_length_min,
-               l.name as league_name,
-               s.name as season_name,
-               d.name as division_name
-        FROM games g
-        LEFT JOIN team_registrations tr ON g.home_registration_id = tr.registration_id
-        LEFT JOIN leagues l ON tr.league_id = l.league_id
-        LEFT JOIN seasons s ON tr.season_id = s.season_id
-        LEFT JOIN divisions d ON tr.division_id = d.division_id
-        WHERE g.rink_id = ? AND (g.start_time LIKE ? OR g.start_time LIKE ?)
-        ORDER BY g.start_time
-    """, (rink_id, f"{date}%", f"{next_date}%")).fetchall()
-
-    db.close()
-
-    games_list = [
-        Game(
-            game_id=g["game_id"],
-            home_team=g["home_team"],
-            away_team=g["away_team"],
-            home_abbrev=g["home_abbrev"],
-            away_abbrev=g["away_abbrev"],
-            start_time=g["start_time"],
-            period_length_min=g["period_length_min"],
-            league_name=g["league_name"],
-            season_name=g["season_name"],
-            division_name=g["division_name"],
-        )
-        for g in games
-    ]
+    body = orjson.dumps({
+        "schedule_version": schedule_version,
+        "games": games_list
+    })
 
-    logger.info(f"Returning {len(games_list)} games for {rink_id} on {date}")
+    # Only versioned schedules can be cached; without a version row there is
+    # nothing to invalidate against.
+    if version_row:
+        with _schedule_cache_lock:
+            if cache_key not in SCHEDULE_CACHE and len(SCHEDULE_CACHE) >= SCHEDULE_CACHE_SIZE:
+                SCHEDULE_CACHE.pop(next(iter(SCHEDULE_CACHE)), None)
+            SCHEDULE_CACHE[cache_key] = (schedule_version, body)
 
-    return ScheduleResponse(
-        schedule_version=schedule_version,
-        games=games_list
-    )
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/v1/games/{game_id}/roster")
-async def get_game_roster(game_id: str = FastAPIPath(..., description="Game ID")):
+def get_game_roster(game_id: GameIdPath):
     """
     Get roster for a game as of game start time.
 
@@ -219,26 +666,23 @@ async def get_game_roster(game_id: str = FastAPIPath(..., description="Game ID")
     """
     logger.info(f"Roster request for game_id={game_id}")
 
-    db = get_db()
-
-    # Get game start time
-    game = db.execute(
-        "SELECT start_time FROM games WHERE game_id = ?",
-        (game_id,)
-    ).fetchone()
+    from score.state import get_game_roster_at_time
 
-    if not game:
-        db.close()
-        raise HTTPException(status_code=404, detail="Game not found")
+    with get_read_db() as db:
+        # Get game start time
+        game = db.execute(
+            "SELECT start_time FROM games WHERE game_id = ?",
+            (game_id,)
+        ).fetchone()
 
-    # Parse start time to unix timestamp
-    start_time = int(datetime.fromisoformat(game["start_time"]).timestamp())
+        if not game:
+            raise HTTPException(status_code=404, detail="Game not found")
 
-    db.close()
+        # Parse start time to unix timestamp
+        start_time = int(datetime.fromisoformat(game["start_time"]).timestamp())
 
-    # Get roster state at game start using state replay
-    from score.state import get_game_roster_at_time
-    roster_state = get_game_roster_at_time(CLOUD_DB_PATH, game_id, start_time)
+        # Get roster state at game start using state replay
+        roster_state = get_game_roster_at_time(CLOUD_DB_PATH, game_id, start_time, conn=db)
 
     return {
         "game_id": game_id,
@@ -249,7 +693,7 @@ async def get_game_roster(game_id: str = FastAPIPath(..., description="Game ID")
 
 
 @app.get("/v1/devices/{device_id}/config", response_model=DeviceConfigResponse)
-async def get_device_config(device_id: str = FastAPIPath(..., description="Device ID")):
+def get_device_config(device_id: str = FastAPIPath(..., description="Device ID")):
     """
     Get configuration for a device.
 
@@ -258,60 +702,98 @@ async def get_device_config(device_id: str = FastAPIPath(..., description="Devic
     """
     logger.info(f"Config request from device_id={device_id}")
 
-    db = get_db()
     current_time = int(time.time())
 
-    # Check if device exists
-    device = db.execute(
-        "SELECT * FROM devices WHERE device_id = ?",
-        (device_id,)
-    ).fetchone()
-
-    if device:
-        # Update last_seen_at
-        db.execute(
-            "UPDATE devices SET last_seen_at = ? WHERE device_id = ?",
-            (current_time, device_id)
-        )
-        db.commit()
-
-        is_assigned = bool(device["is_assigned"])
-
-        if is_assigned:
-            logger.info(f"Device {device_id} is assigned to rink={device['rink_id']}, sheet={device['sheet_name']}")
-            db.close()
-            return DeviceConfigResponse(
-                device_id=device_id,
-                is_assigned=True,
-                rink_id=device["rink_id"],
-                sheet_name=device["sheet_name"],
-                device_name=device["device_name"],
-                message=f"Assigned to {device['rink_id']} - {device['sheet_name']}"
-            )
-        else:
-            logger.info(f"Device {device_id} exists but is not assigned")
-            db.close()
-            return DeviceConfigResponse(
-                device_id=device_id,
-                is_assigned=False,
-                message="Device registered but not assigned. Please contact admin to assign this device."
-            )
-    else:
-        # First time seeing this device - register it as unassigned
-        logger.info(f"New device {device_id} - registering as unassigned")
-        db.execute("""
-            INSERT INTO devices (device_id, is_assigned, first_seen_at, last_seen_at)
-            VALUES (?, 0, ?, ?)
-        """, (device_id, current_time, current_time))
-        db.commit()
-        db.close()
+    with get_write_db() as db:
+        registered = db.execute(DEVICE_REGISTER_SQL, (device_id, current_time, current_time)).fetchone()
+        device = None if registered else db.execute(DEVICE_TOUCH_SQL, (current_time, device_id)).fetchone()
 
+    if registered:
+        # First time seeing this device - it was just registered as unassigned
+        logger.info(f"New device {device_id} - registered as unassigned")
         return DeviceConfigResponse(
             device_id=device_id,
             is_assigned=False,
             message="Device registered. Please contact admin to assign this device to a rink and sheet."
         )
 
+    if device["is_assigned"]:
+        logger.info(f"Device {device_id} is assigned to rink={device['rink_id']}, sheet={device['sheet_name']}")
+        return DeviceConfigResponse(
+            device_id=device_id,
+            is_assigned=True,
+            rink_id=device["rink_id"],
+            sheet_name=device["sheet_name"],
+            device_name=device["device_name"],
+            message=f"Assigned to {device['rink_id']} - {device['sheet_name']}"
+        )
+
+    logger.info(f"Device {device_id} exists but is not assigned")
+    return DeviceConfigResponse(
+        device_id=device_id,
+        is_assigned=False,
+        message="Device registered but not assigned. Please contact admin to assign this device."
+    )
+
+
+def store_events(game_id: str, request: PostEventsRequest, current_time: int) -> tuple[int, bool]:
+    """
+    Persist a batch of events (blocking; run off the event loop).
+
+    Returns (acked_through, has_new_events).
+    """
+    # Devices normally send events in seq order; only sort when they don't
+    events = request.events
+    if any(a.seq > b.seq for a, b in pairwise(events)):
+        events = sorted(events, key=attrgetter("seq"))
+    acked_through = events[-1].seq if events else 0
+
+    # Idempotency is enforced by the UNIQUE(event_id) constraint: duplicates
+    # are silently skipped by INSERT OR IGNORE, so one batched statement
+    # replaces the per-event SELECT + INSERT round-trips.
+    rows = [
+        (
+            game_id,
+            request.device_id,
+            request.session_id,
+            event.event_id,
+            event.seq,
+            event.type,
+            event.ts_local,
+            orjson.dumps(event.payload).decode(),
+            current_time
+        )
+        for event in events
+    ]
+
+    # An empty batch inserts nothing for the foreign key to reject, so the
+    # game has to be looked up explicitly
+    if not rows:
+        with get_read_db() as db:
+            if db.execute("SELECT 1 FROM games WHERE game_id = ?", (game_id,)).fetchone() is None:
+                raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+        return acked_through, False
+
+    future: Future[int] = Future()
+    pending_event_batches.append((rows, future))
+    while not future.done():
+        with _event_commit_lock:
+            # Another caller may have committed this batch while we waited
+            if not future.done():
+                commit_event_batches()
+
+    # Unknown games are rejected by the received_events -> games foreign key
+    # (enforced on the write connection) instead of a separate existence query
+    try:
+        stored = future.result()
+    except sqlite3.IntegrityError as e:
+        if "FOREIGN KEY" in str(e):
+            raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+        raise
+    logger.debug("Stored %d new events (%d duplicates skipped)", stored, len(rows) - stored)
+
+    return acked_through, stored > 0
+
 
 @app.post("/v1/games/{game_id}/events", response_model=PostEventsResponse)
 async def post_events(
@@ -325,117 +807,86 @@ async def post_events(
     """
     logger.info(f"Received {len(request.events)} events for game {game_id} from device {request.device_id}")
 
-    db = get_db()
+    # INSERT OR IGNORE would silently keep only the first of two events
+    # sharing an event_id, so reject such batches outright
+    event_ids = {event.event_id for event in request.events}
+    if len(event_ids) != len(request.events):
+        raise HTTPException(status_code=400, detail="Duplicate event_id in batch")
 
-    # Verify game exists
-    game = db.execute("SELECT * FROM games WHERE game_id = ?", (game_id,)).fetchone()
-    if not game:
-        db.close()
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    current_time, server_time = utc_now()
+    acked_through, has_new_events = await asyncio.to_thread(store_events, game_id, request, current_time)
 
-    acked_through = 0
-    current_time = int(time.time())
-    has_new_events = False
+    # Notify WebSocket clients if there were new events
+    if has_new_events and websocket_clients:
+        schedule_notify()
 
-    # Process events with idempotency
-    for event in sorted(request.events, key=lambda e: e.seq):
-        try:
-            # Check if event already exists (idempotency)
-            existing = db.execute(
-                "SELECT seq FROM received_events WHERE event_id = ?",
-                (event.event_id,)
-            ).fetchone()
+    logger.info(f"Acknowledged events through seq={acked_through} for game {game_id}")
 
-            if existing:
-                logger.debug(f"Event {event.event_id} already exists, skipping")
-                acked_through = event.seq
-                continue
+    # Plain dict through orjson; response_model still documents the shape
+    return json_response({
+        "acked_through": acked_through,
+        "server_time": server_time
+    })
 
-            # Insert new event
-            db.execute("""
-                INSERT INTO received_events (
-                    game_id, device_id, session_id, event_id, seq, type,
-                    ts_local, payload, received_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                game_id,
-                request.device_id,
-                request.session_id,
-                event.event_id,
-                event.seq,
-                event.type,
-                event.ts_local,
-                json.dumps(event.payload),
-                current_time
-            ))
-
-            acked_through = event.seq
-            has_new_events = True
-            logger.debug(f"Stored event {event.event_id} (seq={event.seq}, type={event.type})")
-
-        except sqlite3.IntegrityError as e:
-            logger.warning(f"Integrity error for event {event.event_id}: {e}")
-            # Event already exists, continue
-            acked_through = event.seq
-            continue
 
-    db.commit()
-    db.close()
+def notify_game_state_change():
+    """Queue an update notice for every connected WebSocket client."""
+    for outbox in websocket_clients.values():
+        try:
+            outbox.put_nowait("update")
+        except asyncio.QueueFull:
+            # The client is behind; the updates already queued will make it refetch
+            pass
 
-    # Notify WebSocket clients if there were new events
-    if has_new_events and websocket_clients:
-        await notify_game_state_change()
 
-    server_time = datetime.now(timezone.utc).isoformat()
+def schedule_notify():
+    """Notify clients once after a short delay, merging bursts of calls."""
+    global _notify_pending
+    if _notify_pending:
+        return
+    # Only mark a flush pending once one is actually scheduled
+    asyncio.get_running_loop().call_later(WS_NOTIFY_DEBOUNCE, _flush_notify)
+    _notify_pending = True
 
-    logger.info(f"Acknowledged events through seq={acked_through} for game {game_id}")
 
-    return PostEventsResponse(
-        acked_through=acked_through,
-        server_time=server_time
-    )
+def _flush_notify():
+    global _notify_pending
+    try:
+        notify_game_state_change()
+    finally:
+        # A failed notify must not leave the flag set, or every later
+        # schedule_notify would return early and clients would stop updating
+        _notify_pending = False
 
 
-async def notify_game_state_change():
-    """Notify all connected WebSocket clients that game state has changed."""
-    dead_clients = []
-    for ws in websocket_clients:
+async def websocket_sender(websocket: WebSocket, outbox: asyncio.Queue[str]):
+    """Drain a client's outbox onto its socket until a send fails."""
+    while True:
+        message = await outbox.get()
         try:
-            await ws.send_text("update")
-        except:
-            dead_clients.append(ws)
-
-    # Remove disconnected clients
-    for ws in dead_clients:
-        websocket_clients.remove(ws)
-
-    if dead_clients:
-        logger.debug(f"Removed {len(dead_clients)} disconnected WebSocket client(s)")
+            await websocket.send_text(message)
+        except Exception:
+            logger.debug("Dropping WebSocket client after failed send")
+            websocket_clients.pop(websocket, None)
+            return
 
 
 @app.post("/v1/heartbeat", response_model=HeartbeatResponse)
-async def post_heartbeat(request: HeartbeatRequest):
+def post_heartbeat(request: HeartbeatRequest):
     """
     Receive heartbeat from mini PC for monitoring.
 
     Used for Grafana dashboards and alerts.
     """
-    logger.debug(f"Heartbeat from device {request.device_id}")
+    logger.debug("Heartbeat from device %s", request.device_id)
 
-    db = get_db()
+    current_time, server_time = utc_now()
 
-    current_time = int(time.time())
-
-    db.execute("""
-        INSERT INTO heartbeats (
-            device_id, current_game_id, game_state, clock_running,
-            clock_value_ms, last_event_seq, app_version, ts_local, received_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+    pending_heartbeats.append((
         request.device_id,
         request.current_game_id,
         request.game_state,
-        1 if request.clock_running else 0 if request.clock_running is not None else None,
+        None if request.clock_running is None else int(request.clock_running),
         request.clock_value_ms,
         request.last_event_seq,
         request.app_version,
@@ -443,21 +894,24 @@ async def post_heartbeat(request: HeartbeatRequest):
         current_time
     ))
 
-    db.commit()
-    db.close()
-
-    server_time = datetime.now(timezone.utc).isoformat()
+    # Don't let the buffer grow unbounded if the flush task falls behind
+    if len(pending_heartbeats) >= HEARTBEAT_BATCH_SIZE:
+        try:
+            flush_heartbeats()
+        except sqlite3.Error as e:
+            # The heartbeat is still buffered; the flush task will retry it
+            logger.error(f"Failed to flush heartbeats: {e}")
 
-    return HeartbeatResponse(
-        status="ok",
-        server_time=server_time
-    )
+    return json_response({
+        "status": "ok",
+        "server_time": server_time
+    })
 
 
 # ---------- Admin/Debug Endpoints ----------
 
 @app.post("/admin/rinks")
-async def create_rink(request: CreateRinkRequest):
+def create_rink(request: CreateRinkRequest):
     """
     Create a new rink.
 
@@ -465,33 +919,33 @@ async def create_rink(request: CreateRinkRequest):
         rink_id: Unique identifier for the rink (e.g., "rink-alpha")
         name: Human-readable name (e.g., "Alpha Ice Arena")
     """
+    # Only IDs the rink endpoints' RinkIdPath accepts, so every rink created
+    # here can be fetched, updated and deleted by ID
+    if not re.match(ID_PATTERN, request.rink_id):
+        raise HTTPException(
+            status_code=422,
+            detail="rink_id may only contain letters, digits, '_', '.' and '-'"
+        )
+
     logger.info(f"Creating rink {request.rink_id}")
 
-    db = get_db()
     current_time = int(time.time())
 
-    # Check if rink already exists
-    existing = db.execute(
-        "SELECT rink_id FROM rinks WHERE rink_id = ?",
-        (request.rink_id,)
-    ).fetchone()
+    # Insert rink; an existing rink_id returns no row
+    with get_write_db() as db:
+        created = db.execute("""
+            INSERT INTO rinks (rink_id, name, created_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(rink_id) DO NOTHING
+            RETURNING rink_id
+        """, (request.rink_id, request.name, current_time)).fetchone()
 
-    if existing:
-        db.close()
+    if not created:
         raise HTTPException(
             status_code=409,
             detail=f"Rink {request.rink_id} already exists"
         )
 
-    # Insert rink
-    db.execute("""
-        INSERT INTO rinks (rink_id, name, created_at)
-        VALUES (?, ?, ?)
-    """, (request.rink_id, request.name, current_time))
-
-    db.commit()
-    db.close()
-
     logger.info(f"Successfully created rink {request.rink_id}")
 
     return {
@@ -505,37 +959,25 @@ async def create_rink(request: CreateRinkRequest):
 
 
 @app.put("/admin/rinks/{rink_id}")
-async def update_rink(rink_id: str, request: dict):
+def update_rink(rink_id: str, request: dict):
     """
     Update a rink's name.
     """
     logger.info(f"Updating rink {rink_id}")
 
-    db = get_db()
-
-    # Check if rink exists
-    rink = db.execute(
-        "SELECT rink_id FROM rinks WHERE rink_id = ?",
-        (rink_id,)
-    ).fetchone()
-
-    if not rink:
-        db.close()
-        raise HTTPException(status_code=404, detail=f"Rink {rink_id} not found")
-
     new_name = request.get("name")
     if not new_name:
-        db.close()
         raise HTTPException(status_code=400, detail="Name is required")
 
-    # Update rink name
-    db.execute(
-        "UPDATE rinks SET name = ? WHERE rink_id = ?",
-        (new_name, rink_id)
-    )
+    # Update rink name; an unknown rink returns no row
+    with get_write_db() as db:
+        updated = db.execute(
+            "UPDATE rinks SET name = ? WHERE rink_id = ? RETURNING rink_id",
+            (new_name, rink_id)
+        ).fetchone()
 
-    db.commit()
-    db.close()
+    if not updated:
+        raise HTTPException(status_code=404, detail=f"Rink {rink_id} not found")
 
     logger.info(f"Successfully updated rink {rink_id} name to {new_name}")
 
@@ -550,44 +992,47 @@ async def update_rink(rink_id: str, request: dict):
 
 
 @app.delete("/admin/rinks/{rink_id}")
-async def delete_rink(rink_id: str):
+def delete_rink(rink_id: str):
     """
     Delete a rink.
 
-    This will fail if there are devices assigned to this rink.
+    This will fail if there are devices assigned to this rink, or if games,
+    sheets or other records still refer to it.
     """
     logger.info(f"Deleting rink {rink_id}")
 
-    db = get_db()
-
-    # Check if rink exists
-    rink = db.execute(
-        "SELECT rink_id FROM rinks WHERE rink_id = ?",
-        (rink_id,)
-    ).fetchone()
-
-    if not rink:
-        db.close()
-        raise HTTPException(status_code=404, detail=f"Rink {rink_id} not found")
-
-    # Check if any devices are assigned to this rink
-    devices = db.execute(
-        "SELECT COUNT(*) as count FROM devices WHERE rink_id = ? AND is_assigned = 1",
-        (rink_id,)
-    ).fetchone()
+    try:
+        with get_write_db() as db:
+            # Check if any devices are assigned to this rink
+            devices = db.execute(
+                "SELECT COUNT(*) as count FROM devices WHERE rink_id = ? AND is_assigned = 1",
+                (rink_id,)
+            ).fetchone()
 
-    if devices["count"] > 0:
-        db.close()
+            if devices["count"] > 0:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Cannot delete rink {rink_id}: {devices['count']} device(s) are assigned to it. Unassign devices first."
+                )
+
+            # The rink's schedule version goes with it; it would otherwise
+            # block the delete once any seed or game change has bumped versions
+            db.execute("DELETE FROM schedule_versions WHERE rink_id = ?", (rink_id,))
+            deleted = db.execute(
+                "DELETE FROM rinks WHERE rink_id = ? RETURNING rink_id", (rink_id,)
+            ).fetchone()
+    except sqlite3.IntegrityError:
         raise HTTPException(
             status_code=409,
-            detail=f"Cannot delete rink {rink_id}: {devices['count']} device(s) are assigned to it. Unassign devices first."
+            detail=f"Cannot delete rink {rink_id}: other records still refer to it"
         )
 
-    # Delete the rink
-    db.execute("DELETE FROM rinks WHERE rink_id = ?", (rink_id,))
+    if not deleted:
+        raise HTTPException(status_code=404, detail=f"Rink {rink_id} not found")
 
-    db.commit()
-    db.close()
+    with _schedule_cache_lock:
+        for key in [key for key in SCHEDULE_CACHE if key[0] == rink_id]:
+            del SCHEDULE_CACHE[key]
 
     logger.info(f"Successfully deleted rink {rink_id}")
 
@@ -597,85 +1042,9 @@ async def delete_rink(rink_id: str):
     }
 
 
-@app.get("/admin/devices")
-async def list_devices(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
-    """
-    List all registered devices and their assignments.
-
-    Returns HTML admin UI by default, or JSON if format=json is specified.
-    """
-    db = get_db()
-
-    devices = db.execute("""
-        SELECT device_id, rink_id, sheet_name, device_name, is_assigned,
-               first_seen_at, last_seen_at, notes
-        FROM devices
-        ORDER BY last_seen_at DESC
-    """).fetchall()
-
-    # Get available rinks for dropdown
-    rinks = db.execute("SELECT rink_id, name FROM rinks ORDER BY name").fetchall()
-
-    db.close()
-
-    device_list = [
-        {
-            "device_id": d["device_id"],
-            "rink_id": d["rink_id"],
-            "sheet_name": d["sheet_name"],
-            "device_name": d["device_name"],
-            "is_assigned": bool(d["is_assigned"]),
-            "first_seen_at": d["first_seen_at"],
-            "last_seen_at": d["last_seen_at"],
-            "notes": d["notes"]
-        }
-        for d in devices
-    ]
-
-    # Return JSON if requested
-    if format == "json":
-        return DeviceListResponse(devices=[DeviceInfo(**d) for d in device_list])
-
-    # Return HTML admin UI
-    from fastapi.responses import HTMLResponse
-    import datetime
-
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
-        return "Never"
-
-    rink_options = "".join([f'<option value="{r["rink_id"]}">{r["name"]} ({r["rink_id"]})</option>' for r in rinks])
-
-    devices_html = ""
-    for d in device_list:
-        status_badge = '<span class="badge assigned">Assigned</span>' if d["is_assigned"] else '<span class="badge unassigned">Not Assigned</span>'
-
-        devices_html += f"""
-        <tr data-device-id="{d['device_id']}">
-            <td class="device-id">{d['device_id']}</td>
-            <td>
-                <select class="rink-select" data-device-id="{d['device_id']}">
-                    <option value="">-- Select Rink --</option>
-                    {rink_options}
-                </select>
-                <script>
-                document.querySelector('select.rink-select[data-device-id="{d["device_id"]}"]').value = "{d["rink_id"] or ""}";
-                </script>
-            </td>
-            <td><input type="text" class="sheet-input" data-device-id="{d['device_id']}" value="{d['sheet_name'] or ''}" placeholder="Sheet 1"></td>
-            <td><input type="text" class="name-input" data-device-id="{d['device_id']}" value="{d['device_name'] or ''}" placeholder="Display name"></td>
-            <td>{status_badge}</td>
-            <td class="timestamp">{format_timestamp(d['last_seen_at'])}</td>
-            <td class="actions">
-                <button class="btn-save" onclick="saveDevice('{d['device_id']}')">Save</button>
-                <button class="btn-unassign" onclick="unassignDevice('{d['device_id']}')">Unassign</button>
-                <button class="btn-delete" onclick="deleteDevice('{d['device_id']}')">Delete</button>
-            </td>
-        </tr>
-        """
-
-    html = f"""
+# Static shell of the devices page; rows are streamed between head and tail.
+# Head and tail are minified and encoded once here rather than on every response.
+DEVICES_HTML_HEAD = minify_html(f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -716,261 +1085,202 @@ async def list_devices(format: Optional[str] = Query(None, description="Response
                         </tr>
                     </thead>
                     <tbody>
-                        {devices_html}
-                    </tbody>
+""").encode("utf-8")
+
+DEVICES_HTML_TAIL = minify_html("""                    </tbody>
                 </table>
             </div>
         </div>
 
-        <script>
-        function filterDeviceTable() {{
-            const filters = {{
-                deviceId: document.getElementById('filterDeviceId').value.toLowerCase(),
-                rink: document.getElementById('filterRink').value.toLowerCase(),
-                sheet: document.getElementById('filterSheet').value.toLowerCase(),
-                deviceName: document.getElementById('filterDeviceName').value.toLowerCase(),
-                status: document.getElementById('filterStatus').value.toLowerCase(),
-                lastSeen: document.getElementById('filterLastSeen').value.toLowerCase()
-            }};
-
-            const tbody = document.querySelector('table tbody');
-            const rows = tbody.getElementsByTagName('tr');
-
-            for (let i = 0; i < rows.length; i++) {{
-                const cells = rows[i].getElementsByTagName('td');
-                if (cells.length < 7) continue;
-
-                const deviceId = cells[0].textContent.toLowerCase();
-                const rink = cells[1].querySelector('select')?.value.toLowerCase() || '';
-                const sheet = cells[2].querySelector('input')?.value.toLowerCase() || '';
-                const deviceName = cells[3].querySelector('input')?.value.toLowerCase() || '';
-                const status = cells[4].textContent.toLowerCase();
-                const lastSeen = cells[5].textContent.toLowerCase();
-
-                const match =
-                    deviceId.includes(filters.deviceId) &&
-                    rink.includes(filters.rink) &&
-                    sheet.includes(filters.sheet) &&
-                    deviceName.includes(filters.deviceName) &&
-                    status.includes(filters.status) &&
-                    lastSeen.includes(filters.lastSeen);
-
-                rows[i].style.display = match ? '' : 'none';
-            }}
-        }}
-
-        function showMessage(text, type) {{
-            const msg = document.getElementById('message');
-            msg.textContent = text;
-            msg.className = `message ${{type}}`;
-            msg.style.display = 'block';
-            setTimeout(() => {{
-                msg.style.display = 'none';
-            }}, 5000);
-        }}
-
-        async function saveDevice(deviceId) {{
-            const row = document.querySelector(`tr[data-device-id="${{deviceId}}"]`);
-            const rinkId = row.querySelector('.rink-select').value;
-            const sheetName = row.querySelector('.sheet-input').value;
-            const deviceName = row.querySelector('.name-input').value;
-
-            if (!rinkId || !sheetName) {{
-                showMessage('Please select a rink and enter a sheet name', 'error');
-                return;
-            }}
+        <script src="/static/admin_devices.js" defer></script>
+    </body>
+    </html>
+""").encode("utf-8")
 
-            try {{
-                const response = await fetch(`/admin/devices/${{deviceId}}`, {{
-                    method: 'PUT',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{
-                        rink_id: rinkId,
-                        sheet_name: sheetName,
-                        device_name: deviceName || null
-                    }})
-                }});
-
-                const result = await response.json();
-
-                if (response.ok) {{
-                    showMessage(`Device ${{deviceId}} saved successfully`, 'success');
-                    setTimeout(() => location.reload(), 1500);
-                }} else {{
-                    showMessage(`Error: ${{result.detail || 'Failed to save'}}`, 'error');
-                }}
-            }} catch (error) {{
-                showMessage(`Error: ${{error.message}}`, 'error');
-            }}
-        }}
 
-        async function unassignDevice(deviceId) {{
-            if (!confirm(`Unassign device ${{deviceId}}?`)) {{
-                return;
-            }}
+# Admin HTML is rendered from templates compiled once at import; autoescape
+# keeps device- and user-supplied names and IDs from injecting markup.
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+templates_env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), autoescape=True)
+templates_env.filters["local_time"] = format_local_time
+DEVICE_ROW_TEMPLATE = templates_env.get_template("cloud/device_row.html")
+# Admin list pages; each extends cloud/admin_page.html
+PLAYERS_TEMPLATE = templates_env.get_template("cloud/players.html")
+LEAGUES_TEMPLATE = templates_env.get_template("cloud/leagues.html")
+SEASONS_TEMPLATE = templates_env.get_template("cloud/seasons.html")
+DIVISIONS_TEMPLATE = templates_env.get_template("cloud/divisions.html")
+RINKS_TEMPLATE = templates_env.get_template("cloud/rinks.html")
+SEED_TEMPLATE = templates_env.get_template("cloud/seed.html")
 
-            try {{
-                const response = await fetch(`/admin/devices/${{deviceId}}/assignment`, {{
-                    method: 'DELETE'
-                }});
-
-                const result = await response.json();
-
-                if (response.ok) {{
-                    showMessage(`Device ${{deviceId}} unassigned`, 'success');
-                    setTimeout(() => location.reload(), 1500);
-                }} else {{
-                    showMessage(`Error: ${{result.detail || 'Failed to unassign'}}`, 'error');
-                }}
-            }} catch (error) {{
-                showMessage(`Error: ${{error.message}}`, 'error');
-            }}
-        }}
+STREAM_CHUNK_SIZE = 16 * 1024  # characters per streamed HTML chunk
 
-        async function deleteDevice(deviceId) {{
-            if (!confirm(`Delete device ${{deviceId}}? This will permanently remove it from the database.`)) {{
-                return;
-            }}
 
-            try {{
-                const response = await fetch(`/admin/devices/${{deviceId}}`, {{
-                    method: 'DELETE'
-                }});
-
-                const result = await response.json();
-
-                if (response.ok) {{
-                    showMessage(`Device ${{deviceId}} deleted`, 'success');
-                    setTimeout(() => location.reload(), 1500);
-                }} else {{
-                    showMessage(`Error: ${{result.detail || 'Failed to delete'}}`, 'error');
-                }}
-            }} catch (error) {{
-                showMessage(`Error: ${{error.message}}`, 'error');
-            }}
-        }}
-        </script>
-    </body>
-    </html>
+def stream_template(template, **context):
     """
+    Render a template incrementally, yielding chunks of about STREAM_CHUNK_SIZE.
 
-    return HTMLResponse(content=html)
+    The first chunk ships while later rows are still rendering, and the
+    page is never held in memory whole. Template output pieces are small,
+    so they are grouped rather than sent one by one.
+    """
+    buffer = []
+    size = 0
+    for piece in template.generate(**context):
+        buffer.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+# (rink_id, name) pairs -> rendered <option> list, reused until rinks change
+_rink_options_cache: tuple[tuple, Markup] = ((), Markup(""))
+
+
+def render_rink_options(rinks) -> Markup:
+    """Render the rink <option> list, reusing the last result if rinks are unchanged."""
+    global _rink_options_cache
+    key = tuple((r["rink_id"], r["name"]) for r in rinks)
+    if key != _rink_options_cache[0]:
+        options = Markup("").join(
+            Markup('<option value="{0}">{1} ({0})</option>').format(rink_id, name)
+            for rink_id, name in key
+        )
+        _rink_options_cache = (key, options)
+    return _rink_options_cache[1]
 
 
-@app.post("/admin/devices")
-async def create_device(request: CreateDeviceRequest):
+@app.get("/admin/devices")
+def list_devices(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
     """
-    Manually register a new device.
+    List all registered devices and their assignments.
 
-    This allows pre-registering devices before they connect.
-    If rink_id and sheet_name are provided, the device will be marked as assigned.
+    Returns HTML admin UI by default, or JSON if format=json is specified.
     """
-    logger.info(f"Creating device {request.device_id}")
-
-    db = get_db()
-    current_time = int(time.time())
-
-    # Check if device already exists
-    existing = db.execute(
-        "SELECT device_id FROM devices WHERE device_id = ?",
-        (request.device_id,)
-    ).fetchone()
-
-    if existing:
-        db.close()
-        raise HTTPException(
-            status_code=409,
-            detail=f"Device {request.device_id} already exists. Use PUT to update it."
-        )
-
-    # Validate rink_id if provided
-    if request.rink_id:
-        rink = db.execute("SELECT rink_id FROM rinks WHERE rink_id = ?", (request.rink_id,)).fetchone()
-        if not rink:
-            db.close()
-            raise HTTPException(status_code=404, detail=f"Rink {request.rink_id} not found")
+    with get_read_db() as db:
+        devices = db.execute("""
+            SELECT device_id, rink_id, sheet_name, device_name, is_assigned,
+                   first_seen_at, last_seen_at, notes
+            FROM devices
+            ORDER BY last_seen_at DESC
+        """).fetchall()
 
-    # Determine if device should be marked as assigned
-    is_assigned = 1 if (request.rink_id and request.sheet_name) else 0
+        # Get available rinks for dropdown
+        rinks = db.execute("SELECT rink_id, name FROM rinks ORDER BY name").fetchall()
 
-    # Insert device
-    db.execute("""
-        INSERT INTO devices (
-            device_id, rink_id, sheet_name, device_name, is_assigned,
-            first_seen_at, last_seen_at, notes
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        request.device_id,
-        request.rink_id,
-        request.sheet_name,
-        request.device_name,
-        is_assigned,
-        current_time,
-        current_time,
-        request.notes
-    ))
+    device_list = [
+        {
+            "device_id": d["device_id"],
+            "rink_id": d["rink_id"],
+            "sheet_name": d["sheet_name"],
+            "device_name": d["device_name"],
+            "is_assigned": bool(d["is_assigned"]),
+            "first_seen_at": d["first_seen_at"],
+            "last_seen_at": d["last_seen_at"],
+            "notes": d["notes"]
+        }
+        for d in devices
+    ]
 
-    db.commit()
+    # Return JSON if requested
+    if format == "json":
+        return DeviceListResponse.model_validate({"devices": device_list})
+
+    # Return HTML admin UI
+    rink_options = render_rink_options(rinks)
+
+    def render():
+        yield DEVICES_HTML_HEAD
+        for d in device_list:
+            yield DEVICE_ROW_TEMPLATE.render(
+                d=d,
+                rink_options=rink_options,
+                last_seen=format_timestamp(d["last_seen_at"], with_seconds=True, empty="Never"),
+            )
+        yield DEVICES_HTML_TAIL
 
-    # Fetch created device
-    created = db.execute("""
-        SELECT device_id, rink_id, sheet_name, device_name, is_assigned,
-               first_seen_at, last_seen_at, notes
-        FROM devices
-        WHERE device_id = ?
-    """, (request.device_id,)).fetchone()
+    # Stream header, rows and footer as chunks instead of one large string
+    return StreamingResponse(render(), media_type="text/html")
 
-    db.close()
+
+@app.post("/admin/devices")
+def create_device(request: CreateDeviceRequest):
+    """
+    Manually register a new device.
+
+    This allows pre-registering devices before they connect.
+    If rink_id and sheet_name are provided, the device will be marked as assigned.
+    """
+    logger.info(f"Creating device {request.device_id}")
+
+    current_time = int(time.time())
+
+    # Determine if device should be marked as assigned
+    is_assigned = 1 if (request.rink_id and request.sheet_name) else 0
+
+    with get_write_db() as db:
+        # Validate rink_id if provided
+        if request.rink_id:
+            rink = db.execute(RINK_EXISTS_SQL, (request.rink_id,)).fetchone()
+            if not rink:
+                raise HTTPException(status_code=404, detail=f"Rink {request.rink_id} not found")
+
+        # Insert device, echoing the stored row; an existing device yields no row
+        created = db.execute("""
+            INSERT INTO devices (
+                device_id, rink_id, sheet_name, device_name, is_assigned,
+                first_seen_at, last_seen_at, notes
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(device_id) DO NOTHING
+            RETURNING device_id, rink_id, sheet_name, device_name, is_assigned,
+                      first_seen_at, last_seen_at, notes
+        """, (
+            request.device_id,
+            request.rink_id,
+            request.sheet_name,
+            request.device_name,
+            is_assigned,
+            current_time,
+            current_time,
+            request.notes
+        )).fetchone()
+
+    if not created:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Device {request.device_id} already exists. Use PUT to update it."
+        )
 
     logger.info(f"Successfully created device {request.device_id}")
 
     return {
         "status": "ok",
         "message": f"Device {request.device_id} created",
-        "device": DeviceInfo(
-            device_id=created["device_id"],
-            rink_id=created["rink_id"],
-            sheet_name=created["sheet_name"],
-            device_name=created["device_name"],
-            is_assigned=bool(created["is_assigned"]),
-            first_seen_at=created["first_seen_at"],
-            last_seen_at=created["last_seen_at"],
-            notes=created["notes"]
-        )
+        "device": DeviceInfo.model_validate(dict(created))
     }
 
 
 @app.get("/admin/devices/{device_id}", response_model=DeviceInfo)
-async def get_device(device_id: str):
+def get_device(device_id: str):
     """Get details for a specific device."""
-    db = get_db()
-
-    device = db.execute("""
-        SELECT device_id, rink_id, sheet_name, device_name, is_assigned,
-               first_seen_at, last_seen_at, notes
-        FROM devices
-        WHERE device_id = ?
-    """, (device_id,)).fetchone()
-
-    db.close()
+    with get_read_db() as db:
+        device = db.execute("""
+            SELECT device_id, rink_id, sheet_name, device_name, is_assigned,
+                   first_seen_at, last_seen_at, notes
+            FROM devices
+            WHERE device_id = ?
+        """, (device_id,)).fetchone()
 
     if not device:
         raise HTTPException(status_code=404, detail=f"Device {device_id} not found")
 
-    return DeviceInfo(
-        device_id=device["device_id"],
-        rink_id=device["rink_id"],
-        sheet_name=device["sheet_name"],
-        device_name=device["device_name"],
-        is_assigned=bool(device["is_assigned"]),
-        first_seen_at=device["first_seen_at"],
-        last_seen_at=device["last_seen_at"],
-        notes=device["notes"]
-    )
+    return DeviceInfo.model_validate(dict(device))
 
 
 @app.put("/admin/devices/{device_id}")
-async def update_device(device_id: str, request: UpdateDeviceRequest):
+def update_device(device_id: str, request: UpdateDeviceRequest):
     """
     Update a device's assignment and details.
 
@@ -980,114 +1290,49 @@ async def update_device(device_id: str, request: UpdateDeviceRequest):
     """
     logger.info(f"Updating device {device_id}")
 
-    db = get_db()
+    changes = request.model_dump()
+    with get_write_db() as db:
+        if request.rink_id is not None:
+            # Validate rink exists
+            rink = db.execute(RINK_EXISTS_SQL, (request.rink_id,)).fetchone()
+            if not rink:
+                raise HTTPException(status_code=404, detail=f"Rink {request.rink_id} not found")
 
-    # Check if device exists
-    device = db.execute(
-        "SELECT device_id FROM devices WHERE device_id = ?",
-        (device_id,)
-    ).fetchone()
+        updated = db.execute(DEVICE_UPDATE_SQL, {**changes, "device_id": device_id}).fetchone()
 
-    if not device:
-        db.close()
+    if updated is None:
         raise HTTPException(status_code=404, detail=f"Device {device_id} not found. Device must connect at least once before assignment.")
 
-    # Build update query dynamically based on provided fields
-    updates = []
-    params = []
-
-    if request.rink_id is not None:
-        # Validate rink exists
-        rink = db.execute("SELECT rink_id FROM rinks WHERE rink_id = ?", (request.rink_id,)).fetchone()
-        if not rink:
-            db.close()
-            raise HTTPException(status_code=404, detail=f"Rink {request.rink_id} not found")
-        updates.append("rink_id = ?")
-        params.append(request.rink_id)
-
-    if request.sheet_name is not None:
-        updates.append("sheet_name = ?")
-        params.append(request.sheet_name)
-
-    if request.device_name is not None:
-        updates.append("device_name = ?")
-        params.append(request.device_name)
-
-    if request.notes is not None:
-        updates.append("notes = ?")
-        params.append(request.notes)
-
-    # If rink_id and sheet_name are both provided, mark as assigned
-    if request.rink_id is not None and request.sheet_name is not None:
-        updates.append("is_assigned = 1")
-
-    if not updates:
-        db.close()
+    if all(value is None for value in changes.values()):
         return {"status": "ok", "message": "No changes requested"}
 
-    # Execute update
-    params.append(device_id)
-    query = f"UPDATE devices SET {', '.join(updates)} WHERE device_id = ?"
-    db.execute(query, params)
-    db.commit()
-
-    # Fetch updated device
-    updated = db.execute("""
-        SELECT device_id, rink_id, sheet_name, device_name, is_assigned,
-               first_seen_at, last_seen_at, notes
-        FROM devices
-        WHERE device_id = ?
-    """, (device_id,)).fetchone()
-
-    db.close()
-
     logger.info(f"Successfully updated device {device_id}")
 
     return {
         "status": "ok",
         "message": f"Device {device_id} updated",
-        "device": DeviceInfo(
-            device_id=updated["device_id"],
-            rink_id=updated["rink_id"],
-            sheet_name=updated["sheet_name"],
-            device_name=updated["device_name"],
-            is_assigned=bool(updated["is_assigned"]),
-            first_seen_at=updated["first_seen_at"],
-            last_seen_at=updated["last_seen_at"],
-            notes=updated["notes"]
-        )
+        "device": DeviceInfo.model_validate(dict(updated))
     }
 
 
 @app.delete("/admin/devices/{device_id}/assignment")
-async def unassign_device(device_id: str):
+def unassign_device(device_id: str):
     """Clear a device's assignment (unassign from rink and sheet)."""
     logger.info(f"Unassigning device {device_id}")
 
-    db = get_db()
-
-    # Check if device exists
-    device = db.execute(
-        "SELECT device_id FROM devices WHERE device_id = ?",
-        (device_id,)
-    ).fetchone()
+    with get_write_db() as db:
+        device = db.execute("""
+            UPDATE devices
+            SET rink_id = NULL,
+                sheet_name = NULL,
+                is_assigned = 0
+            WHERE device_id = ?
+            RETURNING device_id
+        """, (device_id,)).fetchone()
 
     if not device:
-        db.close()
         raise HTTPException(status_code=404, detail=f"Device {device_id} not found")
 
-    # Unassign the device
-    db.execute("""
-        UPDATE devices
-        SET rink_id = NULL,
-            sheet_name = NULL,
-            is_assigned = 0
-        WHERE device_id = ?
-    """, (device_id,))
-
-    db.commit()
-    db.close()
-
     logger.info(f"Successfully unassigned device {device_id}")
 
     return {
@@ -1097,28 +1342,19 @@ async def unassign_device(device_id: str):
 
 
 @app.delete("/admin/devices/{device_id}")
-async def delete_device(device_id: str):
+def delete_device(device_id: str):
     """Completely delete a device from the database."""
     logger.info(f"Deleting device {device_id}")
 
-    db = get_db()
-
-    # Check if device exists
-    device = db.execute(
-        "SELECT device_id FROM devices WHERE device_id = ?",
-        (device_id,)
-    ).fetchone()
+    with get_write_db() as db:
+        device = db.execute(
+            "DELETE FROM devices WHERE device_id = ? RETURNING device_id",
+            (device_id,)
+        ).fetchone()
 
     if not device:
-        db.close()
         raise HTTPException(status_code=404, detail=f"Device {device_id} not found")
 
-    # Delete the device (this will cascade delete deliveries if we had FK constraints)
-    db.execute("DELETE FROM devices WHERE device_id = ?", (device_id,))
-
-    db.commit()
-    db.close()
-
     logger.info(f"Successfully deleted device {device_id}")
 
     return {
@@ -1129,9 +1365,9 @@ async def delete_device(device_id: str):
 
 # Keep legacy endpoints for backwards compatibility
 @app.post("/admin/devices/{device_id}/assign")
-async def assign_device_legacy(device_id: str, request: AssignDeviceRequest):
+def assign_device_legacy(device_id: str, request: AssignDeviceRequest):
     """Legacy endpoint - use PUT /admin/devices/{device_id} instead."""
-    return await update_device(device_id, UpdateDeviceRequest(
+    return update_device(device_id, UpdateDeviceRequest(
         rink_id=request.rink_id,
         sheet_name=request.sheet_name,
         device_name=request.device_name,
@@ -1140,234 +1376,254 @@ async def assign_device_legacy(device_id: str, request: AssignDeviceRequest):
 
 
 @app.get("/admin/heartbeats/latest")
-async def get_latest_heartbeats():
+def get_latest_heartbeats():
     """Get latest heartbeat from each device for monitoring."""
-    db = get_db()
-
-    # Get latest heartbeat per device
-    heartbeats = db.execute("""
-        SELECT h1.*
-        FROM heartbeats h1
-        INNER JOIN (
-            SELECT device_id, MAX(received_at) as max_time
-            FROM heartbeats
-            GROUP BY device_id
-        ) h2 ON h1.device_id = h2.device_id AND h1.received_at = h2.max_time
-        ORDER BY h1.received_at DESC
-    """).fetchall()
-
-    db.close()
+    # Include heartbeats still waiting in the buffer
+    try:
+        flush_heartbeats()
+    except sqlite3.Error as e:
+        # Serve what is already committed; the rows stay buffered for the next flush
+        logger.error(f"Failed to flush heartbeats: {e}")
+
+    # One seek per device on idx_heartbeats_device(device_id, received_at DESC)
+    # instead of ranking every row; ties on received_at resolve to the newest row.
+    with get_read_db() as db:
+        heartbeats = fetch_dicts(db.execute("""
+            SELECT h.id, h.device_id, h.current_game_id, h.game_state, h.clock_running,
+                   h.clock_value_ms, h.last_event_seq, h.app_version, h.ts_local, h.received_at
+            FROM (SELECT DISTINCT device_id FROM heartbeats) d
+            JOIN heartbeats h ON h.id = (
+                SELECT id FROM heartbeats
+                WHERE device_id = d.device_id
+                ORDER BY received_at DESC, id DESC
+                LIMIT 1
+            )
+            ORDER BY h.received_at DESC
+        """))
 
-    return {
-        "heartbeats": [dict(h) for h in heartbeats]
-    }
+    return json_response({
+        "heartbeats": heartbeats
+    })
+
+
+EVENTS_PAGE_SIZE = 200  # default rows per /admin/events page
+EVENT_PAYLOAD_PREVIEW = 50  # payload characters listed per event; the rest is fetched on demand
+
+# Columns listed on the events page; payloads are cut down to a preview in SQLite
+EVENT_LIST_COLUMNS = f"""
+    id, game_id, device_id, session_id, event_id, seq, type, ts_local,
+    substr(payload, 1, {EVENT_PAYLOAD_PREVIEW}) AS payload_preview,
+    length(payload) AS payload_length, received_at
+"""
+
+# Selected over one page of events (newest first) to build the complete
+# JSON response; a full page links to the next via its oldest id
+EVENTS_JSON = f"""
+    json_object(
+        'event_count', count(*),
+        'next_before_id', CASE WHEN count(*) = :limit THEN min(id) END,
+        'events', {json_rows_sql((
+            "id", "game_id", "device_id", "session_id", "event_id", "seq", "type",
+            "ts_local", "payload_preview", "payload_length", "received_at",
+        ))}
+    )
+"""
+
+# Static shell of the events page; admin_events.js fetches ?format=json and renders rows
+EVENTS_HTML = minify_html(f'''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>score-cloud | Events</title>
+    <link rel="stylesheet" href="/static/admin.css">
+    <style>
+        .event-id {{ font-family: monospace; font-size: 0.9em; }}
+        .game-id {{ font-family: monospace; font-size: 0.85em; max-width: 150px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }}
+        .device-id {{ font-family: monospace; font-size: 0.85em; }}
+        .session-id {{ font-family: monospace; font-size: 0.85em; color: #666; }}
+        .event-type {{
+            display: inline-block;
+            padding: 2px 8px;
+            background: #e8f4fc;
+            border-radius: 4px;
+            font-size: 0.85em;
+            font-weight: 500;
+            color: #1565c0;
+        }}
+        .payload {{
+            font-family: monospace;
+            font-size: 0.8em;
+            max-width: 200px;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+            color: #666;
+        }}
+        .payload:hover {{
+            cursor: help;
+        }}
+    </style>
+    <script src="/static/admin_tables.js" defer></script>
+    <script src="/static/admin_events.js" defer></script>
+</head>
+<body>
+    {admin_nav("events")}
+    <div class="container wide">
+        <h1>Events</h1>
+        <div class="content overflow">
+            <div class="hint">
+                Showing <span id="eventCount">0</span> events, newest first. Hover over payload to see full content.
+                <a id="olderLink" hidden>Older events &rarr;</a>
+            </div>
+
+            <table id="eventsTable" class="wide">
+                <thead>
+                    <tr>
+                        <th>ID</th>
+                        <th>Game ID</th>
+                        <th>Device ID</th>
+                        <th>Session</th>
+                        <th>Seq</th>
+                        <th>Type</th>
+                        <th>Local Time</th>
+                        <th>Payload</th>
+                        <th>Received</th>
+                    </tr>
+                    <tr class="filter-row">
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('eventsTable')"></td>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr><td colspan="9" class="empty">Loading events...</td></tr>
+                </tbody>
+            </table>
+        </div>
+    </div>
+</body>
+</html>
+''').encode("utf-8")
 
 
 @app.get("/admin/events")
-async def list_events_admin(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
+def list_events_admin(
+    format: FormatQuery = None,
+    before_id: Optional[int] = Query(None, ge=1, description="Only events with a smaller id (next page)"),
+    limit: int = Query(EVENTS_PAGE_SIZE, ge=1, le=1000, description="Maximum events to return"),
+    game_id: Optional[str] = Query(None, description="Only events for this game"),
+    device_id: Optional[str] = Query(None, description="Only events from this device"),
+    event_type: Optional[str] = Query(None, alias="type", description="Only events of this type"),
+):
     """
-    Admin page to view all received events with column filters.
+    Admin page to view received events with column filters.
 
-    Returns HTML for browser viewing or JSON if format=json parameter is provided.
+    Events are paged newest first by id (keyset pagination on the rowid);
+    pass next_before_id back as before_id for the next page. game_id,
+    device_id and type filter on the server before paging. Each event
+    carries a payload_preview and payload_length; the full payload is at
+    /admin/events/{id}/payload.
+
+    Browsers get a static page shell that fetches the JSON view
+    (format=json) and renders the rows client-side.
     """
-    from fastapi.responses import HTMLResponse
+    if format != "json":
+        return HTMLResponse(content=EVENTS_HTML)
 
-    db = get_db()
+    filters = {"game_id": game_id, "device_id": device_id, "type": event_type}
+    params = {column: value for column, value in filters.items() if value is not None}
+    conditions = [f"{column} = :{column}" for column in params]
+    if before_id is not None:
+        conditions.append("id < :before_id")
+        params["before_id"] = before_id
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-    events = db.execute("""
-        SELECT * FROM received_events
-        ORDER BY received_at DESC, seq DESC
-        LIMIT 1000
-    """).fetchall()
+    page = f"SELECT {EVENT_LIST_COLUMNS} FROM received_events {where} ORDER BY id DESC LIMIT :limit"
 
-    db.close()
+    # SQLite builds the whole response body; no per-row Python objects
+    with get_read_db() as db:
+        body = db.execute(f"SELECT {EVENTS_JSON} FROM ({page})", {**params, "limit": limit}).fetchone()[0]
 
-    events_list = [dict(e) for e in events]
+    return Response(content=body, media_type="application/json")
 
-    # Return JSON if requested
-    if format == "json":
-        return {"event_count": len(events_list), "events": events_list}
-
-    # Generate HTML view
-    import datetime
-
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
-        return "-"
-
-    def truncate_payload(payload, max_len=50):
-        if not payload:
-            return "-"
-        if len(payload) > max_len:
-            return payload[:max_len] + "..."
-        return payload
-
-    rows_html = ""
-    if not events_list:
-        rows_html = '<tr><td colspan="9" style="text-align: center; color: #666; padding: 40px;">No events found.</td></tr>'
-    else:
-        for e in events_list:
-            rows_html += f'''
-            <tr>
-                <td class="event-id">{e["id"]}</td>
-                <td class="game-id">{e["game_id"]}</td>
-                <td class="device-id">{e["device_id"]}</td>
-                <td class="session-id">{e["session_id"][:8] if e["session_id"] else "-"}...</td>
-                <td>{e["seq"]}</td>
-                <td><span class="event-type">{e["type"]}</span></td>
-                <td class="timestamp">{e["ts_local"]}</td>
-                <td class="payload" title="{e["payload"] or ""}">{truncate_payload(e["payload"])}</td>
-                <td class="timestamp">{format_timestamp(e["received_at"])}</td>
-            </tr>'''
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Events</title>
-        <link rel="stylesheet" href="/static/admin.css">
-        <style>
-            .event-id {{ font-family: monospace; font-size: 0.9em; }}
-            .game-id {{ font-family: monospace; font-size: 0.85em; max-width: 150px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }}
-            .device-id {{ font-family: monospace; font-size: 0.85em; }}
-            .session-id {{ font-family: monospace; font-size: 0.85em; color: #666; }}
-            .event-type {{
-                display: inline-block;
-                padding: 2px 8px;
-                background: #e8f4fc;
-                border-radius: 4px;
-                font-size: 0.85em;
-                font-weight: 500;
-                color: #1565c0;
-            }}
-            .payload {{
-                font-family: monospace;
-                font-size: 0.8em;
-                max-width: 200px;
-                overflow: hidden;
-                text-overflow: ellipsis;
-                white-space: nowrap;
-                color: #666;
-            }}
-            .payload:hover {{
-                cursor: help;
-            }}
-        </style>
-    </head>
-    <body>
-        {admin_nav("events")}
-        <div class="container wide">
-            <h1>Events</h1>
-            <div class="content overflow">
-                <div class="hint">
-                    Showing most recent 1000 events received from devices. Hover over payload to see full content.
-                </div>
 
-                <table id="eventsTable" class="wide">
-                    <thead>
-                        <tr>
-                            <th>ID</th>
-                            <th>Game ID</th>
-                            <th>Device ID</th>
-                            <th>Session</th>
-                            <th>Seq</th>
-                            <th>Type</th>
-                            <th>Local Time</th>
-                            <th>Payload</th>
-                            <th>Received</th>
-                        </tr>
-                        <tr class="filter-row">
-                            <td><input type="text" id="filterId" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterGameId" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterDeviceId" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterSession" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterSeq" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterType" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterLocalTime" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterPayload" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterReceived" placeholder="Filter..." onkeyup="filterTable()"></td>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {rows_html}
-                    </tbody>
-                </table>
-            </div>
-        </div>
+@app.get("/admin/events/{event_id}/payload")
+def get_event_payload(event_id: int):
+    """Get the full JSON payload of one received event."""
+    with get_read_db() as db:
+        event = db.execute(
+            "SELECT payload FROM received_events WHERE id = ?",
+            (event_id,)
+        ).fetchone()
 
-        <script>
-        function filterTable() {{
-            const filters = {{
-                id: document.getElementById('filterId').value.toLowerCase(),
-                gameId: document.getElementById('filterGameId').value.toLowerCase(),
-                deviceId: document.getElementById('filterDeviceId').value.toLowerCase(),
-                session: document.getElementById('filterSession').value.toLowerCase(),
-                seq: document.getElementById('filterSeq').value.toLowerCase(),
-                type: document.getElementById('filterType').value.toLowerCase(),
-                localTime: document.getElementById('filterLocalTime').value.toLowerCase(),
-                payload: document.getElementById('filterPayload').value.toLowerCase(),
-                received: document.getElementById('filterReceived').value.toLowerCase()
-            }};
-
-            const rows = document.querySelectorAll('#eventsTable tbody tr');
-
-            rows.forEach(row => {{
-                if (row.cells.length < 9) return; // Skip empty row
-
-                const id = row.cells[0].textContent.toLowerCase();
-                const gameId = row.cells[1].textContent.toLowerCase();
-                const deviceId = row.cells[2].textContent.toLowerCase();
-                const session = row.cells[3].textContent.toLowerCase();
-                const seq = row.cells[4].textContent.toLowerCase();
-                const type = row.cells[5].textContent.toLowerCase();
-                const localTime = row.cells[6].textContent.toLowerCase();
-                const payload = row.cells[7].getAttribute('title')?.toLowerCase() || row.cells[7].textContent.toLowerCase();
-                const received = row.cells[8].textContent.toLowerCase();
-
-                const match =
-                    id.includes(filters.id) &&
-                    gameId.includes(filters.gameId) &&
-                    deviceId.includes(filters.deviceId) &&
-                    session.includes(filters.session) &&
-                    seq.includes(filters.seq) &&
-                    type.includes(filters.type) &&
-                    localTime.includes(filters.localTime) &&
-                    payload.includes(filters.payload) &&
-                    received.includes(filters.received);
-
-                row.style.display = match ? '' : 'none';
-            }});
-        }}
-        </script>
-    </body>
-    </html>
-    '''
+    if not event:
+        raise HTTPException(status_code=404, detail=f"Event {event_id} not found")
 
-    return HTMLResponse(content=html)
+    # Stored as JSON text already; pass it through without re-encoding
+    return Response(content=event["payload"], media_type="application/json")
 
 
 @app.get("/admin/events/{game_id}")
-async def get_game_events(game_id: str):
+def get_game_events(game_id: GameIdPath):
     """Get all events for a specific game."""
-    db = get_db()
+    with get_read_db() as db:
+        events = fetch_dicts(db.execute("""
+            SELECT id, game_id, device_id, session_id, event_id, seq, type,
+                   ts_local, payload, received_at
+            FROM received_events
+            WHERE game_id = ?
+            ORDER BY seq
+        """, (game_id,)))
 
-    events = db.execute("""
-        SELECT * FROM received_events
-        WHERE game_id = ?
-        ORDER BY seq
-    """, (game_id,)).fetchall()
+    return json_response({
+        "game_id": game_id,
+        "event_count": len(events),
+        "events": events
+    })
 
-    db.close()
 
+def _game_state_summary(game, result):
+    """Combine game metadata and replayed state into the admin summary dict."""
     return {
-        "game_id": game_id,
-        "event_count": len(events),
-        "events": [dict(e) for e in events]
+        "game_id": game["game_id"],
+        "home_team": game["home_team"],
+        "away_team": game["away_team"],
+        "start_time": game["start_time"],
+        "period_length_min": game["period_length_min"],
+        "clock_seconds": result["seconds"],
+        "clock_running": result["running"],
+        "home_score": result.get("home_score", 0),
+        "away_score": result.get("away_score", 0),
+        "event_count": result["num_events"],
+        "last_update": result["last_update"]
     }
 
 
+# ---------- Game state cache ----------
+# game_id -> ((event count, max seq, max id), replayed state).
+# Replay is deterministic, so a state stays valid until the game's event
+# log changes, which always moves this key: ids only grow, so any new
+# event raises max id.
+GAME_STATE_CACHE: dict[str, tuple[tuple, dict]] = {}
+
+# Every column is in idx_received_events_game_seq (id is its rowid), so
+# this is a covering index scan that never touches the table rows
+EVENT_LOG_KEYS_SQL = """
+    SELECT game_id, COUNT(*) AS num_events, MAX(seq) AS max_seq, MAX(id) AS max_id
+    FROM received_events
+"""
+
+
+def _event_log_key(row) -> tuple:
+    return (row["num_events"], row["max_seq"], row["max_id"])
+
+
 def reconstruct_game_state(game_id: str):
     """
     Reconstruct game state from received events.
@@ -1380,589 +1636,382 @@ def reconstruct_game_state(game_id: str):
     """
     from score.state import load_game_state_from_db
 
-    db = get_db()
-
-    # Get game metadata
-    game = db.execute(
-        "SELECT * FROM games WHERE game_id = ?",
-        (game_id,)
-    ).fetchone()
+    # Game metadata and the event log come from one pooled connection
+    with get_read_db() as db:
+        game = db.execute(
+            "SELECT * FROM games WHERE game_id = ?",
+            (game_id,)
+        ).fetchone()
 
-    if not game:
-        db.close()
-        return None
+        if not game:
+            return None
 
-    db.close()
-
-    # Use shared replay logic
-    result = load_game_state_from_db(CLOUD_DB_PATH, game_id)
+        key = _event_log_key(db.execute(EVENT_LOG_KEYS_SQL + " WHERE game_id = ?", (game_id,)).fetchone())
+        cached = GAME_STATE_CACHE.get(game_id)
+        if cached and cached[0] == key:
+            result = cached[1]
+        else:
+            # Use shared replay logic
+            result = load_game_state_from_db(CLOUD_DB_PATH, game_id, conn=db)
+            GAME_STATE_CACHE[game_id] = (key, result)
 
-    return {
-        "game_id": game_id,
-        "home_team": game["home_team"],
-        "away_team": game["away_team"],
-        "start_time": game["start_time"],
-        "period_length_min": game["period_length_min"],
-        "clock_seconds": result["seconds"],
-        "clock_running": result["running"],
-        "home_score": result.get("home_score", 0),
-        "away_score": result.get("away_score", 0),
-        "event_count": result["num_events"],
-        "last_update": result["last_update"]
-    }
+    return _game_state_summary(game, result)
 
 
-@app.get("/admin/games/state")
-async def get_all_game_states(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
+def reconstruct_all_game_states():
     """
-    Get current state of all games based on received events.
+    Reconstruct state for all games with one games query and one event scan.
 
-    This endpoint reconstructs game state by replaying all events for each game.
-    Returns HTML for browser viewing or JSON if format=json parameter is provided.
+    Returns:
+        list of game state dicts ordered by start time
     """
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
+    from score.state import load_all_game_states_from_db, replay_events
+
+    with get_read_db() as db:
+        games = db.execute("""
+            SELECT game_id, home_team, away_team, start_time, period_length_min
+            FROM games
+            ORDER BY start_time
+        """).fetchall()
+        keys = {
+            row["game_id"]: _event_log_key(row)
+            for row in db.execute(EVENT_LOG_KEYS_SQL + " GROUP BY game_id")
+        }
 
-    # Get all games
-    games = db.execute("SELECT game_id FROM games ORDER BY start_time").fetchall()
+        # Only replay games whose event log changed since they were cached
+        stale = [
+            game_id for game_id, key in keys.items()
+            if GAME_STATE_CACHE.get(game_id, (None,))[0] != key
+        ]
+        if stale:
+            states = load_all_game_states_from_db(CLOUD_DB_PATH, conn=db, game_ids=stale)
+            for game_id, result in states.items():
+                GAME_STATE_CACHE[game_id] = (keys[game_id], result)
 
-    db.close()
+    # Drop entries for games whose events are gone
+    for game_id in GAME_STATE_CACHE.keys() - keys.keys():
+        GAME_STATE_CACHE.pop(game_id, None)
 
     game_states = []
-    for game_row in games:
-        game_id = game_row["game_id"]
-        state = reconstruct_game_state(game_id)
-        if state:
-            game_states.append(state)
+    for game in games:
+        cached = GAME_STATE_CACHE.get(game["game_id"])
+        result = cached[1] if cached else None
+        if result is None:
+            # No events received yet: replay the empty log for default state
+            result = replay_events([])
+            result["num_events"] = 0
+        game_states.append(_game_state_summary(game, result))
 
-    # Return JSON if requested
-    if format == "json":
-        return {
-            "game_count": len(game_states),
-            "games": game_states
-        }
+    return game_states
 
-    # Generate HTML view with JavaScript auto-update
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Games</title>
-        <link rel="stylesheet" href="/static/admin.css">
-    </head>
-    <body>
-        {admin_nav("games")}
-        <div class="container">
-            <h1>Games</h1>
-            <div class="content">
-                <table id="gamesTable">
-                    <thead>
-                        <tr>
-                            <th style="width: 12%;">Game ID</th>
-                            <th style="width: 12%;">Game Date</th>
-                            <th style="width: 26%;">Teams</th>
-                            <th style="width: 10%;">Score</th>
-                            <th style="width: 12%;">Clock</th>
-                            <th style="width: 10%;">Status</th>
-                            <th style="width: 13%;">Period Length</th>
-                        </tr>
-                        <tr class="filter-row">
-                            <td><input type="text" id="filterGameId" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterGameDate" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterTeams" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterScore" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterClock" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterStatus" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterPeriod" placeholder="Filter..." onkeyup="filterTable()"></td>
-                        </tr>
-                    </thead>
-                    <tbody id="gamesBody">
-                        <tr>
-                            <td colspan="7" class="no-games">Loading...</td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-        </div>
 
-        <script>
-        function formatClock(seconds) {{
-            const mins = Math.floor(seconds / 60);
-            const secs = seconds % 60;
-            return `${{mins}}:${{secs.toString().padStart(2, '0')}}`;
-        }}
+# Static games page; rows are fetched client-side from ?format=json
+GAME_STATES_HTML = minify_html(f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>score-cloud | Games</title>
+    <link rel="stylesheet" href="/static/admin.css">
+    <script src="/static/admin_tables.js" defer></script>
+    <script src="/static/admin_games.js" defer></script>
+</head>
+<body>
+    {admin_nav("games")}
+    <div class="container">
+        <h1>Games</h1>
+        <div class="content">
+            <table id="gamesTable">
+                <thead>
+                    <tr>
+                        <th style="width: 12%;">Game ID</th>
+                        <th style="width: 12%;">Game Date</th>
+                        <th style="width: 26%;">Teams</th>
+                        <th style="width: 10%;">Score</th>
+                        <th style="width: 12%;">Clock</th>
+                        <th style="width: 10%;">Status</th>
+                        <th style="width: 13%;">Period Length</th>
+                    </tr>
+                    <tr class="filter-row">
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('gamesTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('gamesTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('gamesTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('gamesTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('gamesTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('gamesTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('gamesTable')"></td>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td colspan="7" class="empty">Loading...</td>
+                    </tr>
+                </tbody>
+            </table>
+        </div>
+    </div>
+</body>
+</html>
+""").encode("utf-8")
 
-        function filterTable() {{
-            const filters = {{
-                gameId: document.getElementById('filterGameId').value.toLowerCase(),
-                gameDate: document.getElementById('filterGameDate').value.toLowerCase(),
-                teams: document.getElementById('filterTeams').value.toLowerCase(),
-                score: document.getElementById('filterScore').value.toLowerCase(),
-                clock: document.getElementById('filterClock').value.toLowerCase(),
-                status: document.getElementById('filterStatus').value.toLowerCase(),
-                period: document.getElementById('filterPeriod').value.toLowerCase()
-            }};
-
-            const tbody = document.getElementById('gamesBody');
-            const rows = tbody.getElementsByTagName('tr');
-
-            for (let i = 0; i < rows.length; i++) {{
-                const cells = rows[i].getElementsByTagName('td');
-                if (cells.length < 7) continue; // Skip "no games" row
-
-                const gameId = cells[0].textContent.toLowerCase();
-                const gameDate = cells[1].textContent.toLowerCase();
-                const teams = cells[2].textContent.toLowerCase();
-                const score = cells[3].textContent.toLowerCase();
-                const clock = cells[4].textContent.toLowerCase();
-                const status = cells[5].textContent.toLowerCase();
-                const period = cells[6].textContent.toLowerCase();
-
-                const match =
-                    gameId.includes(filters.gameId) &&
-                    gameDate.includes(filters.gameDate) &&
-                    teams.includes(filters.teams) &&
-                    score.includes(filters.score) &&
-                    clock.includes(filters.clock) &&
-                    status.includes(filters.status) &&
-                    period.includes(filters.period);
-
-                rows[i].style.display = match ? '' : 'none';
-            }}
-        }}
 
-        function updateGameStates() {{
-            fetch('/admin/games/state?format=json')
-                .then(response => response.json())
-                .then(data => {{
-                    const tbody = document.getElementById('gamesBody');
-
-                    if (data.games.length === 0) {{
-                        tbody.innerHTML = '<tr><td colspan="7" class="no-games">No games found</td></tr>';
-                        return;
-                    }}
-
-                    let html = '';
-                    data.games.forEach(game => {{
-                        const status = game.clock_running ? 'running' : 'paused';
-                        const statusText = game.clock_running ? 'Running' : 'Paused';
-                        const clock = formatClock(game.clock_seconds);
-                        const score = `${{game.home_score}} - ${{game.away_score}}`;
-                        // Convert UTC timestamp to local date (handles timezone offset)
-                        const startTime = new Date(game.start_time);
-                        const gameDate = startTime.toLocaleDateString('en-CA'); // YYYY-MM-DD format
-
-                        html += `
-                            <tr>
-                                <td class="game-id">${{game.game_id}}</td>
-                                <td>${{gameDate}}</td>
-                                <td>${{game.home_team}} vs ${{game.away_team}}</td>
-                                <td><strong>${{score}}</strong></td>
-                                <td class="clock">${{clock}}</td>
-                                <td><span class="status ${{status}}">${{statusText}}</span></td>
-                                <td>${{game.period_length_min}} min</td>
-                            </tr>
-                        `;
-                    }});
-
-                    tbody.innerHTML = html;
-                }})
-                .catch(error => {{
-                    console.error('Error fetching game states:', error);
-                }});
-        }}
+@app.get("/admin/games/state")
+async def get_all_game_states(format: FormatQuery = None):
+    """
+    Get current state of all games based on received events.
 
-        // Load game states on page load
-        updateGameStates();
-        </script>
-    </body>
-    </html>
+    This endpoint reconstructs game state by replaying all events in a single scan.
+    Returns HTML for browser viewing or JSON if format=json parameter is provided.
     """
+    # The HTML page is static; the browser fetches state via ?format=json
+    if format != "json":
+        return HTMLResponse(content=GAME_STATES_HTML)
 
-    return HTMLResponse(content=html)
+    game_states = await asyncio.to_thread(reconstruct_all_game_states)
+
+    return json_response({
+        "game_count": len(game_states),
+        "games": game_states
+    })
+
+
+# Static shell of the rosters page; admin_rosters.js fetches ?format=json and renders rows
+ROSTERS_HTML = minify_html(f'''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>score-cloud | Rosters</title>
+    <link rel="stylesheet" href="/static/admin.css">
+    <script src="/static/admin_tables.js" defer></script>
+    <script src="/static/admin_rosters.js" defer></script>
+</head>
+<body>
+    {admin_nav("rosters")}
+    <div class="container">
+        <h1>Team Rosters</h1>
+        <div class="content">
+            <table id="rostersTable">
+                <thead>
+                    <tr>
+                        <th>Team</th>
+                        <th>Player Name</th>
+                        <th>#</th>
+                        <th>Status</th>
+                        <th>Added</th>
+                        <th>Removed</th>
+                    </tr>
+                    <tr class="filter-row">
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('rostersTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('rostersTable')"></td>
+                        <td></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('rostersTable')"></td>
+                        <td></td>
+                        <td></td>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr><td colspan="6" class="empty">Loading rosters...</td></tr>
+                </tbody>
+            </table>
+        </div>
+    </div>
+</body>
+</html>
+''').encode("utf-8")
 
 
 @app.get("/admin/rosters")
-async def get_rosters_admin(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
+def get_rosters_admin(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
     """
     Admin page to view all team rosters.
 
-    Returns HTML for browser viewing or JSON if format=json parameter is provided.
+    Browsers get a static page shell that fetches the JSON view
+    (format=json) and renders the rows client-side.
     """
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
-
-    # Get all roster entries with player details
-    rosters = db.execute("""
-        SELECT DISTINCT
-            t.abbreviation as team_abbrev,
-            p.player_id,
-            p.full_name,
-            re.jersey_number,
-            re.roster_status,
-            re.added_at,
-            re.removed_at
-        FROM roster_entries re
-        JOIN players p ON re.player_id = p.player_id
-        JOIN team_registrations tr ON re.registration_id = tr.registration_id
-        JOIN teams t ON tr.team_id = t.team_id
-        ORDER BY t.abbreviation, p.full_name
-    """).fetchall()
-
-    db.close()
-
-    # Return JSON if requested
-    if format == "json":
-        return {"rosters": [dict(r) for r in rosters]}
+    if format != "json":
+        return HTMLResponse(content=ROSTERS_HTML)
+
+    with get_read_db() as db:
+        # Get all roster entries with player details, serialized by SQLite
+        body = db.execute(f"""
+            SELECT json_object('rosters', {json_rows_sql((
+                "team_abbrev", "player_id", "full_name", "jersey_number",
+                "roster_status", "added_at", "removed_at",
+            ))})
+            FROM (
+                SELECT DISTINCT
+                    t.abbreviation as team_abbrev,
+                    p.player_id,
+                    p.full_name,
+                    re.jersey_number,
+                    re.roster_status,
+                    re.added_at,
+                    re.removed_at
+                FROM roster_entries re
+                JOIN players p ON re.player_id = p.player_id
+                JOIN team_registrations tr ON re.registration_id = tr.registration_id
+                JOIN teams t ON tr.team_id = t.team_id
+                ORDER BY t.abbreviation, p.full_name
+            )
+        """).fetchone()[0]
 
-    # Generate HTML view
-    import datetime
+    return Response(content=body, media_type="application/json")
 
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
-        return "Active"
 
-    rosters_html = ""
-    if not rosters:
-        rosters_html = '<tr><td colspan="6" style="text-align: center; color: #999; padding: 40px;">No rosters found.</td></tr>'
-    else:
-        for r in rosters:
-            status_class = "active" if r["roster_status"] == "active" else "inactive"
-            removed_display = "Active" if r["removed_at"] is None else format_timestamp(r["removed_at"])
-
-            rosters_html += f'''
-            <tr>
-                <td class="team-abbrev">{r["team_abbrev"]}</td>
-                <td>{r["full_name"]}</td>
-                <td>{r["jersey_number"] or "-"}</td>
-                <td><span class="status-badge {status_class}">{r["roster_status"]}</span></td>
-                <td class="timestamp">{format_timestamp(r["added_at"])}</td>
-                <td class="timestamp">{removed_display}</td>
-            </tr>
-            '''
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Rosters</title>
-        <link rel="stylesheet" href="/static/admin.css">
-        <script>
-            function filterTable() {{
-                const filters = {{
-                    team: document.getElementById('filterTeam').value.toLowerCase(),
-                    name: document.getElementById('filterName').value.toLowerCase(),
-                    status: document.getElementById('filterStatus').value.toLowerCase()
-                }};
-
-                const rows = document.querySelectorAll('#rostersTable tbody tr');
-
-                rows.forEach(row => {{
-                    if (row.cells.length < 5) return; // Skip empty row
-
-                    const team = row.cells[0].textContent.toLowerCase();
-                    const name = row.cells[1].textContent.toLowerCase();
-                    const status = row.cells[3].textContent.toLowerCase();
-
-                    const match =
-                        team.includes(filters.team) &&
-                        name.includes(filters.name) &&
-                        status.includes(filters.status);
-
-                    row.style.display = match ? '' : 'none';
-                }});
-            }}
-        </script>
-    </head>
-    <body>
-        {admin_nav("rosters")}
-        <div class="container">
-            <h1>Team Rosters</h1>
-            <div class="content">
-                <table id="rostersTable">
-                    <thead>
-                        <tr>
-                            <th>Team</th>
-                            <th>Player Name</th>
-                            <th>#</th>
-                            <th>Status</th>
-                            <th>Added</th>
-                            <th>Removed</th>
-                        </tr>
-                        <tr class="filter-row">
-                            <td><input type="text" id="filterTeam" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterName" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td></td>
-                            <td><input type="text" id="filterStatus" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td></td>
-                            <td></td>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {rosters_html}
-                    </tbody>
-                </table>
-            </div>
+# Static shell of the teams page; admin_teams.js fetches ?format=json and renders rows
+TEAMS_HTML = minify_html(f'''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>score-cloud | Teams</title>
+    <link rel="stylesheet" href="/static/admin.css">
+    <script src="/static/admin_tables.js" defer></script>
+    <script src="/static/admin_teams.js" defer></script>
+</head>
+<body>
+    {admin_nav("teams")}
+    <div class="container">
+        <h1>Teams</h1>
+        <div class="content">
+            <table id="teamsTable">
+                <thead>
+                    <tr>
+                        <th>Team ID</th>
+                        <th>Name</th>
+                        <th>Abbrev</th>
+                        <th>Created</th>
+                    </tr>
+                    <tr class="filter-row">
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('teamsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('teamsTable')"></td>
+                        <td><input type="text" placeholder="Filter..." onkeyup="filterTable('teamsTable')"></td>
+                        <td></td>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr><td colspan="4" class="empty">Loading teams...</td></tr>
+                </tbody>
+            </table>
         </div>
-    </body>
-    </html>
-    '''
-
-    return HTMLResponse(content=html)
-
-
+    </div>
+</body>
+</html>
+''').encode("utf-8")
 
 
 @app.get("/admin/teams")
-async def get_teams_admin(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
+def get_teams_admin(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
     """
     Admin page to view all teams.
 
-    Returns HTML for browser viewing or JSON if format=json parameter is provided.
+    Browsers get a static page shell that fetches the JSON view
+    (format=json) and renders the rows client-side.
     """
-    from fastapi.responses import HTMLResponse
+    if format != "json":
+        return HTMLResponse(content=TEAMS_HTML)
 
-    db = get_db()
+    with get_read_db() as db:
+        body = db.execute(f"""
+            SELECT json_object('teams', {json_rows_sql(("team_id", "name", "abbreviation", "created_at"))})
+            FROM (SELECT team_id, name, abbreviation, created_at FROM teams ORDER BY name)
+        """).fetchone()[0]
 
-    teams = db.execute("""
-        SELECT team_id, name, abbreviation, created_at
-        FROM teams
-        ORDER BY name
-    """).fetchall()
+    return Response(content=body, media_type="application/json")
 
-    db.close()
 
-    # Return JSON if requested
-    if format == "json":
-        return {"teams": [dict(t) for t in teams]}
+PLAYERS_PAGE_SIZE = 200  # default rows per /admin/players page
 
-    # Generate HTML view
-    import datetime
+# Walks idx_players_name in order; the index covers every selected column
+PLAYERS_PAGE_SQL = """
+    SELECT player_id, first_name, last_name, created_at
+    FROM players
+    ORDER BY last_name, first_name
+    LIMIT :limit OFFSET :offset
+"""
 
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
-        return "Never"
+PLAYER_SEARCH_SQL = """
+    SELECT p.player_id, p.first_name, p.last_name, p.created_at
+    FROM players_fts f
+    JOIN players p ON p.player_id = f.rowid
+    WHERE players_fts MATCH :search
+    ORDER BY p.last_name, p.first_name
+    LIMIT :limit OFFSET :offset
+"""
 
-    teams_html = ""
-    if not teams:
-        teams_html = '<tr><td colspan="4" style="text-align: center; color: #999; padding: 40px;">No teams found.</td></tr>'
-    else:
-        for t in teams:
-            teams_html += f'''
-            <tr>
-                <td class="team-abbrev">{t["team_id"]}</td>
-                <td>{t["name"] or "-"}</td>
-                <td>{t["abbreviation"] or "-"}</td>
-                <td class="timestamp">{format_timestamp(t["created_at"])}</td>
-            </tr>
-            '''
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Teams</title>
-        <link rel="stylesheet" href="/static/admin.css">
-        <script>
-            function filterTable() {{
-                const filters = {{
-                    teamId: document.getElementById('filterTeamId').value.toLowerCase(),
-                    name: document.getElementById('filterName').value.toLowerCase(),
-                    abbrev: document.getElementById('filterAbbrev').value.toLowerCase()
-                }};
-
-                const rows = document.querySelectorAll('#teamsTable tbody tr');
-
-                rows.forEach(row => {{
-                    if (row.cells.length < 4) return; // Skip empty row
-
-                    const teamId = row.cells[0].textContent.toLowerCase();
-                    const name = row.cells[1].textContent.toLowerCase();
-                    const abbrev = row.cells[2].textContent.toLowerCase();
-
-                    const match =
-                        teamId.includes(filters.teamId) &&
-                        name.includes(filters.name) &&
-                        abbrev.includes(filters.abbrev);
-
-                    row.style.display = match ? '' : 'none';
-                }});
-            }}
-        </script>
-    </head>
-    <body>
-        {admin_nav("teams")}
-        <div class="container">
-            <h1>Teams</h1>
-            <div class="content">
-                <table id="teamsTable">
-                    <thead>
-                        <tr>
-                            <th>Team ID</th>
-                            <th>Name</th>
-                            <th>Abbrev</th>
-                            <th>Created</th>
-                        </tr>
-                        <tr class="filter-row">
-                            <td><input type="text" id="filterTeamId" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterName" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterAbbrev" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td></td>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {teams_html}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
 
-    return HTMLResponse(content=html)
+def player_search_query(text: str) -> str:
+    """Turn free text into an FTS5 query that matches every word as a prefix."""
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in text.split())
 
 
 @app.get("/admin/players")
-async def get_players_admin(format: Optional[str] = Query(None, description="Response format: 'json' or 'html'")):
+def get_players_admin(
+    request: Request,
+    format: FormatQuery = None,
+    q: Optional[str] = Query(None, description="Search names and birthplaces"),
+    limit: int = Query(PLAYERS_PAGE_SIZE, ge=1, le=1000, description="Maximum players to return"),
+    offset: int = Query(0, ge=0, description="Players to skip (next page)"),
+):
     """
-    Admin page to view all players.
+    Admin page to view players, one page at a time.
+
+    q searches player names and birthplaces through the players_fts index;
+    each word matches as a prefix. Pass next_offset back as offset for the
+    next page.
 
     Returns HTML for browser viewing or JSON if format=json parameter is provided.
     """
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
+    search = player_search_query(q or "")
+    query = PLAYER_SEARCH_SQL if search else PLAYERS_PAGE_SQL
 
-    players = db.execute("""
-        SELECT player_id, first_name, last_name, created_at
-        FROM players
-        ORDER BY last_name, first_name
-    """).fetchall()
+    # Fetch one extra row to learn whether another page follows
+    with get_read_db() as db:
+        players = fetch_dicts(db.execute(query, {"search": search, "limit": limit + 1, "offset": offset}))
+    next_offset = offset + limit if len(players) > limit else None
+    del players[limit:]
 
-    db.close()
+    etag = rows_etag(format, q, limit, offset, next_offset, players)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     # Return JSON if requested
     if format == "json":
-        return {"players": [dict(p) for p in players]}
-
-    # Generate HTML view
-    import datetime
-
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
-        return "Never"
-
-    players_html = ""
-    if not players:
-        players_html = '<tr><td colspan="4" style="text-align: center; color: #999; padding: 40px;">No players found.</td></tr>'
-    else:
-        for p in players:
-            players_html += f'''
-            <tr>
-                <td class="player-id">{p["player_id"]}</td>
-                <td>{p["first_name"] or "-"}</td>
-                <td>{p["last_name"] or "-"}</td>
-                <td class="timestamp">{format_timestamp(p["created_at"])}</td>
-            </tr>
-            '''
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Players</title>
-        <link rel="stylesheet" href="/static/admin.css">
-        <script>
-            function filterTable() {{
-                const filters = {{
-                    playerId: document.getElementById('filterPlayerId').value.toLowerCase(),
-                    firstName: document.getElementById('filterFirstName').value.toLowerCase(),
-                    lastName: document.getElementById('filterLastName').value.toLowerCase()
-                }};
-
-                const rows = document.querySelectorAll('#playersTable tbody tr');
-
-                rows.forEach(row => {{
-                    if (row.cells.length < 4) return; // Skip empty row
-
-                    const playerId = row.cells[0].textContent.toLowerCase();
-                    const firstName = row.cells[1].textContent.toLowerCase();
-                    const lastName = row.cells[2].textContent.toLowerCase();
-
-                    const match =
-                        playerId.includes(filters.playerId) &&
-                        firstName.includes(filters.firstName) &&
-                        lastName.includes(filters.lastName);
-
-                    row.style.display = match ? '' : 'none';
-                }});
-            }}
-        </script>
-    </head>
-    <body>
-        {admin_nav("players")}
-        <div class="container wide">
-            <h1>Players</h1>
-            <div class="content overflow">
-                <div class="hint">
-                    Players are created when you add them to team rosters.
-                </div>
-
-                <table id="playersTable" class="wide">
-                    <thead>
-                        <tr>
-                            <th>Player ID</th>
-                            <th>First Name</th>
-                            <th>Last Name</th>
-                            <th>Created</th>
-                        </tr>
-                        <tr class="filter-row">
-                            <td><input type="text" id="filterPlayerId" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterFirstName" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td><input type="text" id="filterLastName" placeholder="Filter..." onkeyup="filterTable()"></td>
-                            <td></td>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {players_html}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
+        return with_etag(json_response({"players": players, "next_offset": next_offset}), etag)
 
-    return HTMLResponse(content=html)
+    return with_etag(StreamingResponse(
+        stream_template(
+            PLAYERS_TEMPLATE, nav=admin_nav("players"), players=players,
+            q=q or "", limit=limit, offset=offset, next_offset=next_offset,
+        ),
+        media_type="text/html"
+    ), etag)
 
 
 @app.websocket("/ws/game-states")
 async def websocket_game_states(websocket: WebSocket):
     """WebSocket endpoint for real-time game state updates."""
     await websocket.accept()
-    websocket_clients.append(websocket)
+    outbox: asyncio.Queue[str] = asyncio.Queue(maxsize=WS_OUTBOX_SIZE)
+    websocket_clients[websocket] = outbox
+    sender = asyncio.create_task(websocket_sender(websocket, outbox))
     logger.info(f"WebSocket client connected for game states (total: {len(websocket_clients)})")
 
     try:
-        # Keep connection alive
+        # Waiting on receive notices a disconnect immediately; if the client
+        # stays silent, probe it periodically so dead peers are pruned
         while True:
-            # Wait for messages (we don't expect any from client, but this keeps connection alive)
-            await asyncio.sleep(3600)
-    except:
+            try:
+                await asyncio.wait_for(websocket.receive_text(), timeout=WS_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                try:
+                    outbox.put_nowait("ping")
+                except asyncio.QueueFull:
+                    pass
+    except WebSocketDisconnect:
         pass
     finally:
-        if websocket in websocket_clients:
-            websocket_clients.remove(websocket)
+        sender.cancel()
+        websocket_clients.pop(websocket, None)
         logger.info(f"WebSocket client disconnected for game states (total: {len(websocket_clients)})")
 
 
@@ -1972,384 +2021,235 @@ from score.models import (
     League, Season, Division, Tournament,
     Team, Player, Rink, RinkSheet, Official,
     RuleSet, Infraction,
-    TeamRegistration, RosterEntry,
+    TeamRegistration, RosterEntry, RosterEntryBatch,
 )
 
 
 @app.get("/admin/leagues")
-async def list_leagues(format: Optional[str] = Query(None)):
+def list_leagues(request: Request, format: Optional[str] = Query(None)):
     """List all leagues with HTML admin UI."""
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
-    rows = db.execute("SELECT * FROM leagues ORDER BY name").fetchall()
-    db.close()
+    with get_read_db() as db:
+        leagues = fetch_dicts(db.execute("""
+            SELECT league_id, name, league_type, description, website, logo_url, created_at
+            FROM leagues ORDER BY name
+        """))
 
-    leagues = [dict(r) for r in rows]
+    etag = rows_etag(format, leagues)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     if format == "json":
-        return {"leagues": leagues}
+        return with_etag(json_response({"leagues": leagues}), etag)
+
+    return with_etag(StreamingResponse(
+        stream_template(LEAGUES_TEMPLATE, nav=admin_nav("leagues"), leagues=leagues),
+        media_type="text/html"
+    ), etag)
 
-    # Generate HTML
-    import datetime
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
-        return "-"
-
-    rows_html = ""
-    if not leagues:
-        rows_html = '<tr><td colspan="6" style="text-align: center; color: #666; padding: 40px;">No leagues found.</td></tr>'
-    else:
-        for r in leagues:
-            rows_html += f'''
-            <tr>
-                <td class="device-id">{r["league_id"]}</td>
-                <td>{r["name"]}</td>
-                <td>{r["league_type"] or "-"}</td>
-                <td>{r["description"] or "-"}</td>
-                <td>{r["website"] or "-"}</td>
-                <td class="timestamp">{format_timestamp(r.get("created_at"))}</td>
-            </tr>'''
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Leagues</title>
-        <link rel="stylesheet" href="/static/admin.css">
-    </head>
-    <body>
-        {admin_nav("leagues")}
-        <div class="container">
-            <h1>Leagues</h1>
-            <div class="content">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>League ID</th>
-                            <th>Name</th>
-                            <th>Type</th>
-                            <th>Description</th>
-                            <th>Website</th>
-                            <th>Created</th>
-                        </tr>
-                    </thead>
-                    <tbody>{rows_html}</tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
-    return HTMLResponse(content=html)
+
+def require_parents(db: sqlite3.Connection, *parents: tuple[str, str, str, Any]) -> None:
+    """
+    Reject a write whose referenced rows don't exist, naming the missing one.
+
+    Each parent is (label, table, key column, value); None values are
+    skipped. The write connection enforces foreign keys, so without this
+    check a missing parent would only surface as a bare IntegrityError.
+    Run it inside the write transaction so the parents can't vanish before
+    the insert.
+    """
+    for label, table, column, value in parents:
+        if value is None:
+            continue
+        if db.execute(f"SELECT 1 FROM {table} WHERE {column} = ?", (value,)).fetchone() is None:
+            raise HTTPException(status_code=422, detail=f"{label} {value} not found")
 
 
 @app.post("/admin/leagues")
-async def create_league(league: League):
+def create_league(league: League):
     """Create a new league."""
-    db = get_db()
     current_time = int(time.time())
     try:
-        db.execute("""
-            INSERT INTO leagues (league_id, name, league_type, description, website, logo_url, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (league.league_id, league.name, league.league_type, league.description,
-              league.website, league.logo_url, current_time))
-        db.commit()
+        with get_write_db() as db:
+            db.execute("""
+                INSERT INTO leagues (league_id, name, league_type, description, website, logo_url, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (league.league_id, league.name, league.league_type, league.description,
+                  league.website, league.logo_url, current_time))
     except sqlite3.IntegrityError:
-        db.close()
         raise HTTPException(status_code=409, detail=f"League {league.league_id} already exists")
-    db.close()
     return {"status": "ok", "message": f"League {league.league_id} created"}
 
 
 @app.get("/admin/seasons")
-async def list_seasons(format: Optional[str] = Query(None)):
+def list_seasons(request: Request, format: Optional[str] = Query(None)):
     """List all seasons with HTML admin UI."""
-    from fastapi.responses import HTMLResponse
+    with get_read_db() as db:
+        seasons = fetch_dicts(db.execute("""
+            SELECT season_id, name, start_date, end_date, created_at
+            FROM seasons ORDER BY start_date DESC
+        """))
 
-    db = get_db()
-    rows = db.execute("SELECT * FROM seasons ORDER BY start_date DESC").fetchall()
-    db.close()
-
-    seasons = [dict(r) for r in rows]
+    etag = rows_etag(format, seasons)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     if format == "json":
-        return {"seasons": seasons}
+        return with_etag(json_response({"seasons": seasons}), etag)
 
-    # Generate HTML
-    rows_html = ""
-    if not seasons:
-        rows_html = '<tr><td colspan="4" style="text-align: center; color: #666; padding: 40px;">No seasons found.</td></tr>'
-    else:
-        for r in seasons:
-            rows_html += f'''
-            <tr>
-                <td class="device-id">{r["season_id"]}</td>
-                <td>{r["name"]}</td>
-                <td>{r["start_date"] or "-"}</td>
-                <td>{r["end_date"] or "-"}</td>
-            </tr>'''
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Seasons</title>
-        <link rel="stylesheet" href="/static/admin.css">
-    </head>
-    <body>
-        {admin_nav("seasons")}
-        <div class="container">
-            <h1>Seasons</h1>
-            <div class="content">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Season ID</th>
-                            <th>Name</th>
-                            <th>Start Date</th>
-                            <th>End Date</th>
-                        </tr>
-                    </thead>
-                    <tbody>{rows_html}</tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
-    return HTMLResponse(content=html)
+    return with_etag(StreamingResponse(
+        stream_template(SEASONS_TEMPLATE, nav=admin_nav("seasons"), seasons=seasons),
+        media_type="text/html"
+    ), etag)
 
 
 @app.post("/admin/seasons")
-async def create_season(season: Season):
+def create_season(season: Season):
     """Create a new season."""
-    db = get_db()
     current_time = int(time.time())
     try:
-        db.execute("""
-            INSERT INTO seasons (season_id, name, start_date, end_date, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (season.season_id, season.name, season.start_date, season.end_date, current_time))
-        db.commit()
+        with get_write_db() as db:
+            db.execute("""
+                INSERT INTO seasons (season_id, name, start_date, end_date, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (season.season_id, season.name, season.start_date, season.end_date, current_time))
     except sqlite3.IntegrityError:
-        db.close()
         raise HTTPException(status_code=409, detail=f"Season {season.season_id} already exists")
-    db.close()
     return {"status": "ok", "message": f"Season {season.season_id} created"}
 
 
 @app.get("/admin/divisions")
-async def list_divisions(format: Optional[str] = Query(None)):
+def list_divisions(request: Request, format: Optional[str] = Query(None)):
     """List all divisions with HTML admin UI."""
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
-    rows = db.execute("SELECT * FROM divisions ORDER BY name").fetchall()
-    db.close()
+    with get_read_db() as db:
+        divisions = fetch_dicts(db.execute("""
+            SELECT division_id, name, division_type, parent_division_id, description, created_at
+            FROM divisions ORDER BY name
+        """))
 
-    divisions = [dict(r) for r in rows]
+    etag = rows_etag(format, divisions)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     if format == "json":
-        return {"divisions": divisions}
+        return with_etag(json_response({"divisions": divisions}), etag)
 
-    # Generate HTML
-    rows_html = ""
-    if not divisions:
-        rows_html = '<tr><td colspan="5" style="text-align: center; color: #666; padding: 40px;">No divisions found.</td></tr>'
-    else:
-        for r in divisions:
-            rows_html += f'''
-            <tr>
-                <td class="device-id">{r["division_id"]}</td>
-                <td>{r["name"]}</td>
-                <td>{r["division_type"] or "-"}</td>
-                <td>{r["parent_division_id"] or "-"}</td>
-                <td>{r["description"] or "-"}</td>
-            </tr>'''
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Divisions</title>
-        <link rel="stylesheet" href="/static/admin.css">
-    </head>
-    <body>
-        {admin_nav("divisions")}
-        <div class="container">
-            <h1>Divisions</h1>
-            <div class="content">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Division ID</th>
-                            <th>Name</th>
-                            <th>Type</th>
-                            <th>Parent</th>
-                            <th>Description</th>
-                        </tr>
-                    </thead>
-                    <tbody>{rows_html}</tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
-    return HTMLResponse(content=html)
+    return with_etag(StreamingResponse(
+        stream_template(DIVISIONS_TEMPLATE, nav=admin_nav("divisions"), divisions=divisions),
+        media_type="text/html"
+    ), etag)
 
 
 @app.post("/admin/divisions")
-async def create_division(division: Division):
-    """Create a new division."""
-    db = get_db()
+def create_division(division: Division):
+    """
+    Create a new division.
+
+    Returns 422 if parent_division_id names an unknown division and 409 if
+    the division already exists.
+    """
     current_time = int(time.time())
     try:
-        db.execute("""
-            INSERT INTO divisions (division_id, name, division_type, parent_division_id, description, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (division.division_id, division.name, division.division_type,
-              division.parent_division_id, division.description, current_time))
-        db.commit()
+        with get_write_db() as db:
+            require_parents(db, ("Parent division", "divisions", "division_id", division.parent_division_id))
+            db.execute("""
+                INSERT INTO divisions (division_id, name, division_type, parent_division_id, description, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (division.division_id, division.name, division.division_type,
+                  division.parent_division_id, division.description, current_time))
     except sqlite3.IntegrityError:
-        db.close()
         raise HTTPException(status_code=409, detail=f"Division {division.division_id} already exists")
-    db.close()
     return {"status": "ok", "message": f"Division {division.division_id} created"}
 
 
+RULE_SET_LIST = TypeAdapter(list[RuleSet])
+
+
 @app.get("/admin/rule-sets", response_model=list[RuleSet])
-async def list_rule_sets():
+def list_rule_sets():
     """List all rule sets."""
-    db = get_db()
-    rows = db.execute("SELECT * FROM rule_sets ORDER BY name").fetchall()
-    db.close()
-    return [RuleSet(
-        rule_set_id=r["rule_set_id"],
-        name=r["name"],
-        description=r["description"],
-        num_periods=r["num_periods"],
-        period_length_min=r["period_length_min"],
-        intermission_length_min=r["intermission_length_min"],
-        overtime_length_min=r["overtime_length_min"],
-        overtime_type=r["overtime_type"],
-        icing_rule=r["icing_rule"],
-        offside_rule=r["offside_rule"],
-        body_checking=bool(r["body_checking"]),
-        points_win=r["points_win"],
-        points_loss=r["points_loss"],
-        points_tie=r["points_tie"],
-        points_otl=r["points_otl"],
-        max_roster_size=r["max_roster_size"],
-        min_players_to_start=r["min_players_to_start"],
-        max_players_dressed=r["max_players_dressed"],
-    ) for r in rows]
+    with get_read_db() as db:
+        rows = fetch_dicts(db.execute(RULE_SETS_SQL))
+    # Columns map one-to-one onto RuleSet fields; validating the dicts
+    # converts body_checking to a bool
+    return Response(
+        content=RULE_SET_LIST.dump_json(RULE_SET_LIST.validate_python(rows)),
+        media_type="application/json"
+    )
 
 
 @app.get("/admin/rule-sets/{rule_set_id}", response_model=RuleSet)
-async def get_rule_set(rule_set_id: str):
+def get_rule_set(rule_set_id: str):
     """Get a specific rule set."""
-    db = get_db()
-    r = db.execute("SELECT * FROM rule_sets WHERE rule_set_id = ?", (rule_set_id,)).fetchone()
-    db.close()
+    with get_read_db() as db:
+        r = db.execute("SELECT * FROM rule_sets WHERE rule_set_id = ?", (rule_set_id,)).fetchone()
     if not r:
         raise HTTPException(status_code=404, detail=f"Rule set {rule_set_id} not found")
-    return RuleSet(
-        rule_set_id=r["rule_set_id"],
-        name=r["name"],
-        description=r["description"],
-        num_periods=r["num_periods"],
-        period_length_min=r["period_length_min"],
-        intermission_length_min=r["intermission_length_min"],
-        overtime_length_min=r["overtime_length_min"],
-        overtime_type=r["overtime_type"],
-        icing_rule=r["icing_rule"],
-        offside_rule=r["offside_rule"],
-        body_checking=bool(r["body_checking"]),
-        points_win=r["points_win"],
-        points_loss=r["points_loss"],
-        points_tie=r["points_tie"],
-        points_otl=r["points_otl"],
-        max_roster_size=r["max_roster_size"],
-        min_players_to_start=r["min_players_to_start"],
-        max_players_dressed=r["max_players_dressed"],
-    )
+    return Response(content=RuleSet.model_validate(dict(r)).model_dump_json(), media_type="application/json")
+
+
+# Validates and serializes a whole infraction listing in one pass each,
+# instead of constructing an Infraction per row
+INFRACTION_LIST = TypeAdapter(list[Infraction])
 
 
 @app.get("/admin/rule-sets/{rule_set_id}/infractions", response_model=list[Infraction])
-async def list_infractions(rule_set_id: str):
+def list_infractions(rule_set_id: str):
     """List all infractions for a rule set."""
-    db = get_db()
-    rows = db.execute("""
-        SELECT * FROM rule_set_infractions
-        WHERE rule_set_id = ?
-        ORDER BY display_order, code
-    """, (rule_set_id,)).fetchall()
-    db.close()
-    return [Infraction(
-        rule_set_id=r["rule_set_id"],
-        code=r["code"],
-        name=r["name"],
-        description=r.get("description"),
-        default_severity=r["default_severity"],
-        default_duration_min=r["default_duration_min"],
-        allows_minor=bool(r["allows_minor"]),
-        allows_major=bool(r["allows_major"]),
-        allows_misconduct=bool(r["allows_misconduct"]),
-        allows_match=bool(r["allows_match"]),
-        is_active=bool(r["is_active"]),
-        display_order=r["display_order"],
-    ) for r in rows]
+    with get_read_db() as db:
+        rows = fetch_dicts(db.execute("""
+            SELECT rule_set_id, code, name, description, default_severity, default_duration_min,
+                   allows_minor, allows_major, allows_misconduct, allows_match, is_active, display_order
+            FROM rule_set_infractions
+            WHERE rule_set_id = ?
+            ORDER BY display_order, code
+        """, (rule_set_id,)))
+    # The allows_*/is_active 0/1 columns validate to bools; response_model
+    # still documents the shape
+    return Response(
+        content=INFRACTION_LIST.dump_json(INFRACTION_LIST.validate_python(rows)),
+        media_type="application/json"
+    )
 
 
 @app.post("/admin/teams-v2")
-async def create_team_v2(team: Team):
+def create_team_v2(team: Team):
     """Create a new team (v2 data model)."""
-    db = get_db()
     current_time = int(time.time())
     try:
-        db.execute("""
-            INSERT INTO teams (team_id, name, city, abbreviation, team_type,
-                               logo_url, primary_color, secondary_color, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (team.team_id, team.name, team.city, team.abbreviation, team.team_type,
-              team.logo_url, team.primary_color, team.secondary_color, current_time))
-        db.commit()
+        with get_write_db() as db:
+            db.execute("""
+                INSERT INTO teams (team_id, name, city, abbreviation, team_type,
+                                   logo_url, primary_color, secondary_color, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (team.team_id, team.name, team.city, team.abbreviation, team.team_type,
+                  team.logo_url, team.primary_color, team.secondary_color, current_time))
     except sqlite3.IntegrityError:
-        db.close()
         raise HTTPException(status_code=409, detail=f"Team {team.team_id} already exists")
-    db.close()
     return {"status": "ok", "message": f"Team {team.team_id} created"}
 
 
+TEAM_LIST = TypeAdapter(list[Team])
+
+
 @app.get("/admin/teams-v2", response_model=list[Team])
-async def list_teams_v2():
+def list_teams_v2():
     """List all teams (v2 data model)."""
-    db = get_db()
-    rows = db.execute("SELECT * FROM teams ORDER BY name").fetchall()
-    db.close()
-    return [Team(
-        team_id=r["team_id"],
-        name=r["name"],
-        city=r["city"],
-        abbreviation=r["abbreviation"],
-        team_type=r["team_type"],
-        logo_url=r["logo_url"],
-        primary_color=r["primary_color"],
-        secondary_color=r["secondary_color"],
-    ) for r in rows]
+    with get_read_db() as db:
+        rows = fetch_dicts(db.execute("""
+            SELECT team_id, name, city, abbreviation, team_type, logo_url, primary_color, secondary_color
+            FROM teams ORDER BY name
+        """))
+    return Response(content=TEAM_LIST.dump_json(TEAM_LIST.validate_python(rows)), media_type="application/json")
 
 
 @app.post("/admin/team-registrations")
-async def create_team_registration(reg: TeamRegistration):
-    """Register a team in a league+season or tournament."""
-    db = get_db()
+def create_team_registration(reg: TeamRegistration):
+    """
+    Register a team in a league+season or tournament.
+
+    Returns 422 naming the team or division if either is unknown and 409 if
+    the registration ID is already taken.
+    """
     current_time = int(time.time())
 
     # Validate context
@@ -2360,35 +2260,36 @@ async def create_team_registration(reg: TeamRegistration):
         # Tournament context - OK
         pass
     else:
-        db.close()
         raise HTTPException(
             status_code=400,
             detail="Must specify either (league_id + season_id) or tournament_id, not both"
         )
 
     try:
-        db.execute("""
-            INSERT INTO team_registrations
-                (registration_id, team_id, league_id, season_id, tournament_id, division_id, registered_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (reg.registration_id, reg.team_id, reg.league_id, reg.season_id,
-              reg.tournament_id, reg.division_id, current_time))
-        db.commit()
-    except sqlite3.IntegrityError as e:
-        db.close()
-        raise HTTPException(status_code=409, detail=str(e))
-    db.close()
+        with get_write_db() as db:
+            require_parents(
+                db,
+                ("Team", "teams", "team_id", reg.team_id),
+                ("Division", "divisions", "division_id", reg.division_id),
+            )
+            db.execute("""
+                INSERT INTO team_registrations
+                    (registration_id, team_id, league_id, season_id, tournament_id, division_id, registered_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (reg.registration_id, reg.team_id, reg.league_id, reg.season_id,
+                  reg.tournament_id, reg.division_id, current_time))
+    except sqlite3.IntegrityError:
+        raise HTTPException(status_code=409, detail=f"Registration {reg.registration_id} already exists")
     return {"status": "ok", "message": f"Team {reg.team_id} registered as {reg.registration_id}"}
 
 
 @app.get("/admin/team-registrations")
-async def list_team_registrations(
+def list_team_registrations(
     league_id: Optional[str] = Query(None),
     season_id: Optional[str] = Query(None),
     tournament_id: Optional[str] = Query(None),
 ):
     """List team registrations, optionally filtered."""
-    db = get_db()
     query = "SELECT * FROM team_registrations WHERE 1=1"
     params = []
 
@@ -2402,159 +2303,138 @@ async def list_team_registrations(
         query += " AND tournament_id = ?"
         params.append(tournament_id)
 
-    rows = db.execute(query, params).fetchall()
-    db.close()
-    return [dict(r) for r in rows]
+    with get_read_db() as db:
+        registrations = fetch_dicts(db.execute(query, params))
+    return json_response(registrations)
+
+
+ROSTER_ENTRY_INSERT_SQL = """
+    INSERT INTO roster_entries
+        (registration_id, player_id, jersey_number, position, roster_status,
+         is_captain, is_alternate, added_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def roster_entry_params(entry: RosterEntry, current_time: int) -> tuple:
+    """Parameters for ROSTER_ENTRY_INSERT_SQL."""
+    return (entry.registration_id, entry.player_id, entry.jersey_number, entry.position,
+            entry.roster_status, 1 if entry.is_captain else 0, 1 if entry.is_alternate else 0,
+            current_time)
 
 
 @app.post("/admin/roster-entries")
-async def add_roster_entry(entry: RosterEntry):
-    """Add a player to a team's roster."""
-    db = get_db()
+def add_roster_entry(entry: RosterEntry):
+    """
+    Add a player to a team's roster.
+
+    Returns 422 naming the registration or player if either is unknown.
+    """
+    current_time = int(time.time())
+
+    with get_write_db() as db:
+        require_parents(
+            db,
+            ("Registration", "team_registrations", "registration_id", entry.registration_id),
+            ("Player", "players", "player_id", entry.player_id),
+        )
+        db.execute(ROSTER_ENTRY_INSERT_SQL, roster_entry_params(entry, current_time))
+    return {"status": "ok", "message": f"Player {entry.player_id} added to roster {entry.registration_id}"}
+
+
+@app.post("/admin/roster-entries:batch")
+def add_roster_entries(batch: RosterEntryBatch):
+    """
+    Add many roster entries in one transaction.
+
+    Either every entry is added or, if any of them is rejected (unknown
+    registration or player, duplicate), none are.
+    """
     current_time = int(time.time())
+    params = [roster_entry_params(entry, current_time) for entry in batch.entries]
 
     try:
-        db.execute("""
-            INSERT INTO roster_entries
-                (registration_id, player_id, jersey_number, position, roster_status,
-                 is_captain, is_alternate, added_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (entry.registration_id, entry.player_id, entry.jersey_number, entry.position,
-              entry.roster_status, 1 if entry.is_captain else 0, 1 if entry.is_alternate else 0,
-              current_time))
-        db.commit()
+        with get_write_db() as db:
+            db.executemany(ROSTER_ENTRY_INSERT_SQL, params)
     except sqlite3.IntegrityError as e:
-        db.close()
-        raise HTTPException(status_code=409, detail=str(e))
-    db.close()
-    return {"status": "ok", "message": f"Player {entry.player_id} added to roster {entry.registration_id}"}
+        # The sqlite message doesn't say which entry failed; find it for the
+        # response and keep the raw error in the log only
+        logger.warning(f"Rejected roster entry batch: {e}")
+        index = first_unknown_roster_reference(batch.entries)
+        if index is None:
+            raise HTTPException(status_code=409, detail="Roster entries were rejected")
+        entry = batch.entries[index]
+        raise HTTPException(
+            status_code=409,
+            detail=f"Roster entry {index} (player {entry.player_id}, registration "
+                   f"{entry.registration_id}) references an unknown registration or player"
+        )
+    return {"status": "ok", "message": f"Added {len(params)} roster entries"}
+
+
+def first_unknown_roster_reference(entries: list[RosterEntry]) -> Optional[int]:
+    """Index of the first entry whose registration or player doesn't exist, if any."""
+    with get_read_db() as db:
+        for index, entry in enumerate(entries):
+            registration = db.execute(
+                "SELECT 1 FROM team_registrations WHERE registration_id = ?", (entry.registration_id,)
+            ).fetchone()
+            player = db.execute("SELECT 1 FROM players WHERE player_id = ?", (entry.player_id,)).fetchone()
+            if registration is None or player is None:
+                return index
+    return None
 
 
 @app.get("/admin/roster-entries/{registration_id}")
-async def get_roster_entries(registration_id: str):
+def get_roster_entries(registration_id: str):
     """Get all roster entries for a team registration."""
-    db = get_db()
-    rows = db.execute("""
-        SELECT re.*, p.full_name, p.first_name, p.last_name
-        FROM roster_entries re
-        JOIN players p ON re.player_id = p.player_id
-        WHERE re.registration_id = ? AND re.removed_at IS NULL
-        ORDER BY re.jersey_number
-    """, (registration_id,)).fetchall()
-    db.close()
-    return [dict(r) for r in rows]
+    with get_read_db() as db:
+        entries = fetch_dicts(db.execute("""
+            SELECT re.*, p.full_name, p.first_name, p.last_name
+            FROM roster_entries re
+            JOIN players p ON re.player_id = p.player_id
+            WHERE re.registration_id = ? AND re.removed_at IS NULL
+            ORDER BY re.jersey_number
+        """, (registration_id,)))
+    return json_response(entries)
 
 
 # ---------- New HTML Admin Pages ----------
 
 @app.get("/admin/rinks-admin")
-async def list_rinks_admin(format: Optional[str] = Query(None)):
+def list_rinks_admin(request: Request, format: Optional[str] = Query(None)):
     """List all rinks with HTML admin UI (full model)."""
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
-    rows = db.execute("""
-        SELECT rink_id, name, address, city, province_state, postal_code, country, phone, website, created_at
-        FROM rinks ORDER BY name
-    """).fetchall()
-    db.close()
+    with get_read_db() as db:
+        rinks = fetch_dicts(db.execute("""
+            SELECT rink_id, name, address, city, province_state, postal_code, country, phone, website, created_at
+            FROM rinks ORDER BY name
+        """))
 
-    rinks = [dict(r) for r in rows]
+    etag = rows_etag(format, rinks)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     if format == "json":
-        return {"rinks": rinks}
+        return with_etag(json_response({"rinks": rinks}), etag)
 
-    import datetime
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
-        return "-"
+    return with_etag(StreamingResponse(
+        stream_template(RINKS_TEMPLATE, nav=admin_nav("rinks"), rinks=rinks),
+        media_type="text/html"
+    ), etag)
 
-    rows_html = ""
-    if not rinks:
-        rows_html = '<tr><td colspan="8" style="text-align: center; color: #666; padding: 40px;">No rinks found.</td></tr>'
-    else:
-        for r in rinks:
-            location = ", ".join(filter(None, [r["city"], r["province_state"], r["country"]])) or "-"
-            rows_html += f'''
-            <tr>
-                <td class="device-id">{r["rink_id"]}</td>
-                <td>{r["name"]}</td>
-                <td>{r["address"] or "-"}</td>
-                <td>{location}</td>
-                <td>{r["phone"] or "-"}</td>
-                <td>{r["website"] or "-"}</td>
-                <td class="timestamp">{format_timestamp(r.get("created_at"))}</td>
-            </tr>'''
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Rinks</title>
-        <link rel="stylesheet" href="/static/admin.css">
-    </head>
-    <body>
-        {admin_nav("rinks")}
-        <div class="container">
-            <h1>Rinks</h1>
-            <div class="content">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Rink ID</th>
-                            <th>Name</th>
-                            <th>Address</th>
-                            <th>Location</th>
-                            <th>Phone</th>
-                            <th>Website</th>
-                            <th>Created</th>
-                        </tr>
-                    </thead>
-                    <tbody>{rows_html}</tbody>
+
+# Closes the table opened by each *_HTML_HEAD below
+ADMIN_TABLE_HTML_TAIL = minify_html("""</tbody>
                 </table>
             </div>
         </div>
     </body>
     </html>
-    '''
-    return HTMLResponse(content=html)
-
-
-@app.get("/admin/rule-sets-admin")
-async def list_rule_sets_admin(format: Optional[str] = Query(None)):
-    """List all rule sets with HTML admin UI."""
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
-    rows = db.execute("SELECT * FROM rule_sets ORDER BY name").fetchall()
-    db.close()
+""")
 
-    rule_sets = [dict(r) for r in rows]
-
-    if format == "json":
-        return {"rule_sets": rule_sets}
 
-    rows_html = ""
-    if not rule_sets:
-        rows_html = '<tr><td colspan="8" style="text-align: center; color: #666; padding: 40px;">No rule sets found.</td></tr>'
-    else:
-        for r in rule_sets:
-            checking = "Yes" if r.get("body_checking") else "No"
-            rows_html += f'''
-            <tr>
-                <td class="device-id">{r["rule_set_id"]}</td>
-                <td>{r["name"]}</td>
-                <td>{r["num_periods"]} x {r["period_length_min"]}min</td>
-                <td>{r["overtime_length_min"] or "-"}min {r["overtime_type"] or ""}</td>
-                <td>{r["icing_rule"]}</td>
-                <td>{checking}</td>
-                <td>{r["points_win"]}/{r["points_loss"]}/{r["points_tie"]}/{r["points_otl"]}</td>
-                <td>{r["description"] or "-"}</td>
-            </tr>'''
-
-    html = f'''
+# Static part of the rule sets page above its rows
+RULE_SETS_HTML_HEAD = minify_html(f'''
     <!DOCTYPE html>
     <html>
     <head>
@@ -2580,51 +2460,59 @@ async def list_rule_sets_admin(format: Optional[str] = Query(None)):
                             <th>Description</th>
                         </tr>
                     </thead>
-                    <tbody>{rows_html}</tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
-    return HTMLResponse(content=html)
+                    <tbody>''')
+
+def escape_row(row: dict) -> dict:
+    """
+    HTML-escape every value of a row for the *_ROW_HTML templates.
 
+    str.format_map doesn't autoescape like the Jinja templates do, and the
+    values are user-entered names and descriptions.
+    """
+    return {key: escape(value) for key, value in row.items()}
 
-@app.get("/admin/officials-admin")
-async def list_officials_admin(format: Optional[str] = Query(None)):
-    """List all officials with HTML admin UI."""
-    from fastapi.responses import HTMLResponse
 
-    db = get_db()
-    rows = db.execute("SELECT * FROM officials ORDER BY last_name, first_name").fetchall()
-    db.close()
+# Row markup compiled once; handlers fill it with str.format_map on escaped rows
+RULE_SET_ROW_HTML = (
+    '<tr><td class="device-id">{rule_set_id}</td><td>{name}</td>'
+    '<td>{num_periods} x {period_length_min}min</td><td>{overtime}</td>'
+    '<td>{icing_rule}</td><td>{checking}</td>'
+    '<td>{points_win}/{points_loss}/{points_tie}/{points_otl}</td><td>{description}</td></tr>'
+)
+
+
+@app.get("/admin/rule-sets-admin")
+def list_rule_sets_admin(request: Request, format: Optional[str] = Query(None)):
+    """List all rule sets with HTML admin UI."""
+    with get_read_db() as db:
+        rule_sets = fetch_dicts(db.execute(RULE_SETS_SQL))
 
-    officials = [dict(r) for r in rows]
+    etag = rows_etag(format, rule_sets)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     if format == "json":
-        return {"officials": officials}
+        return with_etag(json_response({"rule_sets": rule_sets}), etag)
+
+    render_row = RULE_SET_ROW_HTML.format_map
+    rows = [
+        render_row(escape_row({
+            **r,
+            "overtime": f'{r["overtime_length_min"] or "-"}min {r["overtime_type"] or ""}',
+            "checking": "Yes" if r["body_checking"] else "No",
+            "description": r["description"] or "-",
+        }))
+        for r in rule_sets
+    ]
+    rows_html = "".join(rows) or '<tr><td colspan="8" style="text-align: center; color: #666; padding: 40px;">No rule sets found.</td></tr>'
 
-    import datetime
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
-        return "-"
+    return with_etag(
+        HTMLResponse(content="".join((RULE_SETS_HTML_HEAD, rows_html, ADMIN_TABLE_HTML_TAIL))), etag
+    )
 
-    rows_html = ""
-    if not officials:
-        rows_html = '<tr><td colspan="5" style="text-align: center; color: #666; padding: 40px;">No officials found.</td></tr>'
-    else:
-        for r in officials:
-            rows_html += f'''
-            <tr>
-                <td class="device-id">{r["official_id"]}</td>
-                <td>{r["full_name"]}</td>
-                <td>{r["first_name"]}</td>
-                <td>{r["last_name"]}</td>
-                <td>{r["certification_level"] or "-"}</td>
-            </tr>'''
-
-    html = f'''
+
+# Static part of the officials page above its rows
+OFFICIALS_HTML_HEAD = minify_html(f'''
     <!DOCTYPE html>
     <html>
     <head>
@@ -2647,46 +2535,44 @@ async def list_officials_admin(format: Optional[str] = Query(None)):
                             <th>Certification</th>
                         </tr>
                     </thead>
-                    <tbody>{rows_html}</tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
-    return HTMLResponse(content=html)
+                    <tbody>''')
 
+OFFICIAL_ROW_HTML = (
+    '<tr><td class="device-id">{official_id}</td><td>{full_name}</td>'
+    '<td>{first_name}</td><td>{last_name}</td><td>{certification_level}</td></tr>'
+)
 
-@app.get("/admin/tournaments-admin")
-async def list_tournaments_admin(format: Optional[str] = Query(None)):
-    """List all tournaments with HTML admin UI."""
-    from fastapi.responses import HTMLResponse
 
-    db = get_db()
-    rows = db.execute("SELECT * FROM tournaments ORDER BY start_date DESC").fetchall()
-    db.close()
+@app.get("/admin/officials-admin")
+def list_officials_admin(request: Request, format: Optional[str] = Query(None)):
+    """List all officials with HTML admin UI."""
+    with get_read_db() as db:
+        officials = fetch_dicts(db.execute("""
+            SELECT official_id, first_name, last_name, full_name, certification_level, created_at
+            FROM officials ORDER BY last_name, first_name
+        """))
 
-    tournaments = [dict(r) for r in rows]
+    etag = rows_etag(format, officials)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     if format == "json":
-        return {"tournaments": tournaments}
+        return with_etag(json_response({"officials": officials}), etag)
 
-    rows_html = ""
-    if not tournaments:
-        rows_html = '<tr><td colspan="6" style="text-align: center; color: #666; padding: 40px;">No tournaments found.</td></tr>'
-    else:
-        for r in tournaments:
-            rows_html += f'''
-            <tr>
-                <td class="device-id">{r["tournament_id"]}</td>
-                <td>{r["name"]}</td>
-                <td>{r["tournament_type"] or "-"}</td>
-                <td>{r["location"] or "-"}</td>
-                <td>{r["start_date"]}</td>
-                <td>{r["end_date"]}</td>
-            </tr>'''
-
-    html = f'''
+    render_row = OFFICIAL_ROW_HTML.format_map
+    rows = [
+        render_row(escape_row({**r, "certification_level": r["certification_level"] or "-"}))
+        for r in officials
+    ]
+    rows_html = "".join(rows) or '<tr><td colspan="5" style="text-align: center; color: #666; padding: 40px;">No officials found.</td></tr>'
+
+    return with_etag(
+        HTMLResponse(content="".join((OFFICIALS_HTML_HEAD, rows_html, ADMIN_TABLE_HTML_TAIL))), etag
+    )
+
+
+# Static part of the tournaments page above its rows
+TOURNAMENTS_HTML_HEAD = minify_html(f'''
     <!DOCTYPE html>
     <html>
     <head>
@@ -2710,62 +2596,48 @@ async def list_tournaments_admin(format: Optional[str] = Query(None)):
                             <th>End Date</th>
                         </tr>
                     </thead>
-                    <tbody>{rows_html}</tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
-    return HTMLResponse(content=html)
+                    <tbody>''')
 
+TOURNAMENT_ROW_HTML = (
+    '<tr><td class="device-id">{tournament_id}</td><td>{name}</td>'
+    '<td>{tournament_type}</td><td>{location}</td><td>{start_date}</td><td>{end_date}</td></tr>'
+)
 
-@app.get("/admin/registrations-admin")
-async def list_registrations_admin(format: Optional[str] = Query(None)):
-    """List all team registrations with HTML admin UI."""
-    from fastapi.responses import HTMLResponse
 
-    db = get_db()
-    rows = db.execute("""
-        SELECT tr.*, t.name as team_name, t.abbreviation,
-               d.name as division_name
-        FROM team_registrations tr
-        LEFT JOIN teams t ON tr.team_id = t.team_id
-        LEFT JOIN divisions d ON tr.division_id = d.division_id
-        ORDER BY tr.registered_at DESC
-    """).fetchall()
-    db.close()
+@app.get("/admin/tournaments-admin")
+def list_tournaments_admin(request: Request, format: Optional[str] = Query(None)):
+    """List all tournaments with HTML admin UI."""
+    with get_read_db() as db:
+        tournaments = fetch_dicts(db.execute("""
+            SELECT tournament_id, name, start_date, end_date, location, tournament_type, description, created_at
+            FROM tournaments ORDER BY start_date DESC
+        """))
 
-    registrations = [dict(r) for r in rows]
+    etag = rows_etag(format, tournaments)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     if format == "json":
-        return {"registrations": registrations}
+        return with_etag(json_response({"tournaments": tournaments}), etag)
+
+    render_row = TOURNAMENT_ROW_HTML.format_map
+    rows = [
+        render_row(escape_row({
+            **r,
+            "tournament_type": r["tournament_type"] or "-",
+            "location": r["location"] or "-",
+        }))
+        for r in tournaments
+    ]
+    rows_html = "".join(rows) or '<tr><td colspan="6" style="text-align: center; color: #666; padding: 40px;">No tournaments found.</td></tr>'
 
-    import datetime
-    def format_timestamp(ts):
-        if ts:
-            return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
-        return "-"
+    return with_etag(
+        HTMLResponse(content="".join((TOURNAMENTS_HTML_HEAD, rows_html, ADMIN_TABLE_HTML_TAIL))), etag
+    )
 
-    rows_html = ""
-    if not registrations:
-        rows_html = '<tr><td colspan="7" style="text-align: center; color: #666; padding: 40px;">No registrations found.</td></tr>'
-    else:
-        for r in registrations:
-            context = r["league_id"] or r["tournament_id"] or "-"
-            if r["season_id"]:
-                context += f" / {r['season_id']}"
-            rows_html += f'''
-            <tr>
-                <td class="device-id">{r["registration_id"]}</td>
-                <td>{r["team_name"] or r["team_id"]}</td>
-                <td>{r["abbreviation"] or "-"}</td>
-                <td>{r["division_name"] or r["division_id"]}</td>
-                <td>{context}</td>
-                <td class="timestamp">{format_timestamp(r.get("registered_at"))}</td>
-            </tr>'''
-
-    html = f'''
+
+# Static part of the registrations page above its rows
+REGISTRATIONS_HTML_HEAD = minify_html(f'''
     <!DOCTYPE html>
     <html>
     <head>
@@ -2789,14 +2661,53 @@ async def list_registrations_admin(format: Optional[str] = Query(None)):
                             <th>Registered</th>
                         </tr>
                     </thead>
-                    <tbody>{rows_html}</tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
-    return HTMLResponse(content=html)
+                    <tbody>''')
+
+REGISTRATION_ROW_HTML = (
+    '<tr><td class="device-id">{registration_id}</td><td>{team}</td><td>{abbreviation}</td>'
+    '<td>{division}</td><td>{context}</td><td class="timestamp">{registered}</td></tr>'
+)
+
+
+@app.get("/admin/registrations-admin")
+def list_registrations_admin(request: Request, format: Optional[str] = Query(None)):
+    """List all team registrations with HTML admin UI."""
+    with get_read_db() as db:
+        registrations = fetch_dicts(db.execute("""
+            SELECT tr.*, t.name as team_name, t.abbreviation,
+                   d.name as division_name
+            FROM team_registrations tr
+            LEFT JOIN teams t ON tr.team_id = t.team_id
+            LEFT JOIN divisions d ON tr.division_id = d.division_id
+            ORDER BY tr.registered_at DESC
+        """))
+
+    etag = rows_etag(format, registrations)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    if format == "json":
+        return with_etag(json_response({"registrations": registrations}), etag)
+
+    render_row = REGISTRATION_ROW_HTML.format_map
+    rows = []
+    for r in registrations:
+        context = r["league_id"] or r["tournament_id"] or "-"
+        if r["season_id"]:
+            context += f" / {r['season_id']}"
+        rows.append(render_row(escape_row({
+            "registration_id": r["registration_id"],
+            "team": r["team_name"] or r["team_id"],
+            "abbreviation": r["abbreviation"] or "-",
+            "division": r["division_name"] or r["division_id"],
+            "context": context,
+            "registered": format_timestamp(r["registered_at"]),
+        })))
+    rows_html = "".join(rows) or '<tr><td colspan="7" style="text-align: center; color: #666; padding: 40px;">No registrations found.</td></tr>'
+
+    return with_etag(
+        HTMLResponse(content="".join((REGISTRATIONS_HTML_HEAD, rows_html, ADMIN_TABLE_HTML_TAIL))), etag
+    )
 
 
 # ---------- Database Seeding Admin Page ----------
@@ -2817,331 +2728,43 @@ class ClearRequest(PydanticBaseModel):
     confirm: bool = False
 
 
-@app.get("/admin/seed")
-async def seed_admin_page():
-    """Admin page for database seeding."""
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
-
-    # Get current counts
-    counts = {
-        "leagues": db.execute("SELECT COUNT(*) FROM leagues").fetchone()[0],
-        "seasons": db.execute("SELECT COUNT(*) FROM seasons").fetchone()[0],
-        "divisions": db.execute("SELECT COUNT(*) FROM divisions").fetchone()[0],
-        "rinks": db.execute("SELECT COUNT(*) FROM rinks").fetchone()[0],
-        "teams": db.execute("SELECT COUNT(*) FROM teams").fetchone()[0],
-        "players": db.execute("SELECT COUNT(*) FROM players").fetchone()[0],
-        "registrations": db.execute("SELECT COUNT(*) FROM team_registrations").fetchone()[0],
-        "rosters": db.execute("SELECT COUNT(*) FROM roster_entries").fetchone()[0],
-        "games": db.execute("SELECT COUNT(*) FROM games").fetchone()[0],
-    }
-
-    db.close()
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>score-cloud | Seed Database</title>
-        <link rel="stylesheet" href="/static/admin.css">
-        <style>
-            .seed-container {{
-                display: flex;
-                gap: 24px;
-            }}
-            .seed-options {{
-                flex: 1;
-                background: #fafafa;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                padding: 16px;
-            }}
-            .seed-options h3 {{
-                margin: 0 0 12px 0;
-                font-size: 12px;
-                text-transform: uppercase;
-                color: #666;
-            }}
-            .seed-option {{
-                display: flex;
-                align-items: center;
-                gap: 8px;
-                margin-bottom: 8px;
-            }}
-            .seed-option input[type="checkbox"] {{
-                flex-shrink: 0;
-                width: 16px;
-                height: 16px;
-            }}
-            .seed-option label {{
-                min-width: 140px;
-            }}
-            .seed-option .number-input {{
-                width: 60px;
-                text-align: right;
-                flex-shrink: 0;
-            }}
-            .seed-option .count {{
-                color: #666;
-                font-size: 12px;
-                white-space: nowrap;
-            }}
-            .seed-actions {{
-                width: 200px;
-                flex-shrink: 0;
-            }}
-            .seed-actions button {{
-                width: 100%;
-                padding: 10px 16px;
-                margin-bottom: 8px;
-                font-size: 13px;
-            }}
-            .btn-seed-all {{
-                background: #1a1a2e;
-                color: white;
-            }}
-            .btn-seed-all:hover {{
-                background: #2d2d44;
-            }}
-            .btn-seed-selected {{
-                background: #1e7e34;
-                color: white;
-            }}
-            .btn-clear {{
-                background: #dc3545;
-                color: white;
-            }}
-            #status {{
-                margin-top: 16px;
-                padding: 12px;
-                border-radius: 4px;
-                display: none;
-            }}
-            #status.success {{
-                background: #e6f4ea;
-                color: #1e7e34;
-                border: 1px solid #c3e6cb;
-            }}
-            #status.error {{
-                background: #fce4ec;
-                color: #c62828;
-                border: 1px solid #f5c6cb;
-            }}
-        </style>
-    </head>
-    <body>
-        {admin_nav("seed")}
-        <div class="container">
-            <h1>Database Seeding</h1>
-            <div class="content">
-                <div class="hint">
-                    Seed the database with sample data for development and testing.
-                    Existing data will not be overwritten.
-                </div>
-
-                <div class="seed-container">
-                    <div class="seed-options">
-                        <h3>Seed Options</h3>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-leagues" checked>
-                            <label for="seed-leagues">Leagues</label>
-                            <span class="count">({counts['leagues']} existing)</span>
-                        </div>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-seasons" checked>
-                            <label for="seed-seasons">Seasons</label>
-                            <span class="count">({counts['seasons']} existing)</span>
-                        </div>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-divisions" checked>
-                            <label for="seed-divisions">Divisions</label>
-                            <span class="count">({counts['divisions']} existing)</span>
-                        </div>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-rinks" checked>
-                            <label for="seed-rinks">Rinks</label>
-                            <span class="count">({counts['rinks']} existing)</span>
-                        </div>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-teams" checked>
-                            <label for="seed-teams">Teams</label>
-                            <span class="count">({counts['teams']} existing)</span>
-                        </div>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-players" checked>
-                            <label for="seed-players">Players</label>
-                            <input type="number" id="player-count" class="number-input" value="120" min="10" max="500">
-                            <span class="count">({counts['players']} existing)</span>
-                        </div>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-registrations" checked>
-                            <label for="seed-registrations">Team Registrations</label>
-                            <span class="count">({counts['registrations']} existing)</span>
-                        </div>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-rosters" checked>
-                            <label for="seed-rosters">Roster Entries</label>
-                            <span class="count">({counts['rosters']} existing)</span>
-                        </div>
-
-                        <div class="seed-option">
-                            <input type="checkbox" id="seed-games" checked>
-                            <label for="seed-games">Games</label>
-                            <input type="number" id="game-count" class="number-input" value="8" min="1" max="50">
-                            <span class="count">({counts['games']} existing)</span>
-                        </div>
-                    </div>
-
-                    <div class="seed-actions">
-                        <h3>Actions</h3>
-                        <button class="btn-seed-all" onclick="seedAll()">Seed All</button>
-                        <button class="btn-seed-selected" onclick="seedSelected()">Seed Selected</button>
-                        <button class="btn-clear" onclick="clearAll()">Clear All Data</button>
-                    </div>
-                </div>
-
-                <div id="status"></div>
-            </div>
-        </div>
-
-        <script>
-        function showStatus(message, type) {{
-            const status = document.getElementById('status');
-            status.textContent = message;
-            status.className = type;
-            status.style.display = 'block';
-        }}
-
-        function getSelectedCategories() {{
-            const categories = [];
-            if (document.getElementById('seed-leagues').checked) categories.push('leagues');
-            if (document.getElementById('seed-seasons').checked) categories.push('seasons');
-            if (document.getElementById('seed-divisions').checked) categories.push('divisions');
-            if (document.getElementById('seed-rinks').checked) categories.push('rinks');
-            if (document.getElementById('seed-teams').checked) categories.push('teams');
-            if (document.getElementById('seed-players').checked) categories.push('players');
-            if (document.getElementById('seed-registrations').checked) categories.push('registrations');
-            if (document.getElementById('seed-rosters').checked) categories.push('rosters');
-            if (document.getElementById('seed-games').checked) categories.push('games');
-            return categories;
-        }}
-
-        async function seedAll() {{
-            showStatus('Seeding all data...', 'success');
-
-            try {{
-                const response = await fetch('/admin/seed', {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{
-                        seed_all: true,
-                        player_count: parseInt(document.getElementById('player-count').value),
-                        game_count: parseInt(document.getElementById('game-count').value)
-                    }})
-                }});
-
-                const result = await response.json();
-
-                if (response.ok) {{
-                    const seeded = result.seeded;
-                    const summary = Object.entries(seeded)
-                        .filter(([k, v]) => v > 0)
-                        .map(([k, v]) => `${{k}}: ${{v}}`)
-                        .join(', ');
-                    showStatus(`Seeded: ${{summary}}`, 'success');
-                    setTimeout(() => location.reload(), 2000);
-                }} else {{
-                    showStatus(`Error: ${{result.detail || 'Failed to seed'}}`, 'error');
-                }}
-            }} catch (error) {{
-                showStatus(`Error: ${{error.message}}`, 'error');
-            }}
-        }}
+# Label and table for each count shown on the seed page
+SEED_COUNT_TABLES = [
+    ("leagues", "leagues"),
+    ("seasons", "seasons"),
+    ("divisions", "divisions"),
+    ("rinks", "rinks"),
+    ("teams", "teams"),
+    ("players", "players"),
+    ("registrations", "team_registrations"),
+    ("rosters", "roster_entries"),
+    ("games", "games"),
+]
 
-        async function seedSelected() {{
-            const categories = getSelectedCategories();
-            if (categories.length === 0) {{
-                showStatus('Please select at least one category', 'error');
-                return;
-            }}
+# All current counts in one statement
+SEED_COUNTS_SQL = " UNION ALL ".join(
+    f"SELECT '{label}', COUNT(*) FROM {table}" for label, table in SEED_COUNT_TABLES
+)
 
-            showStatus('Seeding selected categories...', 'success');
-
-            try {{
-                const response = await fetch('/admin/seed', {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{
-                        categories: categories,
-                        player_count: parseInt(document.getElementById('player-count').value),
-                        game_count: parseInt(document.getElementById('game-count').value)
-                    }})
-                }});
-
-                const result = await response.json();
-
-                if (response.ok) {{
-                    const seeded = result.seeded;
-                    const summary = Object.entries(seeded)
-                        .filter(([k, v]) => v > 0)
-                        .map(([k, v]) => `${{k}}: ${{v}}`)
-                        .join(', ');
-                    showStatus(`Seeded: ${{summary || 'nothing new'}}`, 'success');
-                    setTimeout(() => location.reload(), 2000);
-                }} else {{
-                    showStatus(`Error: ${{result.detail || 'Failed to seed'}}`, 'error');
-                }}
-            }} catch (error) {{
-                showStatus(`Error: ${{error.message}}`, 'error');
-            }}
-        }}
 
-        async function clearAll() {{
-            if (!confirm('Are you sure you want to clear ALL data? This cannot be undone.')) {{
-                return;
-            }}
+@app.get("/admin/seed")
+def seed_admin_page(request: Request):
+    """Admin page for database seeding."""
+    with get_read_db() as db:
+        counts = dict(db.execute(SEED_COUNTS_SQL).fetchall())
 
-            showStatus('Clearing all data...', 'success');
-
-            try {{
-                const response = await fetch('/admin/seed/clear', {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ confirm: true }})
-                }});
-
-                const result = await response.json();
-
-                if (response.ok) {{
-                    showStatus('All data cleared', 'success');
-                    setTimeout(() => location.reload(), 1500);
-                }} else {{
-                    showStatus(`Error: ${{result.detail || 'Failed to clear'}}`, 'error');
-                }}
-            }} catch (error) {{
-                showStatus(`Error: ${{error.message}}`, 'error');
-            }}
-        }}
-        </script>
-    </body>
-    </html>
-    '''
+    # The page only varies with the table counts
+    etag = rows_etag(counts)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    return HTMLResponse(content=html)
+    return with_etag(
+        HTMLResponse(content=SEED_TEMPLATE.render(nav=admin_nav("seed"), counts=counts)), etag
+    )
 
 
 @app.post("/admin/seed")
-async def execute_seed(request: SeedRequest):
+def execute_seed(request: SeedRequest):
     """Execute database seeding."""
     from score.seed import (
         seed_leagues, seed_seasons, seed_divisions, seed_rinks,
@@ -3149,10 +2772,9 @@ async def execute_seed(request: SeedRequest):
         seed_registrations, seed_rosters, seed_games
     )
 
-    db = get_db()
     results = {}
 
-    try:
+    with get_seed_db() as db:
         if request.seed_all:
             # Seed everything in order
             results["leagues"] = seed_leagues(db)
@@ -3188,10 +2810,7 @@ async def execute_seed(request: SeedRequest):
             if "games" in request.categories:
                 results["games"] = seed_games(db, request.game_count)
 
-        db.commit()
-
-    finally:
-        db.close()
+        bump_schedule_versions(db)
 
     logger.info(f"Database seeded: {results}")
 
@@ -3202,20 +2821,18 @@ async def execute_seed(request: SeedRequest):
 
 
 @app.post("/admin/seed/clear")
-async def clear_seed_data(request: ClearRequest):
+def clear_seed_data(request: ClearRequest):
     """Clear all seeded data from database."""
     if not request.confirm:
         raise HTTPException(status_code=400, detail="Must confirm to clear data")
 
     from score.seed import clear_all
 
-    db = get_db()
-
-    try:
+    with get_seed_db() as db:
         counts = clear_all(db)
-        db.commit()
-    finally:
-        db.close()
+        db.execute("DELETE FROM schedule_versions")
+    with _schedule_cache_lock:
+        SCHEDULE_CACHE.clear()
 
     logger.info(f"Database cleared: {counts}")
 
@@ -3226,6 +2843,176 @@ async def clear_seed_data(request: ClearRequest):
 
 
 # ---------- Admin: Stats Query Functions ----------
+# Stats queries keep one SQL text for every filter combination so each is
+# prepared once and then served from the connection's statement cache; an
+# unset filter binds NULL and matches everything. Goal events join their
+# team's registration by primary key, picking the home or away side by type
+STATS_TEAM_FILTER = """(:league_id IS NULL OR tr.league_id = :league_id)
+        AND (:season_id IS NULL OR tr.season_id = :season_id)
+        AND (:division_id IS NULL OR tr.division_id = :division_id)"""
+
+CONTEXT_GAMES_SQL = """
+    SELECT DISTINCT g.game_id
+    FROM games g
+    LEFT JOIN team_registrations hr ON g.home_registration_id = hr.registration_id
+    LEFT JOIN team_registrations ar ON g.away_registration_id = ar.registration_id
+    WHERE (:league_id IS NULL OR hr.league_id = :league_id OR ar.league_id = :league_id)
+        AND (:season_id IS NULL OR hr.season_id = :season_id OR ar.season_id = :season_id)
+        AND (:division_id IS NULL OR hr.division_id = :division_id OR ar.division_id = :division_id)
+"""
+
+FINISHED_GAMES_SQL = """
+    SELECT DISTINCT game_id
+    FROM received_events
+    WHERE type IN ('GAME_END', 'GAME_FINALIZED')
+"""
+
+TOP_SCORERS_SQL = f"""
+    SELECT
+        json_extract(e.payload, '$.scorer_id') as player_id,
+        p.full_name,
+        SUM(json_extract(e.payload, '$.value')) as goals
+    FROM received_events e
+    JOIN games g ON e.game_id = g.game_id
+    LEFT JOIN team_registrations tr ON tr.registration_id = CASE e.type
+        WHEN 'GOAL_HOME' THEN g.home_registration_id
+        ELSE g.away_registration_id
+    END
+    LEFT JOIN players p ON json_extract(e.payload, '$.scorer_id') = p.player_id
+    WHERE e.type IN ('GOAL_HOME', 'GOAL_AWAY')
+        AND json_extract(e.payload, '$.scorer_id') IS NOT NULL
+        AND {STATS_TEAM_FILTER}
+    GROUP BY player_id, p.full_name
+    HAVING goals > 0
+    ORDER BY goals DESC
+    LIMIT :limit
+"""
+
+# Counts assist1_id and assist2_id together through a UNION ALL
+# This sums values for both primary and secondary assists (handles cancellations)
+TOP_ASSISTS_SQL = f"""
+    SELECT
+        assists.player_id,
+        p.full_name,
+        SUM(assists.value) as assists
+    FROM (
+        -- Primary assists
+        SELECT
+            json_extract(e.payload, '$.assist1_id') as player_id,
+            e.game_id,
+            e.type,
+            json_extract(e.payload, '$.value') as value
+        FROM received_events e
+        WHERE e.type IN ('GOAL_HOME', 'GOAL_AWAY')
+            AND json_extract(e.payload, '$.assist1_id') IS NOT NULL
+
+        UNION ALL
+
+        -- Secondary assists
+        SELECT
+            json_extract(e.payload, '$.assist2_id') as player_id,
+            e.game_id,
+            e.type,
+            json_extract(e.payload, '$.value') as value
+        FROM received_events e
+        WHERE e.type IN ('GOAL_HOME', 'GOAL_AWAY')
+            AND json_extract(e.payload, '$.assist2_id') IS NOT NULL
+    ) assists
+    JOIN games g ON assists.game_id = g.game_id
+    LEFT JOIN team_registrations tr ON tr.registration_id = CASE assists.type
+        WHEN 'GOAL_HOME' THEN g.home_registration_id
+        ELSE g.away_registration_id
+    END
+    LEFT JOIN players p ON assists.player_id = p.player_id
+    WHERE {STATS_TEAM_FILTER}
+    GROUP BY assists.player_id, p.full_name
+    HAVING assists > 0
+    ORDER BY assists DESC
+    LIMIT :limit
+"""
+
+# Goals and assists combined in a single query
+TOP_POINTS_SQL = f"""
+    SELECT
+        all_points.player_id,
+        p.full_name,
+        MAX(re.jersey_number) as jersey_number,
+        MAX(t.abbreviation) as team_abbrev,
+        MAX(l.name) as league_name,
+        MAX(s.name) as season_name,
+        MAX(d.name) as division_name,
+        SUM(points) as points,
+        SUM(CASE WHEN point_type = 'goal' THEN points ELSE 0 END) as goals,
+        SUM(CASE WHEN point_type = 'assist' THEN points ELSE 0 END) as assists
+    FROM (
+        -- Goals
+        SELECT
+            json_extract(e.payload, '$.scorer_id') as player_id,
+            e.game_id,
+            e.type,
+            json_extract(e.payload, '$.value') as points,
+            'goal' as point_type
+        FROM received_events e
+        WHERE e.type IN ('GOAL_HOME', 'GOAL_AWAY')
+            AND json_extract(e.payload, '$.scorer_id') IS NOT NULL
+
+        UNION ALL
+
+        -- Primary assists
+        SELECT
+            json_extract(e.payload, '$.assist1_id') as player_id,
+            e.game_id,
+            e.type,
+            json_extract(e.payload, '$.value') as points,
+            'assist' as point_type
+        FROM received_events e
+        WHERE e.type IN ('GOAL_HOME', 'GOAL_AWAY')
+            AND json_extract(e.payload, '$.assist1_id') IS NOT NULL
+
+        UNION ALL
+
+        -- Secondary assists
+        SELECT
+            json_extract(e.payload, '$.assist2_id') as player_id,
+            e.game_id,
+            e.type,
+            json_extract(e.payload, '$.value') as points,
+            'assist' as point_type
+        FROM received_events e
+        WHERE e.type IN ('GOAL_HOME', 'GOAL_AWAY')
+            AND json_extract(e.payload, '$.assist2_id') IS NOT NULL
+    ) all_points
+    JOIN games g ON all_points.game_id = g.game_id
+    LEFT JOIN team_registrations tr ON tr.registration_id = CASE all_points.type
+        WHEN 'GOAL_HOME' THEN g.home_registration_id
+        ELSE g.away_registration_id
+    END
+    LEFT JOIN teams t ON tr.team_id = t.team_id
+    LEFT JOIN leagues l ON tr.league_id = l.league_id
+    LEFT JOIN seasons s ON tr.season_id = s.season_id
+    LEFT JOIN divisions d ON tr.division_id = d.division_id
+    LEFT JOIN roster_entries re ON tr.registration_id = re.registration_id
+        AND all_points.player_id = re.player_id
+        AND re.removed_at IS NULL
+    LEFT JOIN players p ON all_points.player_id = p.player_id
+    WHERE {STATS_TEAM_FILTER}
+    GROUP BY all_points.player_id, p.full_name
+    HAVING points > 0
+    ORDER BY points DESC, goals DESC
+    LIMIT :limit
+"""
+
+
+def stats_filter_params(league_id=None, season_id=None, division_id=None, limit=None) -> dict:
+    """Named parameters for the stats queries; empty filters bind NULL."""
+    return {
+        "league_id": league_id or None,
+        "season_id": season_id or None,
+        "division_id": division_id or None,
+        "limit": limit,
+    }
+
+
 def get_final_games(db, league_id=None, season_id=None, division_id=None):
     """Get list of game IDs considered 'final' for stats purposes.
 
@@ -3233,239 +3020,55 @@ def get_final_games(db, league_id=None, season_id=None, division_id=None):
     Workaround: Consider games with GAME_END events OR games older than 3 hours
     OR just return all games matching the league/season/division filter.
     """
-    # Build query based on filters
     if league_id or season_id or division_id:
         # Filter by league/season/division context
-        query = """
-            SELECT DISTINCT g.game_id
-            FROM games g
-            LEFT JOIN team_registrations hr ON g.home_registration_id = hr.registration_id
-            LEFT JOIN team_registrations ar ON g.away_registration_id = ar.registration_id
-            WHERE 1=1
-        """
-        if league_id:
-            query += f" AND (hr.league_id = '{league_id}' OR ar.league_id = '{league_id}')"
-        if season_id:
-            query += f" AND (hr.season_id = '{season_id}' OR ar.season_id = '{season_id}')"
-        if division_id:
-            query += f" AND (hr.division_id = '{division_id}' OR ar.division_id = '{division_id}')"
-
-        rows = db.execute(query).fetchall()
-        game_ids = [dict(r)["game_id"] for r in rows]
-        return game_ids
+        rows = db.execute(CONTEXT_GAMES_SQL, stats_filter_params(league_id, season_id, division_id))
+        return [r[0] for r in rows]
     else:
         # No filters - try to find games with GAME_END events
         # If none exist, return empty (will show all events unfiltered)
-        query = """
-            SELECT DISTINCT game_id
-            FROM received_events
-            WHERE type IN ('GAME_END', 'GAME_FINALIZED')
-        """
-        rows = db.execute(query).fetchall()
-        game_ids = [dict(r)["game_id"] for r in rows]
+        game_ids = [r[0] for r in db.execute(FINISHED_GAMES_SQL)]
         return game_ids if game_ids else None  # None means "no filter"
 
 
 def query_top_scorers(db, league_id=None, season_id=None, division_id=None, final_only=True, limit=20):
     """Query top goal scorers from events, properly filtered by team context."""
-
-    # Build WHERE clause for team registration filters
-    filter_conditions = []
-    if league_id:
-        filter_conditions.append(f"tr.league_id = '{league_id}'")
-    if season_id:
-        filter_conditions.append(f"tr.season_id = '{season_id}'")
-    if division_id:
-        filter_conditions.append(f"tr.division_id = '{division_id}'")
-
-    team_filter = f"AND ({' AND '.join(filter_conditions)})" if filter_conditions else ""
-
-    query = f"""
-        SELECT
-            json_extract(e.payload, '$.scorer_id') as player_id,
-            p.full_name,
-            SUM(json_extract(e.payload, '$.value')) as goals
-        FROM received_events e
-        JOIN games g ON e.game_id = g.game_id
-        LEFT JOIN team_registrations tr ON (
-            CASE
-                WHEN e.type = 'GOAL_HOME' THEN g.home_registration_id = tr.registration_id
-                WHEN e.type = 'GOAL_AWAY' THEN g.away_registration_id = tr.registration_id
-            END
-        )
-        LEFT JOIN players p ON json_extract(e.payload, '$.scorer_id') = p.player_id
-        WHERE (e.type = 'GOAL_HOME' OR e.type = 'GOAL_AWAY')
-            AND json_extract(e.payload, '$.scorer_id') IS NOT NULL
-            {team_filter}
-        GROUP BY player_id, p.full_name
-        HAVING goals > 0
-        ORDER BY goals DESC
-        LIMIT {limit}
-    """
-
-    rows = db.execute(query).fetchall()
-    return [dict(r) for r in rows]
+    return fetch_dicts(db.execute(TOP_SCORERS_SQL, stats_filter_params(league_id, season_id, division_id, limit)))
 
 
 def query_top_assists(db, league_id=None, season_id=None, division_id=None, final_only=True, limit=20):
     """Query top assist leaders from events, properly filtered by team context."""
-
-    # Build WHERE clause for team registration filters
-    filter_conditions = []
-    if league_id:
-        filter_conditions.append(f"tr.league_id = '{league_id}'")
-    if season_id:
-        filter_conditions.append(f"tr.season_id = '{season_id}'")
-    if division_id:
-        filter_conditions.append(f"tr.division_id = '{division_id}'")
-
-    team_filter = f"AND ({' AND '.join(filter_conditions)})" if filter_conditions else ""
-
-    # Query both assist1_id and assist2_id, combining them in a UNION
-    # This sums values for both primary and secondary assists (handles cancellations)
-    query = f"""
-        SELECT
-            assists.player_id,
-            p.full_name,
-            SUM(assists.value) as assists
-        FROM (
-            -- Primary assists
-            SELECT
-                json_extract(e.payload, '$.assist1_id') as player_id,
-                e.game_id,
-                e.type,
-                json_extract(e.payload, '$.value') as value
-            FROM received_events e
-            WHERE (e.type = 'GOAL_HOME' OR e.type = 'GOAL_AWAY')
-                AND json_extract(e.payload, '$.assist1_id') IS NOT NULL
-
-            UNION ALL
-
-            -- Secondary assists
-            SELECT
-                json_extract(e.payload, '$.assist2_id') as player_id,
-                e.game_id,
-                e.type,
-                json_extract(e.payload, '$.value') as value
-            FROM received_events e
-            WHERE (e.type = 'GOAL_HOME' OR e.type = 'GOAL_AWAY')
-                AND json_extract(e.payload, '$.assist2_id') IS NOT NULL
-        ) assists
-        JOIN games g ON assists.game_id = g.game_id
-        LEFT JOIN team_registrations tr ON (
-            CASE
-                WHEN assists.type = 'GOAL_HOME' THEN g.home_registration_id = tr.registration_id
-                WHEN assists.type = 'GOAL_AWAY' THEN g.away_registration_id = tr.registration_id
-            END
-        )
-        LEFT JOIN players p ON assists.player_id = p.player_id
-        WHERE 1=1
-            {team_filter}
-        GROUP BY assists.player_id, p.full_name
-        HAVING assists > 0
-        ORDER BY assists DESC
-        LIMIT {limit}
-    """
-
-    rows = db.execute(query).fetchall()
-    return [dict(r) for r in rows]
+    return fetch_dicts(db.execute(TOP_ASSISTS_SQL, stats_filter_params(league_id, season_id, division_id, limit)))
 
 
 def query_top_points(db, league_id=None, season_id=None, division_id=None, final_only=True, limit=20):
     """Query top point leaders (goals + assists) from events, properly filtered by team context."""
+    return fetch_dicts(db.execute(TOP_POINTS_SQL, stats_filter_params(league_id, season_id, division_id, limit)))
 
-    # Build WHERE clause for team registration filters
-    filter_conditions = []
-    if league_id:
-        filter_conditions.append(f"tr.league_id = '{league_id}'")
-    if season_id:
-        filter_conditions.append(f"tr.season_id = '{season_id}'")
-    if division_id:
-        filter_conditions.append(f"tr.division_id = '{division_id}'")
 
-    team_filter = f"AND ({' AND '.join(filter_conditions)})" if filter_conditions else ""
+# ---------- Admin: Stats Page ----------
+POINTS_ROW_HTML = (
+    "<tr><td>{league_name}</td><td>{season_name}</td><td>{division_name}</td>"
+    "<td>{team_abbrev}</td><td>{full_name}</td><td>{jersey_number}</td>"
+    "<td>{goals}</td><td>{assists}</td><td><strong>{points}</strong></td></tr>"
+)
+
 
-    # Combine goals and assists in a single query
-    query = f"""
-        SELECT
-            all_points.player_id,
-            p.full_name,
-            MAX(re.jersey_number) as jersey_number,
-            MAX(t.abbreviation) as team_abbrev,
-            MAX(l.name) as league_name,
-            MAX(s.name) as season_name,
-            MAX(d.name) as division_name,
-            SUM(points) as points,
-            SUM(CASE WHEN point_type = 'goal' THEN points ELSE 0 END) as goals,
-            SUM(CASE WHEN point_type = 'assist' THEN points ELSE 0 END) as assists
-        FROM (
-            -- Goals
-            SELECT
-                json_extract(e.payload, '$.scorer_id') as player_id,
-                e.game_id,
-                e.type,
-                json_extract(e.payload, '$.value') as points,
-                'goal' as point_type
-            FROM received_events e
-            WHERE (e.type = 'GOAL_HOME' OR e.type = 'GOAL_AWAY')
-                AND json_extract(e.payload, '$.scorer_id') IS NOT NULL
-
-            UNION ALL
-
-            -- Primary assists
-            SELECT
-                json_extract(e.payload, '$.assist1_id') as player_id,
-                e.game_id,
-                e.type,
-                json_extract(e.payload, '$.value') as points,
-                'assist' as point_type
-            FROM received_events e
-            WHERE (e.type = 'GOAL_HOME' OR e.type = 'GOAL_AWAY')
-                AND json_extract(e.payload, '$.assist1_id') IS NOT NULL
-
-            UNION ALL
-
-            -- Secondary assists
-            SELECT
-                json_extract(e.payload, '$.assist2_id') as player_id,
-                e.game_id,
-                e.type,
-                json_extract(e.payload, '$.value') as points,
-                'assist' as point_type
-            FROM received_events e
-            WHERE (e.type = 'GOAL_HOME' OR e.type = 'GOAL_AWAY')
-                AND json_extract(e.payload, '$.assist2_id') IS NOT NULL
-        ) all_points
-        JOIN games g ON all_points.game_id = g.game_id
-        LEFT JOIN team_registrations tr ON (
-            CASE
-                WHEN all_points.type = 'GOAL_HOME' THEN g.home_registration_id = tr.registration_id
-                WHEN all_points.type = 'GOAL_AWAY' THEN g.away_registration_id = tr.registration_id
-            END
-        )
-        LEFT JOIN teams t ON tr.team_id = t.team_id
-        LEFT JOIN leagues l ON tr.league_id = l.league_id
-        LEFT JOIN seasons s ON tr.season_id = s.season_id
-        LEFT JOIN divisions d ON tr.division_id = d.division_id
-        LEFT JOIN roster_entries re ON tr.registration_id = re.registration_id
-            AND all_points.player_id = re.player_id
-            AND re.removed_at IS NULL
-        LEFT JOIN players p ON all_points.player_id = p.player_id
-        WHERE 1=1
-            {team_filter}
-        GROUP BY all_points.player_id, p.full_name
-        HAVING points > 0
-        ORDER BY points DESC, goals DESC
-        LIMIT {limit}
-    """
-
-    rows = db.execute(query).fetchall()
-    return [dict(r) for r in rows]
+def render_points_row(p: dict) -> str:
+    """Render one points leaderboard row, filling placeholders for missing values."""
+    return POINTS_ROW_HTML.format_map(escape_row({
+        **p,
+        "league_name": p["league_name"] or "-",
+        "season_name": p["season_name"] or "-",
+        "division_name": p["division_name"] or "-",
+        "team_abbrev": p["team_abbrev"] or "-",
+        "full_name": p["full_name"] or "Unknown Player",
+        "jersey_number": p["jersey_number"] or "-",
+    }))
 
 
-# ---------- Admin: Stats Page ----------
 @app.get("/admin/stats")
-async def stats_page(
+def stats_page(
     league_id: Optional[str] = Query(None),
     season_id: Optional[str] = Query(None),
     division_id: Optional[str] = Query(None),
@@ -3473,27 +3076,22 @@ async def stats_page(
     format: Optional[str] = Query(None)
 ):
     """Statistics leaderboards page."""
-    from fastapi.responses import HTMLResponse
-
-    db = get_db()
-
-    # Query player stats
-    scorers = query_top_scorers(db, league_id, season_id, division_id, final_only)
-    assists_leaders = query_top_assists(db, league_id, season_id, division_id, final_only)
-    points_leaders = query_top_points(db, league_id, season_id, division_id, final_only)
+    with get_read_db() as db:
+        # Query player stats
+        scorers = query_top_scorers(db, league_id, season_id, division_id, final_only)
+        assists_leaders = query_top_assists(db, league_id, season_id, division_id, final_only)
+        points_leaders = query_top_points(db, league_id, season_id, division_id, final_only)
     penalty_leaders = []  # TODO: implement
     standings = []  # TODO: implement
 
-    db.close()
-
     if format == "json":
-        return {
+        return json_response({
             "scorers": scorers,
             "assists": assists_leaders,
             "points": points_leaders,
             "penalties": penalty_leaders,
             "standings": standings
-        }
+        })
 
     # Generate HTML
     html = f"""<!DOCTYPE html>
@@ -3540,7 +3138,7 @@ async def stats_page(
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(f'<tr><td>{p["league_name"] or "-"}</td><td>{p["season_name"] or "-"}</td><td>{p["division_name"] or "-"}</td><td>{p["team_abbrev"] or "-"}</td><td>{p["full_name"] or "Unknown Player"}</td><td>{p["jersey_number"] or "-"}</td><td>{p["goals"]}</td><td>{p["assists"]}</td><td><strong>{p["points"]}</strong></td></tr>' for p in points_leaders)}
+                    {"".join(map(render_points_row, points_leaders))}
                 </tbody>
             </table>
             '''}
@@ -33,6 +33,7 @@ class CloudConfig:
 
     # Database
     DB_PATH = os.getenv("CLOUD_DB_PATH", "cloud.db")
+    DB_POOL_SIZE = int(os.getenv("CLOUD_DB_POOL_SIZE", "8"))
 
 
 def get_app_config():
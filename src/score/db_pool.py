@@ -0,0 +1,224 @@
+"""Pooled SQLite connections for score-cloud.
+
+Opening a connection per request throws away SQLite's page cache and
+re-runs connection setup every time. get_db() hands out connections from
+a pool instead; they are configured once when first opened.
+
+SQLite allows one writer at a time. The ingest hot paths share a single
+write connection serialized by a lock, so concurrent requests queue in
+Python instead of failing with "database is locked"; their reads borrow
+from a small pool of read-only connections.
+
+All pools belong to one database file. Asking for a connection to a
+different path closes the idle connections and starts over, which keeps
+tests that point the app at a fresh temp database isolated.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from score.config import CloudConfig
+
+READ_POOL_SIZE = (os.cpu_count() or 2) * 2
+
+_write_lock = threading.Lock()
+_pool_lock = threading.Lock()
+_pool_db_path: Optional[str] = None
+_write_conn: Optional[sqlite3.Connection] = None
+_write_conn_path: Optional[str] = None
+_read_pool: queue.SimpleQueue = queue.SimpleQueue()
+_db_pool: queue.LifoQueue = queue.LifoQueue(maxsize=CloudConfig.DB_POOL_SIZE)
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    Connection handed out by get_db().
+
+    close() rolls back uncommitted work and returns the connection to the
+    pool rather than closing it. Used as a context manager it commits (or
+    rolls back on error) and then returns itself to the pool on exit.
+    """
+
+    pool: Optional[queue.LifoQueue] = None
+    checked_out = False
+
+    def close(self):
+        if not self.checked_out:
+            return
+        self.checked_out = False
+        if self.in_transaction:
+            self.rollback()
+        if self.pool is _db_pool:
+            try:
+                self.pool.put_nowait(self)
+                return
+            except queue.Full:
+                pass
+        sqlite3.Connection.close(self)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        self.close()
+        return False
+
+
+def _configure_connection(conn: sqlite3.Connection, writable: bool = True) -> sqlite3.Connection:
+    """Apply per-connection settings once, when the connection is opened."""
+    conn.row_factory = sqlite3.Row
+    if writable:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    # Map the file so reads are served from the OS page cache without copies
+    conn.execute("PRAGMA mmap_size = 268435456")
+    return conn
+
+
+def get_db(db_path: str) -> PooledConnection:
+    """
+    Get a pooled database connection.
+
+    Call close() (or use `with get_db(path) as db:`) to return it to the pool.
+    """
+    _reset_connections_if_moved(db_path)
+    pool = _db_pool
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _configure_connection(sqlite3.connect(
+            db_path, factory=PooledConnection, check_same_thread=False, cached_statements=256
+        ))
+        conn.pool = pool
+    conn.checked_out = True
+    return conn
+
+
+def _close_all():
+    """
+    Close every idle pooled connection. Caller must hold _pool_lock.
+
+    The shared write connection is left alone: another thread may be inside
+    a get_write_db() block, so it is only closed under _write_lock.
+    """
+    global _read_pool, _db_pool
+    while True:
+        try:
+            _read_pool.get_nowait().close()
+        except queue.Empty:
+            break
+    while True:
+        try:
+            sqlite3.Connection.close(_db_pool.get_nowait())
+        except queue.Empty:
+            break
+    _read_pool = queue.SimpleQueue()
+    _db_pool = queue.LifoQueue(maxsize=CloudConfig.DB_POOL_SIZE)
+
+
+def close_connections():
+    """Close the shared write connection and all pooled connections."""
+    global _pool_db_path
+    with _write_lock:
+        _close_write_connection()
+    with _pool_lock:
+        _close_all()
+        _pool_db_path = None
+
+
+def _reset_connections_if_moved(db_path: str):
+    """(Re)initialize connection state when the database path changes."""
+    global _pool_db_path
+    if _pool_db_path == db_path:
+        return
+    with _pool_lock:
+        if _pool_db_path != db_path:
+            _close_all()
+            _pool_db_path = db_path
+
+
+def _open_read_connection(db_path: str) -> sqlite3.Connection:
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+    return _configure_connection(conn, writable=False)
+
+
+def _open_write_connection(db_path: str) -> sqlite3.Connection:
+    # Autocommit mode: transactions are opened explicitly in get_write_db()
+    conn = sqlite3.connect(
+        db_path, isolation_level=None, check_same_thread=False, cached_statements=256
+    )
+    _configure_connection(conn)
+    # Lets event ingest rely on received_events -> games to reject unknown games
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def _close_write_connection():
+    """Close the shared write connection. Caller must hold _write_lock."""
+    global _write_conn, _write_conn_path
+    if _write_conn is not None:
+        _write_conn.close()
+    _write_conn = None
+    _write_conn_path = None
+
+
+@contextmanager
+def get_write_db(db_path: str):
+    """
+    Borrow the shared write connection inside a BEGIN IMMEDIATE transaction.
+
+    Commits on normal exit and rolls back if the block raises.
+    """
+    global _write_conn, _write_conn_path
+    with _write_lock:
+        _reset_connections_if_moved(db_path)
+        if _write_conn_path != db_path:
+            _close_write_connection()
+        if _write_conn is None:
+            _write_conn = _open_write_connection(db_path)
+            _write_conn_path = db_path
+        conn = _write_conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        try:
+            conn.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT (I/O error, disk full, deferred constraint)
+            # leaves the transaction open, and every later BEGIN IMMEDIATE on
+            # the shared connection would fail. Roll back, or start over with
+            # a fresh connection if even that fails.
+            try:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                _close_write_connection()
+            raise
+
+
+@contextmanager
+def get_read_db(db_path: str):
+    """Borrow a read-only connection from the pool."""
+    _reset_connections_if_moved(db_path)
+    pool = _read_pool
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _open_read_connection(db_path)
+    try:
+        yield conn
+    finally:
+        # Return to the pool unless the database moved or the pool is full
+        if pool is _read_pool and pool.qsize() < READ_POOL_SIZE:
+            pool.put(conn)
+        else:
+            conn.close()
@@ -365,6 +365,11 @@ class RosterEntry(BaseModel):
     is_alternate: bool = False
 
 
+class RosterEntryBatch(BaseModel):
+    """Roster entries added together in one transaction."""
+    entries: list[RosterEntry]
+
+
 class SparePlayer(BaseModel):
     """Player available to sub."""
     player_id: int
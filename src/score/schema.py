@@ -515,6 +515,11 @@ CREATE INDEX IF NOT EXISTS idx_team_reg_league_season ON team_registrations(leag
 CREATE INDEX IF NOT EXISTS idx_team_reg_tournament ON team_registrations(tournament_id);
 CREATE INDEX IF NOT EXISTS idx_team_reg_division ON team_registrations(division_id);
 
+-- Players
+-- Serves the admin list's ORDER BY last_name, first_name without a sort;
+-- with created_at (and the implicit player_id rowid) it covers the page query
+CREATE INDEX IF NOT EXISTS idx_players_name ON players(last_name, first_name, created_at);
+
 -- Roster entries
 CREATE INDEX IF NOT EXISTS idx_roster_registration ON roster_entries(registration_id);
 CREATE INDEX IF NOT EXISTS idx_roster_player ON roster_entries(player_id);
@@ -525,7 +530,10 @@ CREATE INDEX IF NOT EXISTS idx_spare_league_season ON spare_players(league_id, s
 -- Games
 CREATE INDEX IF NOT EXISTS idx_games_schedule ON games(scheduled_start);
 CREATE INDEX IF NOT EXISTS idx_games_registrations ON games(home_registration_id, away_registration_id);
-CREATE INDEX IF NOT EXISTS idx_games_rink ON games(rink_id);
+-- (rink_id, start_time) serves the per-rink schedule range query; it
+-- supersedes the old single-column rink_id index.
+DROP INDEX IF EXISTS idx_games_rink;
+CREATE INDEX IF NOT EXISTS idx_games_rink_start ON games(rink_id, start_time);
 
 -- Events
 CREATE INDEX IF NOT EXISTS idx_events_game ON events(game_id);
@@ -533,8 +541,20 @@ CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);
 CREATE INDEX IF NOT EXISTS idx_events_player ON events(player_id);
 
 -- Received events
-CREATE INDEX IF NOT EXISTS idx_received_events_game ON received_events(game_id);
-CREATE INDEX IF NOT EXISTS idx_received_events_event_id ON received_events(event_id);
+-- (game_id, seq) serves per-game lookups and replay ordering without a sort;
+-- it supersedes the old single-column game_id index.
+DROP INDEX IF EXISTS idx_received_events_game;
+CREATE INDEX IF NOT EXISTS idx_received_events_game_seq ON received_events(game_id, seq);
+-- event_id is UNIQUE, so SQLite already maintains an index for it; a second
+-- explicit index only doubled the per-insert index work on the ingest path.
+DROP INDEX IF EXISTS idx_received_events_event_id;
+-- Stats leaderboards only read goal events; this partial index lets them scan
+-- just those rows, and carries the payload fields they extract
+CREATE INDEX IF NOT EXISTS idx_received_events_goals ON received_events(
+    game_id, type,
+    json_extract(payload, '$.scorer_id'), json_extract(payload, '$.assist1_id'),
+    json_extract(payload, '$.assist2_id'), json_extract(payload, '$.value')
+) WHERE type IN ('GOAL_HOME', 'GOAL_AWAY');
 
 -- Heartbeats
 CREATE INDEX IF NOT EXISTS idx_heartbeats_device ON heartbeats(device_id, received_at DESC);
@@ -546,6 +566,37 @@ CREATE INDEX IF NOT EXISTS idx_brackets_league_season ON playoff_brackets(league
 CREATE INDEX IF NOT EXISTS idx_series_bracket ON playoff_series(bracket_id);
 """
 
+# =============================================================================
+# Full-Text Search
+# =============================================================================
+
+# External-content FTS5 index over player names and birthplaces. It stores
+# only the index; rows are read back from players, and the triggers keep
+# the two in step.
+PLAYER_SEARCH = """
+CREATE VIRTUAL TABLE IF NOT EXISTS players_fts USING fts5(
+    full_name, first_name, last_name, birth_city, birth_country,
+    content='players', content_rowid='player_id'
+);
+
+CREATE TRIGGER IF NOT EXISTS players_fts_insert AFTER INSERT ON players BEGIN
+    INSERT INTO players_fts (rowid, full_name, first_name, last_name, birth_city, birth_country)
+    VALUES (new.player_id, new.full_name, new.first_name, new.last_name, new.birth_city, new.birth_country);
+END;
+
+CREATE TRIGGER IF NOT EXISTS players_fts_delete AFTER DELETE ON players BEGIN
+    INSERT INTO players_fts (players_fts, rowid, full_name, first_name, last_name, birth_city, birth_country)
+    VALUES ('delete', old.player_id, old.full_name, old.first_name, old.last_name, old.birth_city, old.birth_country);
+END;
+
+CREATE TRIGGER IF NOT EXISTS players_fts_update AFTER UPDATE ON players BEGIN
+    INSERT INTO players_fts (players_fts, rowid, full_name, first_name, last_name, birth_city, birth_country)
+    VALUES ('delete', old.player_id, old.full_name, old.first_name, old.last_name, old.birth_city, old.birth_country);
+    INSERT INTO players_fts (rowid, full_name, first_name, last_name, birth_city, birth_country)
+    VALUES (new.player_id, new.full_name, new.first_name, new.last_name, new.birth_city, new.birth_country);
+END;
+"""
+
 # =============================================================================
 # Default Data
 # =============================================================================
@@ -698,6 +749,16 @@ def init_schema(db_path: str, fresh_start: bool = False) -> None:
         conn.executescript(INDEXES)
         conn.commit()
 
+        # Create the player search index; index existing players the first time
+        has_search = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'players_fts'"
+        ).fetchone()
+        conn.executescript(PLAYER_SEARCH)
+        if not has_search:
+            logger.info("Building player search index...")
+            conn.execute("INSERT INTO players_fts (players_fts) VALUES ('rebuild')")
+        conn.commit()
+
         # Seed default rule sets if empty
         count = conn.execute("SELECT COUNT(*) FROM rule_sets").fetchone()[0]
         if count == 0:
@@ -705,6 +766,9 @@ def init_schema(db_path: str, fresh_start: bool = False) -> None:
             _seed_rule_sets(conn)
             conn.commit()
 
+        # Refresh planner statistics so new indexes are picked up
+        conn.execute("PRAGMA optimize")
+
         logger.info(f"Schema initialized (version {SCHEMA_VERSION})")
 
     finally:
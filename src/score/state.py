@@ -4,10 +4,13 @@ Shared game state replay logic.
 This module provides functions to reconstruct game state by replaying events.
 Used by both score-app and score-cloud.
 """
-import json
 import logging
 import sqlite3
 import time
+from itertools import groupby
+from operator import itemgetter
+
+import orjson
 
 logger = logging.getLogger("score.state")
 
@@ -66,8 +69,8 @@ def replay_events(events, current_time=None):
         event_time = event.get("created_at") or event.get("received_at")
 
         payload_str = event.get("payload", "{}")
-        if isinstance(payload_str, str):
-            payload = json.loads(payload_str)
+        if isinstance(payload_str, (str, bytes)):
+            payload = orjson.loads(payload_str)
         else:
             payload = payload_str
 
@@ -339,13 +342,15 @@ def replay_events(events, current_time=None):
     }
 
 
-def load_game_state_from_db(db_path, game_id):
+def load_game_state_from_db(db_path, game_id, conn=None):
     """
     Load game state from database by replaying events.
 
     Args:
         db_path: Path to SQLite database
         game_id: Game ID to load state for
+        conn: Optional open connection (with sqlite3.Row factory) to use
+              instead of opening db_path; it is left open
 
     Returns:
         dict with:
@@ -354,8 +359,10 @@ def load_game_state_from_db(db_path, game_id):
             - last_update: Timestamp of last state change
             - num_events: Number of events replayed
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    owns_conn = conn is None
+    if owns_conn:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
 
     # Query events - handle both score-app schema (created_at) and cloud schema (received_at)
     # Try score-app schema first
@@ -373,7 +380,8 @@ def load_game_state_from_db(db_path, game_id):
         ).fetchall()
         logger.debug(f"Loaded {len(rows)} events from cloud schema")
 
-    conn.close()
+    if owns_conn:
+        conn.close()
 
     # Convert rows to dicts for replay
     events = [dict(row) for row in rows]
@@ -384,7 +392,56 @@ def load_game_state_from_db(db_path, game_id):
     return state
 
 
-def get_game_roster_at_time(db_path, game_id, target_time):
+def load_all_game_states_from_db(db_path, conn=None, game_ids=None):
+    """
+    Load state for every game with received events in a single scan.
+
+    Cloud schema only: replays received_events grouped by game, instead of
+    opening a connection and querying once per game.
+
+    Args:
+        db_path: Path to cloud SQLite database
+        conn: Optional open connection (with sqlite3.Row factory) to use
+              instead of opening db_path; it is left open
+        game_ids: Optional collection of game IDs to limit the scan to
+
+    Returns:
+        dict mapping game_id to the same state dict as load_game_state_from_db
+    """
+    owns_conn = conn is None
+    if owns_conn:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+
+    if game_ids is None:
+        rows = conn.execute(
+            "SELECT game_id, type, payload, received_at FROM received_events ORDER BY game_id, seq ASC"
+        ).fetchall()
+    else:
+        game_ids = list(game_ids)
+        placeholders = ", ".join("?" * len(game_ids))
+        rows = conn.execute(
+            f"SELECT game_id, type, payload, received_at FROM received_events "
+            f"WHERE game_id IN ({placeholders}) ORDER BY game_id, seq ASC",
+            game_ids
+        ).fetchall()
+
+    if owns_conn:
+        conn.close()
+
+    states = {}
+    for game_id, game_rows in groupby(rows, key=itemgetter("game_id")):
+        events = [dict(row) for row in game_rows]
+        state = replay_events(events)
+        state["num_events"] = len(events)
+        states[game_id] = state
+
+    logger.debug(f"Loaded {len(rows)} events for {len(states)} games from cloud schema")
+
+    return states
+
+
+def get_game_roster_at_time(db_path, game_id, target_time, conn=None):
     """
     Get roster state as of a specific timestamp using temporal queries.
 
@@ -392,6 +449,8 @@ def get_game_roster_at_time(db_path, game_id, target_time):
         db_path: Path to database
         game_id: Game identifier
         target_time: Unix timestamp (typically game start time)
+        conn: Optional open connection (with sqlite3.Row factory) to use
+              instead of opening db_path; it is left open
 
     Returns:
         dict: {
@@ -400,8 +459,10 @@ def get_game_roster_at_time(db_path, game_id, target_time):
             "roster_details": {player_id: player_info}
         }
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    owns_conn = conn is None
+    if owns_conn:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
 
     # Get game info including registration IDs
     game = conn.execute("""
@@ -411,7 +472,8 @@ def get_game_roster_at_time(db_path, game_id, target_time):
     """, (game_id,)).fetchone()
 
     if not game:
-        conn.close()
+        if owns_conn:
+            conn.close()
         return {
             "home_roster": [],
             "away_roster": [],
@@ -451,7 +513,8 @@ def get_game_roster_at_time(db_path, game_id, target_time):
               AND (re.removed_at IS NULL OR re.removed_at > ?)
         """, (away_reg_id, target_time, target_time)).fetchall()
 
-    conn.close()
+    if owns_conn:
+        conn.close()
 
     # Build roster data structures
     home_roster = []
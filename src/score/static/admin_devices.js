@@ -0,0 +1,133 @@
+// Devices admin page: filtering and per-row save/unassign/delete actions
+
+function filterDeviceTable() {
+    const filters = {
+        deviceId: document.getElementById('filterDeviceId').value.toLowerCase(),
+        rink: document.getElementById('filterRink').value.toLowerCase(),
+        sheet: document.getElementById('filterSheet').value.toLowerCase(),
+        deviceName: document.getElementById('filterDeviceName').value.toLowerCase(),
+        status: document.getElementById('filterStatus').value.toLowerCase(),
+        lastSeen: document.getElementById('filterLastSeen').value.toLowerCase()
+    };
+
+    const tbody = document.querySelector('table tbody');
+    const rows = tbody.getElementsByTagName('tr');
+
+    for (let i = 0; i < rows.length; i++) {
+        const cells = rows[i].getElementsByTagName('td');
+        if (cells.length < 7) continue;
+
+        const deviceId = cells[0].textContent.toLowerCase();
+        const rink = cells[1].querySelector('select')?.value.toLowerCase() || '';
+        const sheet = cells[2].querySelector('input')?.value.toLowerCase() || '';
+        const deviceName = cells[3].querySelector('input')?.value.toLowerCase() || '';
+        const status = cells[4].textContent.toLowerCase();
+        const lastSeen = cells[5].textContent.toLowerCase();
+
+        const match =
+            deviceId.includes(filters.deviceId) &&
+            rink.includes(filters.rink) &&
+            sheet.includes(filters.sheet) &&
+            deviceName.includes(filters.deviceName) &&
+            status.includes(filters.status) &&
+            lastSeen.includes(filters.lastSeen);
+
+        rows[i].style.display = match ? '' : 'none';
+    }
+}
+
+function showMessage(text, type) {
+    const msg = document.getElementById('message');
+    msg.textContent = text;
+    msg.className = `message ${type}`;
+    msg.style.display = 'block';
+    setTimeout(() => {
+        msg.style.display = 'none';
+    }, 5000);
+}
+
+async function saveDevice(deviceId) {
+    const row = document.querySelector(`tr[data-device-id="${CSS.escape(deviceId)}"]`);
+    const rinkId = row.querySelector('.rink-select').value;
+    const sheetName = row.querySelector('.sheet-input').value;
+    const deviceName = row.querySelector('.name-input').value;
+
+    if (!rinkId || !sheetName) {
+        showMessage('Please select a rink and enter a sheet name', 'error');
+        return;
+    }
+
+    try {
+        const response = await fetch(`/admin/devices/${deviceId}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                rink_id: rinkId,
+                sheet_name: sheetName,
+                device_name: deviceName || null
+            })
+        });
+
+        const result = await response.json();
+
+        if (response.ok) {
+            showMessage(`Device ${deviceId} saved successfully`, 'success');
+            setTimeout(() => location.reload(), 1500);
+        } else {
+            showMessage(`Error: ${result.detail || 'Failed to save'}`, 'error');
+        }
+    } catch (error) {
+        showMessage(`Error: ${error.message}`, 'error');
+    }
+}
+
+async function unassignDevice(deviceId) {
+    if (!confirm(`Unassign device ${deviceId}?`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/admin/devices/${deviceId}/assignment`, {
+            method: 'DELETE'
+        });
+
+        const result = await response.json();
+
+        if (response.ok) {
+            showMessage(`Device ${deviceId} unassigned`, 'success');
+            setTimeout(() => location.reload(), 1500);
+        } else {
+            showMessage(`Error: ${result.detail || 'Failed to unassign'}`, 'error');
+        }
+    } catch (error) {
+        showMessage(`Error: ${error.message}`, 'error');
+    }
+}
+
+async function deleteDevice(deviceId) {
+    if (!confirm(`Delete device ${deviceId}? This will permanently remove it from the database.`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/admin/devices/${deviceId}`, {
+            method: 'DELETE'
+        });
+
+        const result = await response.json();
+
+        if (response.ok) {
+            showMessage(`Device ${deviceId} deleted`, 'success');
+            setTimeout(() => location.reload(), 1500);
+        } else {
+            showMessage(`Error: ${result.detail || 'Failed to delete'}`, 'error');
+        }
+    } catch (error) {
+        showMessage(`Error: ${error.message}`, 'error');
+    }
+}
+
+// Rows carry their assigned rink in data-rink-id; select it once loaded
+document.querySelectorAll('select.rink-select').forEach(select => {
+    select.value = select.dataset.rinkId;
+});
@@ -0,0 +1,63 @@
+// Events admin page: fetch one page of events as JSON and render it
+
+// Rows carry a payload preview; the full payload is fetched on first hover
+function renderPayloadCell(row, e) {
+    const truncated = e.payload_length > e.payload_preview.length;
+    const cell = addCell(row, truncated ? e.payload_preview + '...' : e.payload_preview || '-', 'payload');
+    cell.title = e.payload_preview;
+    if (truncated) {
+        cell.addEventListener('mouseenter', async () => {
+            try {
+                const response = await fetch(`/admin/events/${e.id}/payload`);
+                if (response.ok) {
+                    cell.title = await response.text();
+                }
+            } catch (error) {
+                // Keep the preview as the tooltip
+            }
+        }, { once: true });
+    }
+}
+
+function renderEventRow(row, e) {
+    addCell(row, e.id, 'event-id');
+    addCell(row, e.game_id, 'game-id');
+    addCell(row, e.device_id, 'device-id');
+    addCell(row, e.session_id ? e.session_id.slice(0, 8) + '...' : '-', 'session-id');
+    addCell(row, e.seq);
+    const type = document.createElement('span');
+    type.className = 'event-type';
+    type.textContent = e.type;
+    row.insertCell().appendChild(type);
+    addCell(row, e.ts_local, 'timestamp');
+    renderPayloadCell(row, e);
+    addCell(row, e.received_at ? formatTimestamp(e.received_at, true) : '-', 'timestamp');
+}
+
+async function loadEvents() {
+    const tbody = document.querySelector('#eventsTable tbody');
+    // Server-side filters and paging come from the page URL
+    const params = new URLSearchParams(location.search);
+    params.set('format', 'json');
+
+    let data;
+    try {
+        data = await fetchJson(`/admin/events?${params}`);
+    } catch (error) {
+        showTableMessage(tbody, `Failed to load events: ${error.message}`);
+        return;
+    }
+
+    document.getElementById('eventCount').textContent = data.event_count;
+    renderTable(tbody, data.events, 'No events found.', renderEventRow);
+
+    if (data.next_before_id !== null) {
+        params.delete('format');
+        params.set('before_id', data.next_before_id);
+        const older = document.getElementById('olderLink');
+        older.href = `/admin/events?${params}`;
+        older.hidden = false;
+    }
+}
+
+loadEvents();
@@ -0,0 +1,37 @@
+// Games admin page: fetch reconstructed game states as JSON and render them
+
+function formatClock(seconds) {
+    const mins = Math.floor(seconds / 60);
+    const secs = seconds % 60;
+    return `${mins}:${secs.toString().padStart(2, '0')}`;
+}
+
+function renderGameRow(row, game) {
+    // Convert UTC timestamp to local date (handles timezone offset)
+    const gameDate = new Date(game.start_time).toLocaleDateString('en-CA'); // YYYY-MM-DD format
+
+    addCell(row, game.game_id, 'game-id');
+    addCell(row, gameDate);
+    addCell(row, `${game.home_team} vs ${game.away_team}`);
+    const score = document.createElement('strong');
+    score.textContent = `${game.home_score} - ${game.away_score}`;
+    row.insertCell().appendChild(score);
+    addCell(row, formatClock(game.clock_seconds), 'clock');
+    const status = document.createElement('span');
+    status.className = `status ${game.clock_running ? 'running' : 'paused'}`;
+    status.textContent = game.clock_running ? 'Running' : 'Paused';
+    row.insertCell().appendChild(status);
+    addCell(row, `${game.period_length_min} min`);
+}
+
+async function loadGames() {
+    const tbody = document.querySelector('#gamesTable tbody');
+    try {
+        const data = await fetchJson('/admin/games/state?format=json');
+        renderTable(tbody, data.games, 'No games found', renderGameRow);
+    } catch (error) {
+        console.error('Error fetching game states:', error);
+    }
+}
+
+loadGames();
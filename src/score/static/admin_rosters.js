@@ -0,0 +1,25 @@
+// Rosters admin page: fetch roster entries as JSON and render them
+
+function renderRosterRow(row, r) {
+    addCell(row, r.team_abbrev || '', 'team-abbrev');
+    addCell(row, r.full_name);
+    addCell(row, r.jersey_number || '-');
+    const status = document.createElement('span');
+    status.className = `status-badge ${r.roster_status === 'active' ? 'active' : 'inactive'}`;
+    status.textContent = r.roster_status;
+    row.insertCell().appendChild(status);
+    addCell(row, r.added_at ? formatTimestamp(r.added_at) : '-', 'timestamp');
+    addCell(row, r.removed_at === null ? 'Active' : formatTimestamp(r.removed_at), 'timestamp');
+}
+
+async function loadRosters() {
+    const tbody = document.querySelector('#rostersTable tbody');
+    try {
+        const data = await fetchJson('/admin/rosters?format=json');
+        renderTable(tbody, data.rosters, 'No rosters found.', renderRosterRow);
+    } catch (error) {
+        showTableMessage(tbody, `Failed to load rosters: ${error.message}`);
+    }
+}
+
+loadRosters();
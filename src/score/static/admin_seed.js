@@ -0,0 +1,119 @@
+// Seed admin page: seed or clear sample data and report the result
+
+function showStatus(message, type) {
+    const status = document.getElementById('status');
+    status.textContent = message;
+    status.className = type;
+    status.style.display = 'block';
+}
+
+function getSelectedCategories() {
+    const categories = [];
+    if (document.getElementById('seed-leagues').checked) categories.push('leagues');
+    if (document.getElementById('seed-seasons').checked) categories.push('seasons');
+    if (document.getElementById('seed-divisions').checked) categories.push('divisions');
+    if (document.getElementById('seed-rinks').checked) categories.push('rinks');
+    if (document.getElementById('seed-teams').checked) categories.push('teams');
+    if (document.getElementById('seed-players').checked) categories.push('players');
+    if (document.getElementById('seed-registrations').checked) categories.push('registrations');
+    if (document.getElementById('seed-rosters').checked) categories.push('rosters');
+    if (document.getElementById('seed-games').checked) categories.push('games');
+    return categories;
+}
+
+async function seedAll() {
+    showStatus('Seeding all data...', 'success');
+
+    try {
+        const response = await fetch('/admin/seed', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                seed_all: true,
+                player_count: parseInt(document.getElementById('player-count').value),
+                game_count: parseInt(document.getElementById('game-count').value)
+            })
+        });
+
+        const result = await response.json();
+
+        if (response.ok) {
+            const seeded = result.seeded;
+            const summary = Object.entries(seeded)
+                .filter(([k, v]) => v > 0)
+                .map(([k, v]) => `${k}: ${v}`)
+                .join(', ');
+            showStatus(`Seeded: ${summary}`, 'success');
+            setTimeout(() => location.reload(), 2000);
+        } else {
+            showStatus(`Error: ${result.detail || 'Failed to seed'}`, 'error');
+        }
+    } catch (error) {
+        showStatus(`Error: ${error.message}`, 'error');
+    }
+}
+
+async function seedSelected() {
+    const categories = getSelectedCategories();
+    if (categories.length === 0) {
+        showStatus('Please select at least one category', 'error');
+        return;
+    }
+
+    showStatus('Seeding selected categories...', 'success');
+
+    try {
+        const response = await fetch('/admin/seed', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                categories: categories,
+                player_count: parseInt(document.getElementById('player-count').value),
+                game_count: parseInt(document.getElementById('game-count').value)
+            })
+        });
+
+        const result = await response.json();
+
+        if (response.ok) {
+            const seeded = result.seeded;
+            const summary = Object.entries(seeded)
+                .filter(([k, v]) => v > 0)
+                .map(([k, v]) => `${k}: ${v}`)
+                .join(', ');
+            showStatus(`Seeded: ${summary || 'nothing new'}`, 'success');
+            setTimeout(() => location.reload(), 2000);
+        } else {
+            showStatus(`Error: ${result.detail || 'Failed to seed'}`, 'error');
+        }
+    } catch (error) {
+        showStatus(`Error: ${error.message}`, 'error');
+    }
+}
+
+async function clearAll() {
+    if (!confirm('Are you sure you want to clear ALL data? This cannot be undone.')) {
+        return;
+    }
+
+    showStatus('Clearing all data...', 'success');
+
+    try {
+        const response = await fetch('/admin/seed/clear', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ confirm: true })
+        });
+
+        const result = await response.json();
+
+        if (response.ok) {
+            showStatus('All data cleared', 'success');
+            setTimeout(() => location.reload(), 1500);
+        } else {
+            showStatus(`Error: ${result.detail || 'Failed to clear'}`, 'error');
+        }
+    } catch (error) {
+        showStatus(`Error: ${error.message}`, 'error');
+    }
+}
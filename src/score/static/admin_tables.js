@@ -0,0 +1,75 @@
+// Shared helpers for admin pages that render their tables from ?format=json
+
+function formatTimestamp(ts, withSeconds = false) {
+    const date = new Date(ts * 1000);
+    const pad = n => String(n).padStart(2, '0');
+    let text = `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())} ` +
+        `${pad(date.getHours())}:${pad(date.getMinutes())}`;
+    if (withSeconds) {
+        text += `:${pad(date.getSeconds())}`;
+    }
+    return text;
+}
+
+function addCell(row, text, className) {
+    const cell = row.insertCell();
+    cell.textContent = text;
+    if (className) {
+        cell.className = className;
+    }
+    return cell;
+}
+
+function showTableMessage(tbody, text) {
+    tbody.replaceChildren();
+    const cell = tbody.insertRow().insertCell();
+    cell.colSpan = tbody.closest('table').querySelector('thead tr').cells.length;
+    cell.className = 'empty';
+    cell.textContent = text;
+}
+
+// Fill tbody with one row per item, or a message row when there are none
+function renderTable(tbody, items, emptyText, renderRow) {
+    if (!items.length) {
+        showTableMessage(tbody, emptyText);
+        return;
+    }
+    const rows = document.createDocumentFragment();
+    for (const item of items) {
+        const row = document.createElement('tr');
+        renderRow(row, item);
+        rows.appendChild(row);
+    }
+    tbody.replaceChildren(rows);
+}
+
+async function fetchJson(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`${response.status} ${response.statusText}`);
+    }
+    return response.json();
+}
+
+// Hide rows that don't match every filter input; inputs sit above their column
+function filterTable(tableId) {
+    const table = document.getElementById(tableId);
+    const filterCells = table.querySelectorAll('.filter-row td');
+    const filters = [];
+    filterCells.forEach((cell, index) => {
+        const input = cell.querySelector('input');
+        if (input && input.value) {
+            filters.push([index, input.value.toLowerCase()]);
+        }
+    });
+
+    table.querySelectorAll('tbody tr').forEach(row => {
+        if (row.cells.length < filterCells.length) return; // Skip message row
+
+        const match = filters.every(([index, value]) => {
+            const cell = row.cells[index];
+            return (cell.title || cell.textContent).toLowerCase().includes(value);
+        });
+        row.style.display = match ? '' : 'none';
+    });
+}
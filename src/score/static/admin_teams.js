@@ -0,0 +1,20 @@
+// Teams admin page: fetch teams as JSON and render them
+
+function renderTeamRow(row, t) {
+    addCell(row, t.team_id, 'team-abbrev');
+    addCell(row, t.name || '-');
+    addCell(row, t.abbreviation || '-');
+    addCell(row, t.created_at ? formatTimestamp(t.created_at) : 'Never', 'timestamp');
+}
+
+async function loadTeams() {
+    const tbody = document.querySelector('#teamsTable tbody');
+    try {
+        const data = await fetchJson('/admin/teams?format=json');
+        renderTable(tbody, data.teams, 'No teams found.', renderTeamRow);
+    } catch (error) {
+        showTableMessage(tbody, `Failed to load teams: ${error.message}`);
+    }
+}
+
+loadTeams();
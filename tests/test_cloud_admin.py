@@ -1,11 +1,13 @@
 """Tests for cloud admin endpoints (device management, rinks, etc)."""
 import json
+import re
 import sqlite3
 import tempfile
 import time
 
 import pytest
 from fastapi.testclient import TestClient
+from markupsafe import Markup
 
 
 @pytest.fixture
@@ -204,12 +206,35 @@ def client(temp_db, monkeypatch):
     # Patch the database path
     from score import cloud
     monkeypatch.setattr(cloud, "CLOUD_DB_PATH", temp_db)
+    # Start each test with empty in-process caches
+    monkeypatch.setattr(cloud, "SCHEDULE_CACHE", {})
+    monkeypatch.setattr(cloud, "GAME_STATE_CACHE", {})
 
     # Reinitialize the app with the new database path
     from score.cloud import app
     return TestClient(app)
 
 
+@pytest.fixture
+def schema_db(tmp_path):
+    """Temporary database with the full cloud schema, for tests beyond temp_db's tables."""
+    from score.schema import init_schema
+
+    db_path = str(tmp_path / "cloud.db")
+    init_schema(db_path)
+    return db_path
+
+
+@pytest.fixture
+def schema_client(schema_db, monkeypatch):
+    """Test client on the full-schema database, with empty in-process caches."""
+    from score import cloud
+    monkeypatch.setattr(cloud, "CLOUD_DB_PATH", schema_db)
+    monkeypatch.setattr(cloud, "SCHEDULE_CACHE", {})
+    monkeypatch.setattr(cloud, "GAME_STATE_CACHE", {})
+    return TestClient(cloud.app)
+
+
 def test_create_rink(client):
     """Test creating a new rink."""
     response = client.post("/admin/rinks", json={
@@ -242,6 +267,59 @@ def test_create_duplicate_rink(client):
     assert "already exists" in response.json()["detail"]
 
 
+def test_create_rink_rejects_ids_the_rink_paths_would_refuse(client, temp_db):
+    """Test that rink IDs must match the pattern the /rinks/{rink_id} endpoints accept."""
+    response = client.post("/admin/rinks", json={"rink_id": "rink one/two", "name": "Bad Arena"})
+
+    assert response.status_code == 422
+    conn = sqlite3.connect(temp_db)
+    assert conn.execute("SELECT COUNT(*) FROM rinks").fetchone()[0] == 0
+    conn.close()
+
+
+def test_update_and_delete_rink(client):
+    """Rinks can be renamed and deleted; unknown rinks return 404."""
+    client.post("/admin/rinks", json={"rink_id": "rink-test", "name": "Test Arena"})
+
+    response = client.put("/admin/rinks/rink-test", json={"name": "Renamed Arena"})
+    assert response.status_code == 200
+    assert response.json()["rink"]["name"] == "Renamed Arena"
+    assert client.put("/admin/rinks/rink-test", json={}).status_code == 400
+    assert client.put("/admin/rinks/rink-missing", json={"name": "X"}).status_code == 404
+
+    client.get("/v1/devices/dev-1/config")
+    client.put("/admin/devices/dev-1", json={"rink_id": "rink-test", "sheet_name": "A"})
+    response = client.delete("/admin/rinks/rink-test")
+    assert response.status_code == 409
+    assert "Unassign devices first" in response.json()["detail"]
+
+    client.delete("/admin/devices/dev-1/assignment")
+    assert client.delete("/admin/rinks/rink-test").status_code == 200
+    assert client.delete("/admin/rinks/rink-test").status_code == 404
+
+
+def test_delete_rink_after_seed(schema_client, schema_db):
+    """A seed bumps schedule versions; deleting a rink still succeeds and drops its cached schedule."""
+    from score import cloud
+
+    schema_client.post("/admin/rinks", json={"rink_id": "rink-x", "name": "Extra Arena"})
+    conn = sqlite3.connect(schema_db)
+    conn.execute("INSERT INTO schedule_versions (rink_id, version, updated_at) VALUES ('rink-x', 'v1', 0)")
+    conn.commit()
+    conn.close()
+    assert schema_client.post("/admin/seed", json={"categories": ["leagues"]}).status_code == 200
+    assert schema_client.get("/v1/rinks/rink-x/schedule?date=2025-01-15").status_code == 200
+    assert any(key[0] == "rink-x" for key in cloud.SCHEDULE_CACHE)
+
+    assert schema_client.delete("/admin/rinks/rink-x").status_code == 200
+    assert not any(key[0] == "rink-x" for key in cloud.SCHEDULE_CACHE)
+    conn = sqlite3.connect(schema_db)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM schedule_versions WHERE rink_id = 'rink-x'").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
 def test_device_auto_registration(client):
     """Test that devices auto-register on first config request."""
     response = client.get("/v1/devices/dev-abc123/config")
@@ -253,6 +331,19 @@ def test_device_auto_registration(client):
     assert "device registered" in data["message"].lower()
 
 
+def test_device_repeat_poll_in_same_second(client, monkeypatch):
+    """A second config poll within the same second is reported as existing, not newly registered."""
+    from score import cloud
+
+    monkeypatch.setattr(cloud.time, "time", lambda: 1_700_000_000.5)
+
+    first = client.get("/v1/devices/dev-abc123/config").json()
+    second = client.get("/v1/devices/dev-abc123/config").json()
+
+    assert first["message"].startswith("Device registered. Please contact admin")
+    assert second["message"].startswith("Device registered but not assigned")
+
+
 def test_assign_device(client):
     """Test assigning a device to a rink and sheet."""
     # Create a rink first
@@ -351,6 +442,84 @@ def test_list_devices(client):
     assert any(d["device_id"] == "dev-def456" for d in data["devices"])
 
 
+def test_list_devices_html(client):
+    """Test that the devices page renders a row per device inside the table."""
+    client.get("/v1/devices/dev-abc123/config")
+    client.get("/v1/devices/dev-def456/config")
+
+    response = client.get("/admin/devices")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    tbody = response.text.split("<tbody>")[1].split("</tbody>")[0]
+    assert 'data-device-id="dev-abc123"' in tbody
+    assert 'data-device-id="dev-def456"' in tbody
+    assert response.text.rstrip().endswith("</html>")
+
+
+def test_admin_html_is_gzipped(client):
+    """Test that large admin pages are compressed and small API acks are not."""
+    for i in range(20):
+        client.get(f"/v1/devices/dev-{i:03d}/config")
+
+    response = client.get("/admin/devices", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert 'data-device-id="dev-019"' in response.text
+
+    response = client.get("/v1/devices/dev-000/config", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+def test_devices_page_script_served_statically(client):
+    """Test that the devices page references its script instead of inlining it."""
+    response = client.get("/admin/devices")
+    assert '<script src="/static/admin_devices.js" defer></script>' in response.text
+    assert "function saveDevice" not in response.text
+
+    script = client.get("/static/admin_devices.js")
+    assert script.status_code == 200
+    assert "function saveDevice" in script.text
+
+
+def test_static_assets_are_cacheable(client):
+    """Shared admin scripts and styles can be reused from the browser cache."""
+    for asset in ("admin_tables.js", "admin.css"):
+        response = client.get(f"/static/{asset}")
+        assert response.headers["cache-control"] == "public, max-age=86400"
+        assert "etag" in response.headers
+
+    games = client.get("/admin/games/state")
+    assert "function filterTable" not in games.text
+    assert "filterTable('gamesTable')" in games.text
+
+    seed = client.get("/admin/seed").text
+    assert '<script src="/static/admin_seed.js" defer></script>' in seed
+    assert "<style>" not in seed and "function seedAll" not in seed
+    assert '<link rel="stylesheet" href="/static/admin_seed.css">' in seed
+    assert client.get("/static/admin_seed.js").headers["cache-control"] == "public, max-age=86400"
+    assert ".seed-container" in client.get("/static/admin_seed.css").text
+    assert ".seed-container" not in client.get("/static/admin.css").text
+
+
+def test_list_devices_html_escapes_device_fields(client):
+    """Test that device-supplied text is HTML-escaped on the devices page."""
+    client.post("/admin/rinks", json={"rink_id": "rink-alpha", "name": "Alpha <Arena>"})
+    client.get("/v1/devices/dev-abc123/config")
+    client.put("/admin/devices/dev-abc123", json={
+        "rink_id": "rink-alpha",
+        "sheet_name": "Sheet 1",
+        "device_name": '<script>alert("x")</script>'
+    })
+
+    response = client.get("/admin/devices")
+
+    assert response.status_code == 200
+    assert '<script>alert("x")</script>' not in response.text
+    assert "&lt;script&gt;alert(&#34;x&#34;)&lt;/script&gt;" in response.text
+    assert "Alpha &lt;Arena&gt; (rink-alpha)" in response.text
+    assert 'data-rink-id="rink-alpha"' in response.text
+
+
 def test_get_device_config_after_assignment(client):
     """Test that device config returns assignment after assignment."""
     # Create rink and assign device
@@ -399,6 +568,23 @@ def test_partial_device_update(client):
     assert data["device"]["sheet_name"] == "Sheet 1"  # Unchanged
 
 
+def test_device_update_assigns_only_with_rink_and_sheet(client):
+    """Test that is_assigned is set only when rink_id and sheet_name are both given."""
+    client.post("/admin/rinks", json={"rink_id": "rink-alpha", "name": "Alpha Arena"})
+    client.get("/v1/devices/dev-abc123/config")
+
+    response = client.put("/admin/devices/dev-abc123", json={"sheet_name": "Sheet 1"})
+    assert response.json()["device"]["is_assigned"] is False
+
+    response = client.put("/admin/devices/dev-abc123", json={"rink_id": "rink-alpha", "sheet_name": "Sheet 2"})
+    device = response.json()["device"]
+    assert device["is_assigned"] is True
+    assert device["sheet_name"] == "Sheet 2"
+
+    response = client.put("/admin/devices/dev-abc123", json={})
+    assert response.json()["message"] == "No changes requested"
+
+
 def test_device_last_seen_updates(client):
     """Test that last_seen_at updates on config requests."""
     # First request
@@ -447,6 +633,12 @@ def test_get_schedule_for_nonexistent_rink(client):
     assert "not found" in response.json()["detail"]
 
 
+def test_unassign_and_delete_unknown_device_fail(client):
+    """Test that unassigning or deleting a non-existent device returns 404."""
+    assert client.delete("/admin/devices/dev-nonexistent/assignment").status_code == 404
+    assert client.delete("/admin/devices/dev-nonexistent").status_code == 404
+
+
 def test_update_device_without_registering_fails(client):
     """Test that updating non-existent device fails."""
     response = client.put("/admin/devices/dev-nonexistent", json={
@@ -901,5 +1093,1248 @@ def test_points_leaderboard(client, temp_db):
     assert points[0]["player_id"] == "8471214"  # Marchand first (3pts, 2G)
     assert points[1]["player_id"] == "8474564"  # Pastrnak second (3pts, 1G)
 
+    # Filters are bound parameters: a matching context keeps the leaders,
+    # anything else (quote characters included) simply matches nothing
+    filtered = client.get("/admin/stats?format=json&league_id=league-1&division_id=div-1").json()
+    assert filtered["points"] == points
+    other = client.get("/admin/stats", params={"format": "json", "league_id": "x' OR '1'='1"})
+    assert other.status_code == 200
+    assert other.json()["points"] == []
+
+
+def test_stats_sql_is_the_same_for_every_filter_combination(temp_db):
+    """Stats queries bind their filters, so each runs one cached statement."""
+    from score.cloud import get_final_games, query_top_assists, query_top_points, query_top_scorers
+
+    class RecordingConnection:
+        def __init__(self, conn):
+            self.conn = conn
+            self.statements = []
+
+        def execute(self, sql, params=()):
+            self.statements.append(sql)
+            return self.conn.execute(sql, params)
+
+    conn = sqlite3.connect(temp_db)
+    for query in (query_top_scorers, query_top_assists, query_top_points):
+        db = RecordingConnection(conn)
+        query(db)
+        query(db, league_id="league-1", season_id="season-1", limit=5)
+        query(db, division_id="div-1")
+        assert len(set(db.statements)) == 1
+
+    db = RecordingConnection(conn)
+    get_final_games(db, league_id="league-1")
+    get_final_games(db, season_id="season-1", division_id="div-1")
+    assert len(set(db.statements)) == 1
+    conn.close()
+
+
+def _insert_game(temp_db, game_id="game-1"):
+    """Insert a minimal rink + game so events can be posted against it."""
+    conn = sqlite3.connect(temp_db)
+    current_time = int(time.time())
+    conn.execute(
+        "INSERT INTO rinks (rink_id, name, created_at) VALUES ('rink-1', 'Test Arena', ?)",
+        (current_time,)
+    )
+    conn.execute("""
+        INSERT INTO games (game_id, rink_id, home_team, away_team, start_time, period_length_min, created_at)
+        VALUES (?, 'rink-1', 'Home', 'Away', '2025-09-15T19:00:00Z', 20, ?)
+    """, (game_id, current_time))
+    conn.commit()
+    conn.close()
+
+
+def _event(seq):
+    return {
+        "event_id": f"evt-{seq}",
+        "seq": seq,
+        "type": "CLOCK_SET",
+        "ts_local": "2025-09-15T19:00:00Z",
+        "payload": {"seconds": 1200},
+    }
+
+
+def test_post_events_is_idempotent(client, temp_db):
+    """Re-posting a batch stores each event once and still acks the highest seq."""
+    _insert_game(temp_db)
+    body = {
+        "device_id": "dev-1",
+        "session_id": "session-1",
+        "events": [_event(2), _event(1), _event(3)],
+    }
+
+    response = client.post("/v1/games/game-1/events", json=body)
+    assert response.status_code == 200
+    assert response.json()["acked_through"] == 3
+
+    # Same batch plus one new event
+    body["events"].append(_event(4))
+    response = client.post("/v1/games/game-1/events", json=body)
+    assert response.status_code == 200
+    assert response.json()["acked_through"] == 4
+
+    conn = sqlite3.connect(temp_db)
+    seqs = [r[0] for r in conn.execute("SELECT seq FROM received_events ORDER BY seq")]
+    conn.close()
+    assert seqs == [1, 2, 3, 4]
+
+
+def test_latest_heartbeats_one_row_per_device(client, temp_db):
+    """Latest heartbeats returns exactly one (the newest) row per device."""
+    conn = sqlite3.connect(temp_db)
+    conn.execute("""
+        CREATE TABLE heartbeats (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            device_id TEXT NOT NULL,
+            current_game_id TEXT,
+            game_state TEXT,
+            clock_running INTEGER,
+            clock_value_ms INTEGER,
+            last_event_seq INTEGER,
+            app_version TEXT,
+            ts_local TEXT NOT NULL,
+            received_at INTEGER NOT NULL
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+    # Two heartbeats from the same device within the same second
+    for seq in (1, 2):
+        response = client.post("/v1/heartbeat", json={
+            "device_id": "dev-1",
+            "last_event_seq": seq,
+            "ts_local": "2025-09-15T19:00:00Z",
+        })
+        assert response.status_code == 200
+    client.post("/v1/heartbeat", json={"device_id": "dev-2", "ts_local": "2025-09-15T19:00:00Z"})
+
+    response = client.get("/admin/heartbeats/latest")
+    assert response.status_code == 200
+    heartbeats = {h["device_id"]: h for h in response.json()["heartbeats"]}
+    assert len(response.json()["heartbeats"]) == 2
+    assert heartbeats["dev-1"]["last_event_seq"] == 2
+
+
+def test_failed_heartbeat_flush_keeps_buffer(client, temp_db):
+    """A heartbeat flush that fails leaves the batch buffered for the next flush."""
+    from score import cloud
+
+    cloud.pending_heartbeats.clear()
+    try:
+        # No heartbeats table yet, so the flush fails
+        response = client.post("/v1/heartbeat", json={"device_id": "dev-1", "ts_local": "2025-09-15T19:00:00Z"})
+        assert response.status_code == 200
+        with pytest.raises(sqlite3.OperationalError):
+            cloud.flush_heartbeats()
+        assert len(cloud.pending_heartbeats) == 1
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute("""
+            CREATE TABLE heartbeats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                device_id TEXT NOT NULL,
+                current_game_id TEXT,
+                game_state TEXT,
+                clock_running INTEGER,
+                clock_value_ms INTEGER,
+                last_event_seq INTEGER,
+                app_version TEXT,
+                ts_local TEXT NOT NULL,
+                received_at INTEGER NOT NULL
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+        assert cloud.flush_heartbeats() == 1
+        assert not cloud.pending_heartbeats
+    finally:
+        cloud.pending_heartbeats.clear()
+
+
+def test_latest_heartbeats_served_when_flush_fails(schema_client, monkeypatch):
+    """The monitoring endpoint logs a failed flush and serves the committed heartbeats."""
+    from score import cloud
+
+    def locked_flush():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cloud, "flush_heartbeats", locked_flush)
+
+    response = schema_client.get("/admin/heartbeats/latest")
+    assert response.status_code == 200
+    assert response.json()["heartbeats"] == []
+
+
+def test_all_game_states_matches_per_game_replay(client, temp_db):
+    """Bulk game state reconstruction matches replaying each game individually."""
+    from score.cloud import reconstruct_game_state
+
+    _insert_game(temp_db, "game-1")
+    conn = sqlite3.connect(temp_db)
+    conn.execute("""
+        INSERT INTO games (game_id, rink_id, home_team, away_team, start_time, period_length_min, created_at)
+        VALUES ('game-2', 'rink-1', 'Home', 'Away', '2025-09-16T19:00:00Z', 15, ?)
+    """, (int(time.time()),))
+    conn.commit()
+    conn.close()
+
+    client.post("/v1/games/game-1/events", json={
+        "device_id": "dev-1",
+        "session_id": "session-1",
+        "events": [
+            _event(1),
+            {**_event(2), "type": "GOAL_HOME", "payload": {"goal_id": "goal-1", "value": 1}},
+        ],
+    })
+
+    response = client.get("/admin/games/state?format=json")
+    assert response.status_code == 200
+    games = {g["game_id"]: g for g in response.json()["games"]}
+
+    assert response.json()["game_count"] == 2
+    assert games["game-1"]["home_score"] == 1
+    assert games["game-1"]["event_count"] == 2
+    assert games["game-2"]["event_count"] == 0
+    for game_id, state in games.items():
+        assert state == reconstruct_game_state(game_id)
+
+
+class FakeWebSocket:
+    """Stand-in WebSocket that records sent messages or fails on send."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(text)
+
+
+def test_notify_queues_update_per_client(client):
+    """Notifying enqueues without blocking, and a full outbox is skipped."""
+    import asyncio
+    from score import cloud
+
+    async def scenario():
+        idle, backed_up = asyncio.Queue(maxsize=2), asyncio.Queue(maxsize=2)
+        backed_up.put_nowait("update")
+        backed_up.put_nowait("update")
+        cloud.websocket_clients.update({FakeWebSocket(): idle, FakeWebSocket(): backed_up})
+
+        cloud.notify_game_state_change()
+
+        assert idle.qsize() == 1
+        assert backed_up.qsize() == 2
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        cloud.websocket_clients.clear()
+
+
+def test_schedule_notify_coalesces_bursts(client):
+    """Several notifications within the debounce window produce one update."""
+    import asyncio
+    from score import cloud
+
+    async def scenario():
+        outbox = asyncio.Queue()
+        cloud.websocket_clients[FakeWebSocket()] = outbox
+
+        for _ in range(5):
+            cloud.schedule_notify()
+        assert outbox.empty()
+
+        await asyncio.sleep(cloud.WS_NOTIFY_DEBOUNCE * 2)
+        assert outbox.qsize() == 1
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        cloud.websocket_clients.clear()
+
+
+def test_schedule_notify_recovers_after_failed_flush(client, monkeypatch):
+    """A notify that raises doesn't leave later notifications permanently suppressed."""
+    import asyncio
+    from score import cloud
+
+    def failing_notify():
+        raise RuntimeError("boom")
+
+    async def scenario():
+        # The loop logs the exception raised by the scheduled flush
+        with monkeypatch.context() as patch:
+            patch.setattr(cloud, "notify_game_state_change", failing_notify)
+            cloud.schedule_notify()
+            await asyncio.sleep(cloud.WS_NOTIFY_DEBOUNCE * 2)
+        assert not cloud._notify_pending
+
+        outbox = asyncio.Queue()
+        cloud.websocket_clients[FakeWebSocket()] = outbox
+        cloud.schedule_notify()
+        await asyncio.sleep(cloud.WS_NOTIFY_DEBOUNCE * 2)
+        assert outbox.qsize() == 1
+
+    # Scheduling without a running loop fails before anything is pending
+    with pytest.raises(RuntimeError):
+        cloud.schedule_notify()
+    assert not cloud._notify_pending
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        cloud.websocket_clients.clear()
+
+
+def test_websocket_sender_drops_failed_client(client):
+    """A client whose send fails is unregistered while others keep receiving."""
+    import asyncio
+    from score import cloud
+
+    alive, dead = FakeWebSocket(), FakeWebSocket(fail=True)
+
+    async def scenario():
+        outboxes = {alive: asyncio.Queue(), dead: asyncio.Queue()}
+        cloud.websocket_clients.update(outboxes)
+        senders = [asyncio.create_task(cloud.websocket_sender(ws, q)) for ws, q in outboxes.items()]
+
+        cloud.notify_game_state_change()
+        await asyncio.sleep(0.01)
+
+        assert alive.sent == ["update"]
+        assert senders[1].done()
+        senders[0].cancel()
+
+    try:
+        asyncio.run(scenario())
+        assert alive in cloud.websocket_clients
+        assert dead not in cloud.websocket_clients
+    finally:
+        cloud.websocket_clients.clear()
+
+
+def test_game_state_cache_replays_only_changed_games(client, temp_db, monkeypatch):
+    """Cached game states are reused until that game's event log changes."""
+    from score import cloud, state
+
+    _insert_game(temp_db, "game-1")
+    conn = sqlite3.connect(temp_db)
+    conn.execute("""
+        INSERT INTO games (game_id, rink_id, home_team, away_team, start_time, period_length_min, created_at)
+        VALUES ('game-2', 'rink-1', 'Home', 'Away', '2025-09-15T21:00:00Z', 20, 0)
+    """)
+    conn.commit()
+    conn.close()
+
+    def post(game_id, seq):
+        event = dict(_event(seq), event_id=f"{game_id}-evt-{seq}")
+        client.post(f"/v1/games/{game_id}/events", json={
+            "device_id": "dev-1", "session_id": "s1", "events": [event]
+        })
+
+    post("game-1", 1)
+    post("game-2", 1)
+
+    replayed = []
+    load_all = state.load_all_game_states_from_db
+
+    def tracking_load_all(db_path, conn=None, game_ids=None):
+        replayed.append(sorted(game_ids))
+        return load_all(db_path, conn=conn, game_ids=game_ids)
+
+    monkeypatch.setattr(state, "load_all_game_states_from_db", tracking_load_all)
+
+    first = client.get("/admin/games/state?format=json").json()
+    assert replayed == [["game-1", "game-2"]]
+
+    client.get("/admin/games/state?format=json")
+    assert replayed == [["game-1", "game-2"]]
+
+    post("game-2", 2)
+    second = client.get("/admin/games/state?format=json").json()
+    assert replayed == [["game-1", "game-2"], ["game-2"]]
+
+    counts = {g["game_id"]: g["event_count"] for g in second["games"]}
+    assert counts == {"game-1": 1, "game-2": 2}
+    assert first["game_count"] == second["game_count"] == 2
+
+
+def test_post_events_rejects_duplicate_ids_in_batch(client, temp_db):
+    """A batch that repeats an event_id is rejected and nothing is stored."""
+    _insert_game(temp_db)
+    response = client.post("/v1/games/game-1/events", json={
+        "device_id": "dev-1",
+        "session_id": "session-1",
+        "events": [_event(1), {**_event(2), "event_id": "evt-1"}],
+    })
+
+    assert response.status_code == 400
+    assert "duplicate" in response.json()["detail"].lower()
+
+    conn = sqlite3.connect(temp_db)
+    count = conn.execute("SELECT COUNT(*) FROM received_events").fetchone()[0]
+    conn.close()
+    assert count == 0
+
+
+def test_post_events_unknown_game(client):
+    """Posting events for a game that doesn't exist returns 404."""
+    response = client.post("/v1/games/no-such-game/events", json={
+        "device_id": "dev-1",
+        "session_id": "session-1",
+        "events": [_event(1)],
+    })
+
+    assert response.status_code == 404
+    assert "not found" in response.json()["detail"].lower()
+
+
+def test_post_empty_events_checks_game(client, temp_db):
+    """An empty batch still 404s for an unknown game and acks nothing for a known one."""
+    body = {"device_id": "dev-1", "session_id": "session-1", "events": []}
+    assert client.post("/v1/games/no-such-game/events", json=body).status_code == 404
+
+    _insert_game(temp_db)
+    response = client.post("/v1/games/game-1/events", json=body)
+    assert response.status_code == 200
+    assert response.json()["acked_through"] == 0
+
+
+def test_concurrent_event_ingest_serializes_writes(client, temp_db):
+    """Concurrent ingest batches all commit through the shared writer."""
+    from concurrent.futures import ThreadPoolExecutor
+    from score.cloud import store_events
+    from score.models import PostEventsRequest
+
+    _insert_game(temp_db)
+
+    def ingest(seq):
+        request = PostEventsRequest(device_id="dev-1", session_id="session-1", events=[_event(seq)])
+        return store_events("game-1", request, int(time.time()))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(ingest, range(1, 41)))
+
+    assert all(has_new for _, has_new in results)
+    conn = sqlite3.connect(temp_db)
+    count = conn.execute("SELECT COUNT(*) FROM received_events").fetchone()[0]
+    conn.close()
+    assert count == 40
+
+
+def test_event_group_commit_isolates_failed_batches(client, temp_db):
+    """Batches sharing a commit succeed or fail independently."""
+    from concurrent.futures import Future
+    from score import cloud
+
+    _insert_game(temp_db)
+    now = int(time.time())
+
+    def rows(game_id, seq):
+        return [(game_id, "dev-1", "s1", f"{game_id}-evt-{seq}", seq, "CLOCK_SET", "t", "{}", now)]
+
+    batches = [(rows("game-1", 1), Future()), (rows("no-such-game", 1), Future()), (rows("game-1", 2), Future())]
+    cloud.pending_event_batches.extend(batches)
+
+    assert cloud.commit_event_batches() == 3
+    assert batches[0][1].result() == 1
+    assert isinstance(batches[1][1].exception(), sqlite3.IntegrityError)
+    assert batches[2][1].result() == 1
+
+    conn = sqlite3.connect(temp_db)
+    stored = conn.execute("SELECT game_id, seq FROM received_events ORDER BY seq").fetchall()
+    conn.close()
+    assert stored == [("game-1", 1), ("game-1", 2)]
+
+
+def test_websocket_client_removed_on_disconnect(client):
+    """Closing a game-states WebSocket unregisters it promptly."""
+    from score import cloud
+
+    with client.websocket_connect("/ws/game-states") as ws:
+        ws.send_text("hello")
+        assert len(cloud.websocket_clients) == 1
+
+    for _ in range(50):
+        if not cloud.websocket_clients:
+            break
+        time.sleep(0.01)
+    assert not cloud.websocket_clients
+
+
+def test_websocket_clients_each_receive_one_update_per_burst(schema_client, schema_db, monkeypatch):
+    """Every connected client gets its own update notice after events are posted."""
+    from score import cloud
+
+    # A short keepalive makes the next message after the update a ping,
+    # which would queue behind any second update for the same burst
+    monkeypatch.setattr(cloud, "WS_KEEPALIVE_INTERVAL", 0.5)
+    _insert_game(schema_db)
+
+    # Entering the client keeps every request and socket on one event loop
+    with schema_client, schema_client.websocket_connect("/ws/game-states") as first, \
+            schema_client.websocket_connect("/ws/game-states") as second:
+        first.send_text("hello")
+        second.send_text("hello")
+        for seq in (1, 2):
+            schema_client.post("/v1/games/game-1/events", json={
+                "device_id": "dev-1", "session_id": "s1", "events": [_event(seq)]
+            })
+
+        assert first.receive_text() == "update"
+        assert second.receive_text() == "update"
+        assert first.receive_text() == "ping"
+        assert second.receive_text() == "ping"
+
+
+def test_get_db_reuses_pooled_connections(client, temp_db):
+    """Closing a pooled connection returns it for reuse, discarding uncommitted work."""
+    from score.cloud import get_db
+
+    db = get_db()
+    db.execute("INSERT INTO rinks (rink_id, name, created_at) VALUES ('rink-x', 'Uncommitted', 0)")
+    db.close()
+    db.close()  # closing twice must not return it to the pool twice
+
+    with get_db() as reused:
+        assert reused is db
+        assert reused.execute("SELECT COUNT(*) FROM rinks").fetchone()[0] == 0
+        assert get_db() is not reused
+
+
+def test_lifespan_initializes_schema(tmp_path, monkeypatch):
+    """The cloud schema is created on app startup rather than at import."""
+    from score import cloud
+
+    db_path = str(tmp_path / "fresh.db")
+    monkeypatch.setattr(cloud, "CLOUD_DB_PATH", db_path)
+
+    with TestClient(cloud.app):
+        conn = sqlite3.connect(db_path)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.close()
+
+    assert {"games", "devices", "received_events", "heartbeats"} <= tables
+
+
+def test_lifespan_closes_connections_when_final_flush_fails(tmp_path, monkeypatch):
+    """Shutdown logs a failed heartbeat flush and still closes the database connections."""
+    from score import cloud
+
+    monkeypatch.setattr(cloud, "CLOUD_DB_PATH", str(tmp_path / "fresh.db"))
+    closed = []
+
+    def failing_flush():
+        raise sqlite3.OperationalError("disk I/O error")
+
+    with TestClient(cloud.app):
+        monkeypatch.setattr(cloud, "flush_heartbeats", failing_flush)
+        monkeypatch.setattr(cloud, "close_connections", lambda: closed.append(True))
+
+    assert closed == [True]
+
+
+def test_utc_now_pairs_seconds_with_iso_string():
+    """utc_now returns a consistent (seconds, ISO string) pair for the current second."""
+    from datetime import datetime
+    from score.cloud import utc_now
+
+    before = int(time.time())
+    seconds, iso = utc_now()
+    after = int(time.time())
+
+    assert before <= seconds <= after
+    assert int(datetime.fromisoformat(iso).timestamp()) == seconds
+    assert iso.endswith("+00:00")
+
+
+def test_format_local_time_matches_datetime():
+    """format_local_time renders the same local time as datetime.strftime."""
+    from datetime import datetime
+    from score.cloud import format_local_time
+
+    ts = 1_700_000_123
+    assert format_local_time(ts) == datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+    assert format_local_time(ts, with_seconds=True) == datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def test_format_timestamp_handles_missing_values():
+    """format_timestamp falls back to its placeholder for unset columns."""
+    from score.cloud import format_local_time, format_timestamp
+
+    assert format_timestamp(None) == "-"
+    assert format_timestamp(0, empty="Never") == "Never"
+    assert format_timestamp("1700000000", with_seconds=True) == format_local_time(1_700_000_000, True)
+
+
+def test_admin_events_keyset_pagination(client, temp_db):
+    """Events page newest-first and can be filtered and paged on the server."""
+    _insert_game(temp_db)
+    client.post("/v1/games/game-1/events", json={
+        "device_id": "dev-1", "session_id": "s1", "events": [_event(seq) for seq in range(1, 6)]
+    })
+
+    page = client.get("/admin/events?format=json&limit=2").json()
+    assert [e["seq"] for e in page["events"]] == [5, 4]
+
+    page = client.get(f"/admin/events?format=json&limit=2&before_id={page['next_before_id']}").json()
+    assert [e["seq"] for e in page["events"]] == [3, 2]
+
+    page = client.get(f"/admin/events?format=json&limit=2&before_id={page['next_before_id']}").json()
+    assert [e["seq"] for e in page["events"]] == [1]
+    assert page["next_before_id"] is None
+
+    assert client.get("/admin/events?format=json&device_id=dev-2").json()["event_count"] == 0
+    assert client.get("/admin/events?format=json&type=CLOCK_SET&game_id=game-1").json()["event_count"] == 5
+
+
+@pytest.mark.parametrize("page,script", [
+    ("/admin/events", "admin_events.js"),
+    ("/admin/rosters", "admin_rosters.js"),
+    ("/admin/teams", "admin_teams.js"),
+    ("/admin/games/state", "admin_games.js"),
+])
+def test_admin_table_pages_serve_static_shell(client, temp_db, page, script):
+    """Table pages serve the same shell whatever is in the database; rows come from JSON."""
+    empty = client.get(page)
+    assert empty.status_code == 200
+    assert f'<script src="/static/{script}" defer></script>' in empty.text
+    assert client.get(f"/static/{script}").status_code == 200
+
+    _insert_game(temp_db)
+    client.post("/v1/games/game-1/events", json={
+        "device_id": "dev-1", "session_id": "s1", "events": [_event(1), _event(2)]
+    })
+    assert client.get(page).text == empty.text
+
+
+def test_admin_events_json_returns_raw_event_fields(client, temp_db):
+    """Event fields are returned verbatim in JSON; the page escapes them when rendering."""
+    _insert_game(temp_db)
+    event = dict(_event(1), type="<b>GOAL</b>", payload={"note": "<script>alert(1)</script>"})
+    client.post("/v1/games/game-1/events", json={
+        "device_id": "dev-1", "session_id": "s1", "events": [event]
+    })
+
+    events = client.get("/admin/events?format=json").json()["events"]
+    assert events[0]["type"] == "<b>GOAL</b>"
+    assert "<script>alert(1)</script>" not in client.get("/admin/events").text
+
+
+def test_admin_events_list_payload_preview(client, temp_db):
+    """The events listing carries a payload preview; the full payload has its own endpoint."""
+    from score.cloud import EVENT_PAYLOAD_PREVIEW
+
+    _insert_game(temp_db)
+    event = dict(_event(1), payload={"note": "x" * 200})
+    client.post("/v1/games/game-1/events", json={
+        "device_id": "dev-1", "session_id": "s1", "events": [event]
+    })
+
+    listed = client.get("/admin/events?format=json").json()["events"][0]
+    assert "payload" not in listed
+    assert len(listed["payload_preview"]) == EVENT_PAYLOAD_PREVIEW
+    assert listed["payload_length"] > EVENT_PAYLOAD_PREVIEW
+
+    response = client.get(f"/admin/events/{listed['id']}/payload")
+    assert response.status_code == 200
+    assert response.json() == {"note": "x" * 200}
+    assert response.text.startswith(listed["payload_preview"])
+
+    assert client.get("/admin/events/999999/payload").status_code == 404
+
+
+@pytest.mark.parametrize("handler", [
+    "get_game_roster", "get_device_config", "list_devices", "get_device", "create_device", "update_device",
+    "unassign_device", "delete_device", "list_events_admin",
+    "get_rosters_admin", "get_teams_admin", "get_latest_heartbeats",
+    "list_rule_sets", "list_team_registrations", "get_roster_entries",
+    "list_registrations_admin", "seed_admin_page", "stats_page",
+    "create_rink", "update_rink", "delete_rink",
+    "create_league", "create_season", "create_division", "create_team_v2",
+    "create_team_registration", "add_roster_entry", "execute_seed", "clear_seed_data",
+])
+def test_blocking_db_handlers_run_in_threadpool(handler):
+    """Handlers that block on SQLite are plain functions so FastAPI runs them off the event loop."""
+    import inspect
+    from score import cloud
+
+    assert not inspect.iscoroutinefunction(getattr(cloud, handler))
+
+
+def test_create_handlers_write_through_shared_connection(schema_client):
+    """Creates commit on the write connection and duplicates still map to 409."""
+    league = {"league_id": "l1", "name": "League"}
+    assert schema_client.post("/admin/leagues", json=league).status_code == 200
+    assert schema_client.post("/admin/leagues", json=league).status_code == 409
+    assert schema_client.post("/admin/teams-v2", json={"team_id": "t1", "name": "Hawks"}).status_code == 200
+
+    bad_context = {"registration_id": "r1", "team_id": "t1", "division_id": "d1"}
+    assert schema_client.post("/admin/team-registrations", json=bad_context).status_code == 400
+
+    leagues = schema_client.get("/admin/leagues?format=json").json()["leagues"]
+    assert [l["league_id"] for l in leagues] == ["l1"]
+    assert [t["team_id"] for t in schema_client.get("/admin/teams-v2").json()] == ["t1"]
+
+
+def test_create_handlers_name_missing_parents(schema_client):
+    """Unknown referenced rows are a 422 naming the parent; only real duplicates are 409."""
+    division = {"division_id": "d-child", "name": "Child", "parent_division_id": "d-missing"}
+    response = schema_client.post("/admin/divisions", json=division)
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Parent division d-missing not found"
+
+    schema_client.post("/admin/divisions", json={"division_id": "d1", "name": "Open"})
+    schema_client.post("/admin/teams-v2", json={"team_id": "t1", "name": "Hawks"})
+
+    registration = {"registration_id": "r1", "team_id": "t-missing", "tournament_id": "cup", "division_id": "d1"}
+    response = schema_client.post("/admin/team-registrations", json=registration)
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Team t-missing not found"
+
+    registration["team_id"] = "t1"
+    assert schema_client.post("/admin/team-registrations", json=registration).status_code == 200
+    response = schema_client.post("/admin/team-registrations", json=registration)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Registration r1 already exists"
+
+    entry = {"registration_id": "r-missing", "player_id": 1}
+    response = schema_client.post("/admin/roster-entries", json=entry)
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Registration r-missing not found"
+
+    entry = {"registration_id": "r1", "player_id": 999999}
+    response = schema_client.post("/admin/roster-entries", json=entry)
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Player 999999 not found"
+
+
+def test_fetch_dicts_keys_rows_by_column():
+    """fetch_dicts returns plain dicts without changing the connection's row factory."""
+    from score.cloud import fetch_dicts
+
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(1, "x"), (2, "y")])
+
+    assert fetch_dicts(conn.execute("SELECT a, b AS label FROM t ORDER BY a")) == [
+        {"a": 1, "label": "x"}, {"a": 2, "label": "y"}
+    ]
+    assert isinstance(conn.execute("SELECT a FROM t").fetchone(), sqlite3.Row)
+    conn.close()
+
+
+def test_admin_json_listings_built_by_sqlite(client, temp_db):
+    """Rosters, teams and events JSON keep their shape and row order when SQLite serializes them."""
+    assert client.get("/admin/rosters?format=json").json() == {"rosters": []}
+    assert client.get("/admin/events?format=json").json() == {
+        "event_count": 0, "next_before_id": None, "events": []
+    }
+
+    conn = sqlite3.connect(temp_db)
+    conn.executemany(
+        "INSERT INTO teams (team_id, name, abbreviation, created_at) VALUES (?, ?, ?, ?)",
+        [("t-b", 'Bravo "B"', "BRV", 1), ("t-a", "Alpha", None, 2)]
+    )
+    conn.commit()
+    conn.close()
+
+    assert client.get("/admin/teams?format=json").json() == {"teams": [
+        {"team_id": "t-a", "name": "Alpha", "abbreviation": None, "created_at": 2},
+        {"team_id": "t-b", "name": 'Bravo "B"', "abbreviation": "BRV", "created_at": 1},
+    ]}
+
+
+def test_event_log_queries_use_game_seq_index(schema_db):
+    """Per-game event reads are index range scans on received_events(game_id, seq)."""
+    from score import cloud
+
+    conn = sqlite3.connect(schema_db)
+
+    def plan(sql, params=()):
+        return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+    keys_plan = plan(cloud.EVENT_LOG_KEYS_SQL + " GROUP BY game_id")
+    assert any("COVERING INDEX idx_received_events_game_seq" in step for step in keys_plan)
+    assert not any("TEMP B-TREE" in step for step in keys_plan)
+
+    replay_plan = plan(
+        "SELECT type, payload, received_at FROM received_events WHERE game_id = ? ORDER BY seq ASC",
+        ("game-1",)
+    )
+    assert any("idx_received_events_game_seq (game_id=?)" in step for step in replay_plan)
+    assert not any("TEMP B-TREE" in step for step in replay_plan)
+    conn.close()
+
+
+def test_stats_queries_scan_only_goal_events(schema_db):
+    """Leaderboards read the partial goal-event index and look registrations up by key."""
+    from score import cloud
+
+    conn = sqlite3.connect(schema_db)
+    params = cloud.stats_filter_params(league_id="league-1", limit=20)
+    for sql in (cloud.TOP_SCORERS_SQL, cloud.TOP_ASSISTS_SQL, cloud.TOP_POINTS_SQL):
+        plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+        event_scans = [step for step in plan if step.startswith("SCAN e ")]
+        assert event_scans and all("idx_received_events_goals" in step for step in event_scans)
+        assert any(step.startswith("SEARCH tr ") and "registration_id=?" in step for step in plan)
+    conn.close()
+
+
+def test_players_page_reads_name_index_without_sorting(schema_db):
+    """The players page is an in-order scan of a covering name index."""
+    from score import cloud
+
+    conn = sqlite3.connect(schema_db)
+    plan = [row[3] for row in conn.execute(
+        "EXPLAIN QUERY PLAN " + cloud.PLAYERS_PAGE_SQL, {"limit": 200, "offset": 0}
+    )]
+    conn.close()
+    assert any("COVERING INDEX idx_players_name" in step for step in plan)
+    assert not any("TEMP B-TREE" in step for step in plan)
+
+
+def test_admin_nav_rendered_once_per_page():
+    """admin_nav hands out the prebuilt nav for known pages and the static shells embed it."""
+    from score import cloud
+
+    assert cloud.admin_nav("events") is cloud.admin_nav("events")
+    assert isinstance(cloud.admin_nav("events"), Markup)
+    assert 'href="/admin/events" class="active"' in cloud.admin_nav("events")
+    assert cloud.admin_nav("events").encode() in cloud.EVENTS_HTML
+    assert cloud.admin_nav("devices").encode() in cloud.DEVICES_HTML_HEAD
+
+
+def test_minify_html_keeps_verbatim_elements():
+    """Shell minification drops indentation but leaves scripts and preformatted text alone."""
+    from score.cloud import minify_html
+
+    html = """
+        <div>
+            <span>a</span> <span>b</span>
+        </div>
+        <script>
+            if (a) {
+                b();
+            }
+        </script>
+        <pre>  x
+    y</pre>
+    """
+    assert minify_html(html) == (
+        "<div>\n<span>a</span> <span>b</span>\n</div>\n"
+        "<script>\n            if (a) {\n                b();\n            }\n        </script>\n"
+        "<pre>  x\n    y</pre>"
+    )
+
+
+@pytest.mark.parametrize("page,title,empty", [
+    ("/admin/players", "Players", "No players found."),
+    ("/admin/leagues", "Leagues", "No leagues found."),
+    ("/admin/seasons", "Seasons", "No seasons found."),
+    ("/admin/divisions", "Divisions", "No divisions found."),
+])
+def test_admin_list_pages_render_from_templates(client, page, title, empty):
+    """Templated admin list pages render their shell, nav and empty state."""
+    response = client.get(page)
+    assert response.status_code == 200
+    assert f"<title>score-cloud | {title}</title>" in response.text
+    assert '<div class="nav">' in response.text
+    assert empty in response.text
+
+
+def test_admin_list_pages_escape_fields(client, temp_db):
+    """Templated admin pages HTML-escape stored text."""
+    from score.cloud import format_local_time
+
+    conn = sqlite3.connect(temp_db)
+    conn.execute(
+        "INSERT INTO leagues (league_id, name, league_type, created_at) VALUES (?, ?, ?, ?)",
+        ("lg-1", "<b>League</b>", None, 1_700_000_000)
+    )
+    conn.commit()
+    conn.close()
+
+    html = client.get("/admin/leagues").text
+    assert "<b>League</b>" not in html
+    assert "&lt;b&gt;League&lt;/b&gt;" in html
+    assert format_local_time(1_700_000_000) in html
+
+
+def test_stream_template_chunks_match_render(monkeypatch):
+    """stream_template yields the rendered page in several bounded chunks."""
+    from markupsafe import Markup
+    from score import cloud
+
+    monkeypatch.setattr(cloud, "STREAM_CHUNK_SIZE", 1024)
+    players = [
+        {"player_id": i, "first_name": f"First{i}", "last_name": f"Last{i}", "created_at": None}
+        for i in range(200)
+    ]
+    context = {"nav": Markup(cloud.admin_nav("players")), "players": players}
+
+    chunks = list(cloud.stream_template(cloud.PLAYERS_TEMPLATE, **context))
+    assert len(chunks) > 1
+    assert "".join(chunks) == cloud.PLAYERS_TEMPLATE.render(**context)
+
+
+def test_seed_template_renders_counts_and_nav():
+    """The seed page shows every table's count, keeps its title, and escapes anything but the nav markup."""
+    from score import cloud
+
+    counts = {label: 100 + i for i, (label, _) in enumerate(cloud.SEED_COUNT_TABLES)}
+    nav = cloud.admin_nav("seed")
+    html = cloud.SEED_TEMPLATE.render(nav=nav, counts=counts)
+
+    assert "<title>score-cloud | Seed Database</title>" in html
+    assert "<h1>Database Seeding</h1>" in html
+    assert str(nav) in html
+    for count in counts.values():
+        assert f'<span class="count">({count} existing)</span>' in html
+
+    unsafe = cloud.SEED_TEMPLATE.render(nav="<nav>plain</nav>", counts={**counts, "games": "<b>9</b>"})
+    assert "&lt;nav&gt;plain&lt;/nav&gt;" in unsafe
+    assert "(&lt;b&gt;9&lt;/b&gt; existing)" in unsafe
+
+
+def test_registration_and_roster_entry_listings(client, temp_db):
+    """Team registrations and roster entries come back as plain JSON objects."""
+    conn = sqlite3.connect(temp_db)
+    conn.execute("""
+        INSERT INTO team_registrations (registration_id, team_id, league_id, division_id, registered_at)
+        VALUES ('reg-1', 'team-1', 'league-1', 'div-1', 1000)
+    """)
+    conn.execute("""
+        INSERT INTO players (player_id, full_name, first_name, last_name, created_at)
+        VALUES (7, 'Ann Lee', 'Ann', 'Lee', 1000)
+    """)
+    conn.execute("""
+        INSERT INTO roster_entries (registration_id, player_id, jersey_number, added_at)
+        VALUES ('reg-1', 7, 12, 1000)
+    """)
+    conn.commit()
+    conn.close()
+
+    registrations = client.get("/admin/team-registrations?league_id=league-1").json()
+    assert [r["registration_id"] for r in registrations] == ["reg-1"]
+    assert client.get("/admin/team-registrations?league_id=other").json() == []
+
+    entries = client.get("/admin/roster-entries/reg-1").json()
+    assert len(entries) == 1
+    assert entries[0]["full_name"] == "Ann Lee"
+    assert entries[0]["jersey_number"] == 12
+
+
+def test_players_admin_pages_and_searches(schema_client, schema_db):
+    """Players are paged with next_offset, and q searches names and birthplaces by prefix."""
+
+    conn = sqlite3.connect(schema_db)
+    conn.executemany("""
+        INSERT INTO players (player_id, first_name, last_name, full_name, birth_city, created_at)
+        VALUES (?, ?, ?, ?, ?, 1000)
+    """, [
+        (1, "Ann", "Lee", "Ann Lee", "Oslo"),
+        (2, "Bo", "Diaz", "Bo Diaz", "Quebec City"),
+        (3, "Cy", "Ng", "Cy Ng", "Oslo"),
+    ])
+    conn.execute("UPDATE players SET birth_city = 'Bergen' WHERE player_id = 3")
+    conn.commit()
+    conn.close()
+
+    first = schema_client.get("/admin/players?format=json&limit=2").json()
+    assert [p["last_name"] for p in first["players"]] == ["Diaz", "Lee"]
+    assert first["next_offset"] == 2
+    last = schema_client.get("/admin/players?format=json&limit=2&offset=2").json()
+    assert [p["last_name"] for p in last["players"]] == ["Ng"]
+    assert last["next_offset"] is None
+
+    def search(q):
+        return [p["player_id"] for p in schema_client.get("/admin/players", params={"format": "json", "q": q}).json()["players"]]
+
+    assert search("osl") == [1]
+    assert search("berg") == [3]
+    assert search("quebec ci") == [2]
+    assert search('"ann') == [1]  # stray quotes are not FTS syntax errors
+
+    page = schema_client.get("/admin/players?limit=2")
+    assert "Next &rarr;" in page.text
+    assert "offset=2" in page.text
+
+
+def test_roster_entry_batch_is_all_or_nothing(client, temp_db):
+    """A roster batch is added in one transaction; one bad entry rejects the whole batch."""
+    conn = sqlite3.connect(temp_db)
+    conn.execute("""
+        INSERT INTO team_registrations (registration_id, team_id, league_id, division_id, registered_at)
+        VALUES ('reg-1', 'team-1', 'league-1', 'div-1', 1000)
+    """)
+    conn.executemany("""
+        INSERT INTO players (player_id, full_name, first_name, last_name, created_at)
+        VALUES (?, ?, ?, ?, 1000)
+    """, [(1, "Ann Lee", "Ann", "Lee"), (2, "Bo Diaz", "Bo", "Diaz")])
+    conn.commit()
+    conn.close()
+
+    response = client.post("/admin/roster-entries:batch", json={"entries": [
+        {"registration_id": "reg-1", "player_id": 1, "jersey_number": 9, "is_captain": True},
+        {"registration_id": "reg-1", "player_id": 2, "jersey_number": 4},
+    ]})
+    assert response.status_code == 200
+
+    rejected = client.post("/admin/roster-entries:batch", json={"entries": [
+        {"registration_id": "reg-1", "player_id": 1, "jersey_number": 10},
+        {"registration_id": "reg-1", "player_id": 999},
+    ]})
+    assert rejected.status_code == 409
+    assert rejected.json()["detail"] == (
+        "Roster entry 1 (player 999, registration reg-1) references an unknown registration or player"
+    )
+
+    entries = client.get("/admin/roster-entries/reg-1").json()
+    assert [(e["player_id"], e["jersey_number"], e["is_captain"]) for e in entries] == [(2, 4, 0), (1, 9, 1)]
+
+
+@pytest.mark.parametrize("url,expected", [
+    ("/admin/leagues?format=json", {"leagues": []}),
+    ("/admin/seasons?format=json", {"seasons": []}),
+    ("/admin/divisions?format=json", {"divisions": []}),
+    ("/admin/players?format=json", {"players": [], "next_offset": None}),
+    ("/admin/team-registrations", []),
+])
+def test_admin_json_listings_when_empty(client, url, expected):
+    """Admin JSON listings are serialized directly and keep their shape when empty."""
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == expected
+
+
+def test_rule_set_infractions_listing(schema_client):
+    """Seeded infractions list with their descriptions and flags."""
+    response = schema_client.get("/admin/rule-sets/nhl/infractions")
+    assert response.status_code == 200
+    infractions = response.json()
+    assert infractions
+    assert all(i["rule_set_id"] == "nhl" for i in infractions)
+    assert all(isinstance(i["allows_minor"], bool) for i in infractions)
+    assert "description" in infractions[0]
+
+
+def test_rule_set_and_team_v2_listings(schema_client, schema_db):
+    """Rule sets and v2 teams come back in their model shape."""
+
+    conn = sqlite3.connect(schema_db)
+    conn.execute("INSERT INTO teams (team_id, name, abbreviation, created_at) VALUES ('t1', 'Hawks', 'HWK', 1000)")
+    conn.commit()
+    conn.close()
+
+    rule_sets = schema_client.get("/admin/rule-sets").json()
+    assert "nhl" in [r["rule_set_id"] for r in rule_sets]
+    assert all(isinstance(r["body_checking"], bool) for r in rule_sets)
+    assert "created_at" not in rule_sets[0]
+
+    nhl = schema_client.get("/admin/rule-sets/nhl").json()
+    assert nhl == next(r for r in rule_sets if r["rule_set_id"] == "nhl")
+    assert schema_client.get("/admin/rule-sets/missing").status_code == 404
+
+    assert schema_client.get("/admin/teams-v2").json() == [{
+        "team_id": "t1", "name": "Hawks", "city": None, "abbreviation": "HWK",
+        "team_type": None, "logo_url": None, "primary_color": None, "secondary_color": None,
+    }]
+
 
+def test_admin_row_templates_fill_missing_values(schema_client, schema_db):
+    """Rows rendered from compiled templates show "-" rather than None for empty columns."""
+
+    conn = sqlite3.connect(schema_db)
+    conn.execute("""
+        INSERT INTO officials (official_id, first_name, last_name, full_name, created_at)
+        VALUES ('o1', 'Kim', 'Ray', 'Kim Ray', 1000)
+    """)
+    conn.execute("""
+        INSERT INTO tournaments (tournament_id, name, start_date, end_date, created_at)
+        VALUES ('cup', 'Spring Cup', '2025-04-01', '2025-04-03', 1000)
+    """)
+    conn.commit()
+    conn.close()
+
+    officials = schema_client.get("/admin/officials-admin").text
+    assert ('<tr><td class="device-id">o1</td><td>Kim Ray</td><td>Kim</td>'
+            '<td>Ray</td><td>-</td></tr>') in officials
+
+    tournaments = schema_client.get("/admin/tournaments-admin").text
+    assert ('<td>Spring Cup</td><td>-</td><td>-</td>'
+            '<td>2025-04-01</td><td>2025-04-03</td></tr>') in tournaments
+
+    rule_sets = schema_client.get("/admin/rule-sets-admin").text
+    assert ('<tr><td class="device-id">nhl</td><td>NHL Rules</td><td>3 x 20min</td>'
+            '<td>5min sudden_death</td><td>hybrid</td><td>Yes</td><td>2/0/0/1</td>'
+            '<td>Standard NHL rules</td></tr>') in rule_sets
+    assert "None" not in officials + tournaments + rule_sets
+
+
+def test_admin_row_templates_escape_values(schema_client, schema_db):
+    """Names are HTML-escaped in rows rendered with str.format_map."""
+    from score.cloud import render_points_row
+
+    script = "<script>alert(1)</script>"
+    escaped = "&lt;script&gt;alert(1)&lt;/script&gt;"
+    conn = sqlite3.connect(schema_db)
+    conn.execute(
+        "INSERT INTO officials (official_id, first_name, last_name, full_name, created_at) "
+        "VALUES ('o1', 'Kim', 'Ray', ?, 1000)", (script,)
+    )
+    conn.execute(
+        "INSERT INTO tournaments (tournament_id, name, start_date, end_date, created_at) "
+        "VALUES ('cup', ?, '2025-04-01', '2025-04-03', 1000)", (script,)
+    )
+    conn.execute("INSERT INTO teams (team_id, name, created_at) VALUES ('t1', ?, 1000)", (script,))
+    conn.execute("INSERT INTO divisions (division_id, name, created_at) VALUES ('d1', 'Open', 1000)")
+    conn.execute("""
+        INSERT INTO team_registrations (registration_id, team_id, tournament_id, division_id, registered_at)
+        VALUES ('r1', 't1', 'cup', 'd1', 1000)
+    """)
+    conn.execute("UPDATE rule_sets SET description = ? WHERE rule_set_id = 'nhl'", (script,))
+    conn.commit()
+    conn.close()
+
+    for page in ("/admin/officials-admin", "/admin/tournaments-admin",
+                 "/admin/registrations-admin", "/admin/rule-sets-admin"):
+        html = schema_client.get(page).text
+        assert script not in html
+        assert escaped in html
+
+    row = render_points_row({
+        "league_name": None, "season_name": None, "division_name": None, "team_abbrev": "T&T",
+        "full_name": script, "jersey_number": 9, "goals": 1, "assists": 2, "points": 3,
+    })
+    assert f"<td>T&amp;T</td><td>{escaped}</td><td>9</td>" in row
+
+
+@pytest.mark.parametrize("page", [
+    "/admin/rule-sets-admin", "/admin/officials-admin",
+    "/admin/tournaments-admin", "/admin/registrations-admin?format=json",
+])
+def test_reference_lists_revalidate_with_etag(schema_client, schema_db, page):
+    """Rule set, official, tournament and registration lists answer repeat loads with 304."""
+    first = schema_client.get(page)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert schema_client.get(page, headers={"If-None-Match": etag}).status_code == 304
+
+    conn = sqlite3.connect(schema_db)
+    conn.execute("DELETE FROM rule_sets WHERE rule_set_id = 'nhl'")
+    conn.execute("""
+        INSERT INTO officials (official_id, first_name, last_name, full_name, created_at)
+        VALUES ('o1', 'Kim', 'Ray', 'Kim Ray', 1000)
+    """)
+    conn.execute("""
+        INSERT INTO tournaments (tournament_id, name, start_date, end_date, created_at)
+        VALUES ('cup', 'Spring Cup', '2025-04-01', '2025-04-03', 1000)
+    """)
+    conn.execute("INSERT INTO teams (team_id, name, created_at) VALUES ('t1', 'Hawks', 1000)")
+    conn.execute("""
+        INSERT INTO team_registrations (registration_id, team_id, tournament_id, division_id, registered_at)
+        VALUES ('r1', 't1', 'cup', 'open', 1000)
+    """)
+    conn.commit()
+    conn.close()
+    assert schema_client.get(page, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_seed_page_counts_every_table_in_one_query(client, temp_db):
+    """The seed page's existing-row counts come from a single UNION ALL statement."""
+    from score.cloud import SEED_COUNT_TABLES, SEED_COUNTS_SQL
+
+    conn = sqlite3.connect(temp_db)
+    conn.execute("INSERT INTO leagues (league_id, name, created_at) VALUES ('l1', 'League', 1000)")
+    conn.execute("INSERT INTO leagues (league_id, name, created_at) VALUES ('l2', 'Other', 1000)")
+    conn.commit()
+    counts = dict(conn.execute(SEED_COUNTS_SQL).fetchall())
+    conn.close()
+
+    assert list(counts) == [label for label, _ in SEED_COUNT_TABLES]
+    assert counts["leagues"] == 2
+    html = client.get("/admin/seed").text
+    assert '<span class="count">(2 existing)</span>' in html
+
+
+def test_seed_runs_in_one_transaction(schema_client, schema_db, monkeypatch):
+    """A seed run commits once: a failing seeder leaves none of the earlier categories behind."""
+    from score import cloud, seed
+
+    def fail_games(conn, game_count=8):
+        raise RuntimeError("boom")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(seed, "seed_games", fail_games)
+        with pytest.raises(RuntimeError):
+            schema_client.post("/admin/seed", json={"seed_all": True, "player_count": 20, "game_count": 2})
+
+    def table_counts():
+        conn = sqlite3.connect(schema_db)
+        counts = dict(conn.execute(cloud.SEED_COUNTS_SQL).fetchall())
+        conn.close()
+        return counts
+
+    assert set(table_counts().values()) == {0}
+
+    seeded = schema_client.post("/admin/seed", json={"seed_all": True, "player_count": 20, "game_count": 2})
+    assert seeded.status_code == 200
+    assert table_counts()["leagues"] == seeded.json()["seeded"]["leagues"] > 0
+
+    assert schema_client.post("/admin/seed/clear", json={"confirm": True}).status_code == 200
+    assert set(table_counts().values()) == {0}
+
+
+def test_officials_page_renders_every_row_in_order(schema_client, schema_db):
+    """Large listings are assembled in one pass with every row present, in query order."""
+
+    conn = sqlite3.connect(schema_db)
+    conn.executemany(
+        """INSERT INTO officials (official_id, first_name, last_name, full_name, created_at)
+           VALUES (?, 'Ref', ?, ?, 1000)""",
+        [(f"o{i}", f"Name{i:04d}", f"Ref Name{i:04d}") for i in range(2000)],
+    )
+    conn.commit()
+    conn.close()
+
+    html = schema_client.get("/admin/officials-admin").text
+    ids = re.findall(r'<td class="device-id">(o\d+)</td>', html)
+    assert ids == [f"o{i}" for i in range(2000)]
+    assert "No officials found." not in html
+
+
+@pytest.mark.parametrize("page", [
+    "/admin/leagues", "/admin/leagues?format=json", "/admin/players", "/admin/seed",
+])
+def test_admin_lists_revalidate_with_etag(client, temp_db, page):
+    """Unchanged admin lists answer If-None-Match with 304; any data change yields a new ETag."""
+    first = client.get(page)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    cached = client.get(page, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    conn = sqlite3.connect(temp_db)
+    conn.execute("INSERT INTO leagues (league_id, name, created_at) VALUES ('l1', 'League', 1000)")
+    conn.execute("""
+        INSERT INTO players (player_id, full_name, first_name, last_name, created_at)
+        VALUES (1, 'Ann Lee', 'Ann', 'Lee', 1000)
+    """)
+    conn.commit()
+    conn.close()
 
+    changed = client.get(page, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
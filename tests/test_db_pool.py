@@ -0,0 +1,84 @@
+"""Tests for the score-cloud SQLite connection pool."""
+import sqlite3
+
+import pytest
+
+from score import db_pool
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "pool.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    yield path
+    db_pool.close_connections()
+
+
+def test_read_connections_are_read_only(db_path):
+    """Read-pool connections cannot write."""
+    with db_pool.get_read_db(db_path) as db:
+        with pytest.raises(sqlite3.OperationalError):
+            db.execute("INSERT INTO items (name) VALUES ('x')")
+
+
+def test_write_db_rolls_back_on_error(db_path):
+    """A failing write block leaves no partial changes behind."""
+    with pytest.raises(RuntimeError):
+        with db_pool.get_write_db(db_path) as db:
+            db.execute("INSERT INTO items (name) VALUES ('x')")
+            raise RuntimeError("boom")
+
+    with db_pool.get_write_db(db_path) as db:
+        db.execute("INSERT INTO items (name) VALUES ('y')")
+
+    with db_pool.get_read_db(db_path) as db:
+        names = [row["name"] for row in db.execute("SELECT name FROM items")]
+    assert names == ["y"]
+
+
+def test_write_db_recovers_from_failed_commit(db_path):
+    """A COMMIT that fails is rolled back, so the shared writer can start new transactions."""
+    with db_pool.get_write_db(db_path) as db:
+        db.execute("CREATE TABLE tags (item_id INTEGER REFERENCES items(id))")
+
+    # A deferred foreign key violation is only reported by COMMIT
+    with pytest.raises(sqlite3.IntegrityError):
+        with db_pool.get_write_db(db_path) as db:
+            db.execute("PRAGMA defer_foreign_keys = ON")
+            db.execute("INSERT INTO tags (item_id) VALUES (42)")
+
+    with db_pool.get_write_db(db_path) as db:
+        db.execute("INSERT INTO items (name) VALUES ('y')")
+
+    with db_pool.get_read_db(db_path) as db:
+        assert db.execute("SELECT COUNT(*) FROM tags").fetchone()[0] == 0
+        assert [row["name"] for row in db.execute("SELECT name FROM items")] == ["y"]
+
+
+def test_path_change_waits_for_open_write_block(db_path, tmp_path):
+    """A reader switching databases doesn't close the writer under an open write block."""
+    other_path = str(tmp_path / "other.db")
+    sqlite3.connect(other_path).close()
+
+    with db_pool.get_write_db(db_path) as db:
+        with db_pool.get_read_db(other_path):
+            pass
+        db.execute("INSERT INTO items (name) VALUES ('x')")
+
+    with db_pool.get_read_db(db_path) as db:
+        assert [row["name"] for row in db.execute("SELECT name FROM items")] == ["x"]
+
+
+def test_pools_reset_when_path_changes(db_path, tmp_path):
+    """Switching to another database file discards connections to the old one."""
+    db = db_pool.get_db(db_path)
+    db.close()
+
+    other_path = str(tmp_path / "other.db")
+    other = db_pool.get_db(other_path)
+    assert other is not db
+    assert other.execute("PRAGMA database_list").fetchone()["file"] == other_path
+    other.close()
@@ -118,6 +118,7 @@ def cloud_client(temp_cloud_db, monkeypatch):
     """Create test client for cloud API."""
     from score import cloud
     monkeypatch.setattr(cloud, "CLOUD_DB_PATH", temp_cloud_db)
+    monkeypatch.setattr(cloud, "SCHEDULE_CACHE", {})
 
     from score.cloud import app
     return TestClient(app)
@@ -300,3 +301,156 @@ def test_schedule_date_boundary_handling(cloud_client, temp_cloud_db):
     assert "midnight-end" in game_ids
     # next-day-start is included because we query both dates for timezone handling
     assert "next-day-start" in game_ids
+
+
+def test_schedule_cached_until_version_changes(cloud_client, temp_cloud_db):
+    """Test that a versioned schedule is served from cache until the version bumps."""
+    from score import cloud
+    cloud.SCHEDULE_CACHE.clear()
+
+    date = "2024-02-01"
+    conn = sqlite3.connect(temp_cloud_db)
+    conn.execute(
+        "INSERT INTO schedule_versions (rink_id, version, updated_at) VALUES ('test-rink', 'v1', ?)",
+        (int(time.time()),)
+    )
+    conn.commit()
+    conn.close()
+
+    add_game(temp_cloud_db, "game-1", "2024-02-01T19:00:00Z")
+    response = cloud_client.get(f"/v1/rinks/test-rink/schedule?date={date}")
+    assert response.json()["schedule_version"] == "v1"
+    assert [g["game_id"] for g in response.json()["games"]] == ["game-1"]
+
+    # New game without a version bump: cached schedule is returned
+    add_game(temp_cloud_db, "game-2", "2024-02-01T21:00:00Z")
+    response = cloud_client.get(f"/v1/rinks/test-rink/schedule?date={date}")
+    assert [g["game_id"] for g in response.json()["games"]] == ["game-1"]
+
+    # Version bump invalidates the cached entry
+    conn = sqlite3.connect(temp_cloud_db)
+    conn.execute("UPDATE schedule_versions SET version = 'v2' WHERE rink_id = 'test-rink'")
+    conn.commit()
+    conn.close()
+
+    response = cloud_client.get(f"/v1/rinks/test-rink/schedule?date={date}")
+    assert response.json()["schedule_version"] == "v2"
+    assert [g["game_id"] for g in response.json()["games"]] == ["game-1", "game-2"]
+
+
+def test_schedule_cache_eviction_is_thread_safe(cloud_client, temp_cloud_db, monkeypatch):
+    """Test that concurrent schedule requests evict from a full cache without errors."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from score import cloud
+    monkeypatch.setattr(cloud, "SCHEDULE_CACHE", {})
+    monkeypatch.setattr(cloud, "SCHEDULE_CACHE_SIZE", 2)
+
+    conn = sqlite3.connect(temp_cloud_db)
+    conn.execute(
+        "INSERT INTO schedule_versions (rink_id, version, updated_at) VALUES ('test-rink', 'v1', ?)",
+        (int(time.time()),)
+    )
+    conn.commit()
+    conn.close()
+
+    dates = [f"2024-02-{day:02d}" for day in range(1, 29)] * 4
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(
+            lambda date: cloud.get_schedule("test-rink", date).status_code, dates
+        ))
+
+    assert statuses == [200] * len(dates)
+    assert len(cloud.SCHEDULE_CACHE) <= 2
+
+
+def test_bump_schedule_versions_invalidates_cache(cloud_client, temp_cloud_db):
+    """Test that bumping schedule versions versions scheduled rinks and drops cached schedules."""
+    from score import cloud
+    cloud.SCHEDULE_CACHE.clear()
+
+    date = "2024-02-01"
+    conn = sqlite3.connect(temp_cloud_db)
+    conn.execute(
+        "INSERT INTO schedule_versions (rink_id, version, updated_at) VALUES ('test-rink', 'v1', ?)",
+        (int(time.time()),)
+    )
+    conn.commit()
+    conn.close()
+
+    add_game(temp_cloud_db, "game-1", "2024-02-01T19:00:00Z")
+    cloud_client.get(f"/v1/rinks/test-rink/schedule?date={date}")
+    assert ("test-rink", date) in cloud.SCHEDULE_CACHE
+
+    add_game(temp_cloud_db, "game-2", "2024-02-01T21:00:00Z")
+    conn = sqlite3.connect(temp_cloud_db)
+    cloud.bump_schedule_versions(conn)
+    conn.commit()
+    conn.close()
+    assert not cloud.SCHEDULE_CACHE
+
+    response = cloud_client.get(f"/v1/rinks/test-rink/schedule?date={date}")
+    assert response.json()["schedule_version"] != "v1"
+    assert [g["game_id"] for g in response.json()["games"]] == ["game-1", "game-2"]
+
+
+def test_bump_schedule_versions_skips_rinks_without_games(cloud_client, temp_cloud_db):
+    """Test that a rink with no games and no version row gets no version row from a bump."""
+    from score import cloud
+
+    conn = sqlite3.connect(temp_cloud_db)
+    cloud.bump_schedule_versions(conn)
+    conn.commit()
+    assert conn.execute("SELECT COUNT(*) FROM schedule_versions").fetchone()[0] == 0
+
+    add_game(temp_cloud_db, "game-1", "2024-02-01T19:00:00Z")
+    cloud.bump_schedule_versions(conn)
+    conn.commit()
+    assert conn.execute("SELECT rink_id FROM schedule_versions").fetchall() == [("test-rink",)]
+    conn.close()
+
+
+def test_schedule_rejects_malformed_date(cloud_client):
+    """Test that a malformed date is rejected before querying."""
+    response = cloud_client.get("/v1/rinks/test-rink/schedule?date=02-01-2024")
+
+    assert response.status_code == 422
+
+
+def test_schedule_rejects_impossible_date(cloud_client):
+    """Test that a well-formed but impossible date is a 422, not a server error."""
+    response = cloud_client.get("/v1/rinks/test-rink/schedule?date=2025-02-30")
+
+    assert response.status_code == 422
+
+
+def test_schedule_query_uses_rink_start_index(tmp_path):
+    """Test that the schedule query is an index range scan on games(rink_id, start_time)."""
+    from score import cloud
+    from score.schema import init_schema
+
+    db_path = str(tmp_path / "cloud.db")
+    init_schema(db_path)
+
+    conn = sqlite3.connect(db_path)
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN " + cloud.SCHEDULE_GAMES_SQL,
+        ("test-rink", "2024-02-01", "2024-02-03")
+    ).fetchall()
+    conn.close()
+
+    games_step = next(row[3] for row in plan if row[3].startswith("SEARCH g "))
+    assert "idx_games_rink_start (rink_id=? AND start_time>? AND start_time<?)" in games_step
+    assert not any("DISTINCT" in row[3] for row in plan)
+
+
+def test_schedule_response_matches_model(cloud_client, temp_cloud_db):
+    """Test that the hand-serialized schedule has exactly the ScheduleResponse shape."""
+    from score.models import Game, ScheduleResponse
+
+    add_game(temp_cloud_db, "game-1", "2024-02-01T19:00:00Z")
+    response = cloud_client.get("/v1/rinks/test-rink/schedule?date=2024-02-01")
+
+    data = response.json()
+    ScheduleResponse.model_validate(data)
+    assert set(data["games"][0]) == set(Game.model_fields)